@@ -0,0 +1,22 @@
+import os
+import tempfile
+
+from tests.django_settings import *  # noqa: F401,F403
+
+# Benchmarks query the database from multiple threads, in-memory SQLite database would be empty in all but one of them.
+# Other databases (e.g. PostgreSQL) can be configured using the BENCHMARK_DB_* environment variables.
+DATABASES = {
+    "default": {
+        "ENGINE": os.environ.get("BENCHMARK_DB_ENGINE", "django.db.backends.sqlite3"),
+        "NAME": os.environ.get(
+            "BENCHMARK_DB_NAME", os.path.join(tempfile.gettempdir(), "dataloaders_benchmark.sqlite3")
+        ),
+        "USER": os.environ.get("BENCHMARK_DB_USER", ""),
+        "PASSWORD": os.environ.get("BENCHMARK_DB_PASSWORD", ""),
+        "HOST": os.environ.get("BENCHMARK_DB_HOST", ""),
+        "PORT": os.environ.get("BENCHMARK_DB_PORT", ""),
+    }
+}
+
+ROOT_URLCONF = "benchmarks.urls"
+ALLOWED_HOSTS = ["localhost"]
@@ -0,0 +1,53 @@
+"""
+Compare throughput of the dataloader execution backends under concurrent GraphQL requests.
+
+Usage:
+    python -m benchmarks.execution_backends --fruits 200 --concurrency 20 --requests 200
+"""
+import argparse
+import asyncio
+
+from benchmarks import utils
+
+QUERY = "{ fruits { name color { name } plant { name } eaters { name } varieties { name } } }"
+
+
+async def benchmark_backend(backend: str, concurrency: int, requests: int) -> dict:
+    from django.test import override_settings
+
+    from strawberry_django_dataloaders.views import DataloaderContext
+    from tests.graphql.schemas import auto_dataloader_fields_schema
+
+    async def request():
+        result = await auto_dataloader_fields_schema.execute(
+            QUERY,
+            context_value=DataloaderContext(request=None, response=None),
+        )
+        assert not result.errors, result.errors
+
+    with override_settings(STRAWBERRY_DJANGO_DATALOADERS={"EXECUTION_BACKEND": backend}):
+        result = await utils.run_concurrently(backend, request, concurrency=concurrency, requests=requests)
+    return result.as_dict()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fruits", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    utils.setup_django()
+    utils.seed(fruits=args.fruits)
+
+    from strawberry_django_dataloaders.core.backends import ExecutionBackend
+
+    results = [
+        {"fruits": args.fruits, **asyncio.run(benchmark_backend(backend.value, args.concurrency, args.requests))}
+        for backend in ExecutionBackend
+    ]
+    utils.dump_results(results)
+
+
+if __name__ == "__main__":
+    main()
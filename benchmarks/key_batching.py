@@ -0,0 +1,65 @@
+"""
+Compare strategies of querying large batches of keys: chunked `IN (...)` queries, a single `IN (...)` query
+and a single array parameter (`= ANY(%s)`, PostgreSQL only).
+
+Usage:
+    python -m benchmarks.key_batching --keys 100 10000 100000
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks import utils
+
+STRATEGIES = {
+    "chunked": {},
+    "single_in": {"max_keys_per_query": 10**9},
+    "array": {"array_parameter": True},
+}
+
+
+async def benchmark_strategy(strategy: str, keys: list[int], repeat: int) -> dict:
+    from tests.graphql.dataloaders import FruitPlantPKDataLoader
+
+    result = {"strategy": strategy, "keys": len(keys)}
+    if strategy == "array" and FruitPlantPKDataLoader.get_connection().vendor != "postgresql":
+        return {**result, "error": "array parameter is supported on PostgreSQL only"}
+
+    loader_cls = type(f"{strategy}FruitPlantPKDataLoader", (FruitPlantPKDataLoader,), STRATEGIES[strategy])
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            instances = await loader_cls.load_fn(keys)
+        except Exception as e:  # e.g. too many SQL variables
+            return {**result, "error": str(e)}
+        timings.append(time.perf_counter() - start)
+        assert len(instances) == len(keys)
+    return {**result, "time_min": min(timings), "time_avg": sum(timings) / len(timings)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    utils.setup_django()
+    from tests import models
+
+    models.FruitPlant.objects.bulk_create(
+        [models.FruitPlant(name=f"plant {i}") for i in range(max(args.keys))],
+        batch_size=10_000,
+    )
+    pks = list(models.FruitPlant.objects.order_by("?").values_list("pk", flat=True))
+
+    results = [
+        asyncio.run(benchmark_strategy(strategy, pks[:keys_count], args.repeat))
+        for keys_count in args.keys
+        for strategy in STRATEGIES
+    ]
+    utils.dump_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compare latency of loading a single large batch of keys by the serial queries (the default) and by parallel shards
+on the thread pool (`parallel_threshold`), and report the crossover - the smallest number of keys from which
+the parallel loading is faster, per number of shards. Run against PostgreSQL (see `benchmarks.django_settings`)
+to get representative numbers, SQLite serializes the queries anyway.
+
+Usage:
+    python -m benchmarks.parallel_loading --keys 1000 10000 50000 --shards 2 4 8
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks import utils
+
+
+async def benchmark_mode(mode: str, shards: int, keys: list[int], repeat: int) -> dict:
+    from tests.graphql.dataloaders import FruitPlantPKDataLoader
+
+    attrs = {"parallel_threshold": 1, "parallel_shards": shards} if mode == "parallel" else {"parallel_threshold": None}
+    loader_cls = type(f"{mode}{shards}FruitPlantPKDataLoader", (FruitPlantPKDataLoader,), attrs)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        instances = await loader_cls.load_fn(keys)
+        timings.append(time.perf_counter() - start)
+        assert len(instances) == len(keys)
+    return {
+        "mode": mode,
+        "shards": shards,
+        "keys": len(keys),
+        "time_min": min(timings),
+        "time_avg": sum(timings) / len(timings),
+    }
+
+
+def get_crossovers(results: list[dict]) -> list[dict]:
+    """Return the smallest number of keys from which the parallel loading is faster than serial, per shards."""
+    serial = {result["keys"]: result["time_min"] for result in results if result["mode"] == "serial"}
+    crossovers = []
+    for shards in sorted({result["shards"] for result in results if result["mode"] == "parallel"}):
+        faster = [
+            result["keys"]
+            for result in results
+            if result["mode"] == "parallel"
+            and result["shards"] == shards
+            and result["time_min"] < serial[result["keys"]]
+        ]
+        crossovers.append({"shards": shards, "crossover_keys": min(faster) if faster else None})
+    return crossovers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[100, 1000, 10_000, 50_000])
+    parser.add_argument("--shards", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    utils.setup_django()
+    from tests import models
+
+    models.FruitPlant.objects.bulk_create(
+        [models.FruitPlant(name=f"plant {i}") for i in range(max(args.keys))],
+        batch_size=10_000,
+    )
+    pks = list(models.FruitPlant.objects.order_by("?").values_list("pk", flat=True))
+
+    results = []
+    for keys_count in sorted(args.keys):
+        results.append(asyncio.run(benchmark_mode("serial", 1, pks[:keys_count], args.repeat)))
+        for shards in args.shards:
+            results.append(asyncio.run(benchmark_mode("parallel", shards, pks[:keys_count], args.repeat)))
+    utils.dump_results([*results, *get_crossovers(results)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Measure the per-batch overhead of the dataloader queries with and without prepared statements
+(`prepared_statements`) on small, frequent batches:
+- `compile` - building and compiling the batch query to SQL vs. only filling in the parameters of the prepared one,
+- `batch` - the whole batch (`load_fn`), including the query and building of the instances.
+
+Usage:
+    python -m benchmarks.prepared_statements --keys 1 10 100 --batches 1000
+"""
+import argparse
+import asyncio
+import time
+
+from benchmarks import utils
+
+
+def benchmark_compile(loader_cls, keys: list[int], batches: int) -> dict:
+    from strawberry_django_dataloaders.core.statements import clear_prepared_statements
+
+    start = time.perf_counter()
+    for _ in range(batches):
+        loader_cls.get_batch_queryset(keys).query.sql_with_params()
+    queryset_time = time.perf_counter() - start
+
+    clear_prepared_statements()
+    start = time.perf_counter()
+    for _ in range(batches):
+        loader_cls.get_prepared_statement(len(keys)).get_params(keys)
+    statement_time = time.perf_counter() - start
+    return {
+        "benchmark": "compile",
+        "keys": len(keys),
+        "queryset_us_per_batch": queryset_time / batches * 10**6,
+        "prepared_us_per_batch": statement_time / batches * 10**6,
+    }
+
+
+async def benchmark_batch(loader_cls, keys: list[int], batches: int) -> dict:
+    from strawberry_django_dataloaders.core.statements import clear_prepared_statements
+
+    result = {"benchmark": "batch", "keys": len(keys)}
+    for prepared in (False, True):
+        clear_prepared_statements()
+        mode_cls = type(f"{loader_cls.__name__}{prepared}", (loader_cls,), {"prepared_statements": prepared})
+        start = time.perf_counter()
+        for _ in range(batches):
+            instances = await mode_cls.load_fn(keys)
+        assert len(instances) == len(keys)
+        result["prepared_us_per_batch" if prepared else "queryset_us_per_batch"] = (
+            (time.perf_counter() - start) / batches * 10**6
+        )
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--batches", type=int, default=1000)
+    args = parser.parse_args()
+
+    utils.setup_django()
+    from tests import models
+    from tests.graphql.dataloaders import FruitEatersReverseFKDataLoader, FruitPlantPKDataLoader
+
+    utils.seed(fruits=max(args.keys))
+    plant_pks = list(models.FruitPlant.objects.values_list("pk", flat=True))
+    fruit_pks = list(models.Fruit.objects.values_list("pk", flat=True))
+
+    results = []
+    for keys_count in args.keys:
+        for loader_cls, pks in ((FruitPlantPKDataLoader, plant_pks), (FruitEatersReverseFKDataLoader, fruit_pks)):
+            for result in (
+                benchmark_compile(loader_cls, pks[:keys_count], args.batches),
+                asyncio.run(benchmark_batch(loader_cls, pks[:keys_count], args.batches)),
+            ):
+                results.append({"loader": loader_cls.__name__, **result})
+    utils.dump_results(results)
+
+
+if __name__ == "__main__":
+    main()
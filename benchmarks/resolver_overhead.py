@@ -0,0 +1,70 @@
+"""
+Measure the per-object overhead of dataloader resolvers - time of resolving a field of an object whose related
+instance is already in the dataloader cache (i.e. without any database query).
+
+Compares the auto dataloader field, the factory resolver and a hand-written resolver using a dataloader directly.
+
+Usage:
+    python -m benchmarks.resolver_overhead --objects 10000
+"""
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from benchmarks import utils
+
+
+async def benchmark_resolver(name: str, resolve, roots: list, info, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for root in roots:
+            await resolve(root, info)
+        timings.append(time.perf_counter() - start)
+    return {
+        "resolver": name,
+        "objects": len(roots),
+        "time_min": min(timings),
+        "per_object_us": min(timings) / len(roots) * 10**6,
+    }
+
+
+async def run(objects: int, repeat: int) -> list[dict]:
+    from strawberry_django_dataloaders import factories, fields
+    from strawberry_django_dataloaders.views import DataloaderContext
+    from tests import models
+    from tests.graphql import types
+
+    colors = [models.Color(pk=i, name=f"color {i}") for i in range(10)]
+    roots = [models.Fruit(pk=i, name=f"fruit {i}", color_id=i % len(colors)) for i in range(objects)]
+    field = next(f for f in types.FruitTypeAutoDataLoaderFields.__strawberry_definition__.fields if f.name == "color")
+    context = DataloaderContext(request=None, response=None)
+    info = SimpleNamespace(_field=field, context=context)
+
+    loader_cls = factories.PKDataLoaderFactory.get_loader_class(models.Color)
+    loader_cls(context=context).prime_many({color.pk: color for color in colors})
+
+    async def manual_resolver(root, info):
+        return await loader_cls(context=info.context).load(root.color_id)
+
+    resolvers = {
+        "manual": manual_resolver,
+        "auto_dataloader_field": fields.get_dataloader_resolver,
+        "factory": factories.PKDataLoaderFactory.as_resolver(),
+    }
+    return [await benchmark_resolver(name, resolve, roots, info, repeat) for name, resolve in resolvers.items()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    utils.setup_django()
+    utils.dump_results(asyncio.run(run(args.objects, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
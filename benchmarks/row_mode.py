@@ -0,0 +1,64 @@
+"""
+Compare loading model instances and lightweight rows (`row_mode = True`) by a reverse FK dataloader -
+wall time and peak memory (traced by `tracemalloc`) of loading all the rows, with and without projection.
+
+Usage:
+    python -m benchmarks.row_mode --rows 100000
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from benchmarks import utils
+
+EATERS_PER_FRUIT = 5
+
+
+async def benchmark_mode(row_mode: bool, only: list[str] | None, fruit_pks: list[int], repeat: int) -> dict:
+    from tests.graphql.dataloaders import FruitEatersReverseFKDataLoader
+
+    loader_cls = type("BenchmarkFruitEatersDataLoader", (FruitEatersReverseFKDataLoader,), {"row_mode": row_mode})
+    timings, peaks = [], []
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = await loader_cls.load_fn(fruit_pks, only=only)
+        timings.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        rows = sum(len(eaters) for eaters in results)
+        del results
+    return {
+        "mode": "rows" if row_mode else "instances",
+        "only": only,
+        "rows": rows,
+        "time_min": min(timings),
+        "time_avg": sum(timings) / len(timings),
+        "peak_memory_mb": min(peaks) / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    utils.setup_django()
+    utils.seed(fruits=args.rows // EATERS_PER_FRUIT, eaters_per_fruit=EATERS_PER_FRUIT)
+    from tests import models
+
+    fruit_pks = list(models.Fruit.objects.values_list("pk", flat=True))
+    results = [
+        asyncio.run(benchmark_mode(row_mode, only, fruit_pks, args.repeat))
+        for only in [None, ["name", "favourite_fruit_id"]]
+        for row_mode in [False, True]
+    ]
+    utils.dump_results(results)
+
+
+if __name__ == "__main__":
+    main()
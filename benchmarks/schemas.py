@@ -0,0 +1,29 @@
+"""
+Schemas the dataloaders are compared against - plain strawberry-django fields resolved one by one (naive)
+and by the strawberry-django query optimizer.
+"""
+import strawberry
+import strawberry.django
+from strawberry_django.optimizer import DjangoOptimizerExtension
+
+from tests import models
+from tests.graphql.types import ColorType, FruitEaterType, FruitPlantType, FruitVarietyType
+
+
+@strawberry.django.type(models.Fruit)
+class FruitType:
+    id: strawberry.auto
+    name: strawberry.auto
+    color: ColorType | None
+    plant: FruitPlantType | None
+    eaters: list[FruitEaterType]
+    varieties: list[FruitVarietyType]
+
+
+@strawberry.type
+class Query:
+    fruits: list[FruitType] = strawberry.django.field()
+
+
+naive_schema = strawberry.Schema(query=Query)
+optimizer_schema = strawberry.Schema(query=Query, extensions=[DjangoOptimizerExtension])
@@ -0,0 +1,63 @@
+"""
+Compare peak memory (traced by `tracemalloc`) and wall time of exporting all the related rows of a reverse FK
+dataloader - loading the whole batch (`load_fn`) and streaming the groups of each 'parent' (`stream`) by chunks
+of different sizes. The consumer discards each group once it's processed, as an export would. Run against PostgreSQL
+(see `benchmarks.django_settings`) to use server-side cursors.
+
+Usage:
+    python -m benchmarks.streaming --rows 1000000 --chunk-sizes 1000 10000
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import Optional
+
+from benchmarks import utils
+
+EATERS_PER_FRUIT = 5
+
+
+async def benchmark_mode(chunk_size: Optional[int], fruit_pks: list[int]) -> dict:
+    from tests.graphql.dataloaders import FruitEatersReverseFKDataLoader
+
+    rows = 0
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    if chunk_size is None:
+        for eaters in await FruitEatersReverseFKDataLoader.load_fn(fruit_pks):
+            rows += len(eaters)
+    else:
+        async for _, eaters in FruitEatersReverseFKDataLoader.stream(fruit_pks, chunk_size=chunk_size):
+            rows += len(eaters)
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        "mode": "list" if chunk_size is None else "stream",
+        "chunk_size": chunk_size,
+        "rows": rows,
+        "time": duration,
+        "peak_memory_mb": peak / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1000, 10_000])
+    args = parser.parse_args()
+
+    utils.setup_django()
+    utils.seed(fruits=args.rows // EATERS_PER_FRUIT, eaters_per_fruit=EATERS_PER_FRUIT)
+    from tests import models
+
+    fruit_pks = list(models.Fruit.objects.values_list("pk", flat=True))
+    results = [asyncio.run(benchmark_mode(chunk_size, fruit_pks)) for chunk_size in [None, *args.chunk_sizes]]
+    utils.dump_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compare throughput and latency of the dataloader levels (simple dataloaders, dataloader factories, auto dataloader
+fields) with the strawberry-django query optimizer and naive resolvers, under concurrent ASGI requests.
+
+For each variant, the same GraphQL query is sent by `--requests` requests, at most `--concurrency` at the same time,
+through the Django ASGI handler (`DataloaderAsyncGraphQLView` for the dataloaders). Measured are the queries
+per request, wall time, requests per second, latencies and peak memory (traced in a separate run).
+
+Usage:
+    python -m benchmarks.throughput --fruits 100 1000 --concurrency 20 --requests 200
+"""
+import argparse
+import asyncio
+import json
+import tracemalloc
+
+from benchmarks import utils
+
+QUERY = "{ fruits { name color { name } plant { name } eaters { name } varieties { name } } }"
+VARIANTS = {
+    "dataloaders": "/graphql/dataloaders/",
+    "dataloader_factories": "/graphql/dataloader-factories/",
+    "auto_dataloader_fields": "/graphql/auto-dataloader-fields/",
+    "strawberry_django_optimizer": "/graphql/optimizer/",
+    "naive": "/graphql/naive/",
+}
+
+
+async def benchmark_variant(app, name: str, path: str, concurrency: int, requests: int) -> dict:
+    async def request():
+        status, body = await utils.asgi_post(app, path, {"query": QUERY})
+        assert status == 200 and "errors" not in json.loads(body), body[:1000]
+
+    await request()  # warm-up, e.g. of the dataloader classes generated by the factories
+    with utils.count_queries() as queries:
+        result = await utils.run_concurrently(name, request, concurrency=concurrency, requests=requests)
+
+    tracemalloc.start()
+    try:
+        await utils.run_concurrently(name, request, concurrency=concurrency, requests=concurrency)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        **result.as_dict(),
+        "queries_per_request": queries.count / requests,
+        "peak_memory_kib": peak_memory / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fruits", type=int, nargs="+", default=[100])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--variants", nargs="+", choices=list(VARIANTS), default=list(VARIANTS))
+    args = parser.parse_args()
+
+    results = []
+    for fruits in args.fruits:
+        utils.setup_django()
+        utils.seed(fruits=fruits)
+
+        from django.core.asgi import get_asgi_application
+
+        app = get_asgi_application()
+        for name in args.variants:
+            result = asyncio.run(benchmark_variant(app, name, VARIANTS[name], args.concurrency, args.requests))
+            results.append({"fruits": fruits, **result})
+    utils.dump_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+from django.urls import path
+from strawberry.django.views import AsyncGraphQLView
+
+from strawberry_django_dataloaders.views import DataloaderAsyncGraphQLView
+from tests.urls import urlpatterns as tests_urlpatterns
+
+from . import schemas
+
+urlpatterns = [
+    *tests_urlpatterns,
+    path("graphql/naive/", AsyncGraphQLView.as_view(schema=schemas.naive_schema)),
+    path("graphql/optimizer/", AsyncGraphQLView.as_view(schema=schemas.optimizer_schema)),
+]
@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Iterator
+from unittest.mock import patch
+
+
+def setup_django() -> None:
+    """Configure Django with the benchmark settings and create a fresh database."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.django_settings")
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.db import connections
+
+    django.setup()
+    connections.close_all()  # the database may be re-created by a previous call
+    if settings.DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+        if os.path.exists(settings.DATABASES["default"]["NAME"]):
+            os.remove(settings.DATABASES["default"]["NAME"])
+    else:
+        call_command("flush", interactive=False, verbosity=0)
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+def seed(fruits: int, eaters_per_fruit: int = 5, varieties: int = 20, colors: int = 10) -> None:
+    """Fill the database with `fruits` fruits, each having a plant, color, varieties and eaters."""
+    from tests import models
+
+    color_objs = models.Color.objects.bulk_create([models.Color(name=f"color {i}") for i in range(colors)])
+    variety_objs = models.FruitVariety.objects.bulk_create(
+        [models.FruitVariety(name=f"variety {i}") for i in range(varieties)]
+    )
+    plants = models.FruitPlant.objects.bulk_create([models.FruitPlant(name=f"plant {i}") for i in range(fruits)])
+    fruit_objs = models.Fruit.objects.bulk_create(
+        [models.Fruit(name=f"fruit {i}", color=color_objs[i % colors], plant=plant) for i, plant in enumerate(plants)]
+    )
+    models.FruitEater.objects.bulk_create(
+        [
+            models.FruitEater(name=f"eater {i}-{j}", favourite_fruit=fruit)
+            for i, fruit in enumerate(fruit_objs)
+            for j in range(eaters_per_fruit)
+        ]
+    )
+    through = models.Fruit.varieties.through
+    through.objects.bulk_create(
+        [
+            through(fruit=fruit, fruitvariety=variety_objs[(i + j) % varieties])
+            for i, fruit in enumerate(fruit_objs)
+            for j in range(3)
+        ]
+    )
+
+
+@dataclass
+class ConcurrencyResult:
+    name: str
+    concurrency: int
+    requests: int
+    total_time: float
+    requests_per_second: float
+    latencies: list[float] = field(default_factory=list, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        latencies = sorted(data.pop("latencies"))
+        data["latency_median"] = statistics.median(latencies) if latencies else None
+        data["latency_p95"] = latencies[int(len(latencies) * 0.95) - 1] if latencies else None
+        return data
+
+
+async def run_concurrently(
+    name: str,
+    request: Callable[[], Awaitable[Any]],
+    *,
+    concurrency: int,
+    requests: int,
+) -> ConcurrencyResult:
+    """Run `requests` calls of `request`, at most `concurrency` of them at the same time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def timed_request():
+        async with semaphore:
+            start = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed_request() for _ in range(requests)))
+    total_time = time.perf_counter() - start
+    return ConcurrencyResult(
+        name=name,
+        concurrency=concurrency,
+        requests=requests,
+        total_time=total_time,
+        requests_per_second=requests / total_time,
+        latencies=latencies,
+    )
+
+
+@dataclass
+class QueryCounter:
+    count: int = 0
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Count queries executed on all the connections (and threads) within the block."""
+    from django.db.backends.utils import CursorWrapper
+
+    counter = QueryCounter()
+    increments = itertools.count(1)
+    original_execute = CursorWrapper._execute
+
+    def _execute(self, sql, params, *args):
+        counter.count = next(increments)
+        return original_execute(self, sql, params, *args)
+
+    with patch.object(CursorWrapper, "_execute", _execute):
+        yield counter
+
+
+async def asgi_post(app: Callable, path: str, data: dict[str, Any]) -> tuple[int, bytes]:
+    """Send a JSON POST request to the ASGI application, return the response status and body."""
+    body = json.dumps(data).encode()
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+    received = False
+    status = 0
+    chunks: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+def dump_results(results: list[dict[str, Any]]) -> None:
+    """Write machine-readable results to the standard output."""
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
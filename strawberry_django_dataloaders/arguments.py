@@ -0,0 +1,73 @@
+import dataclasses
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Hashable, Optional
+
+from strawberry import UNSET
+from strawberry_django import filters as filters_module
+from strawberry_django import ordering
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet  # pragma: nocover
+    from strawberry.types import Info  # pragma: nocover
+
+
+class QueryArguments:
+    """
+    strawberry-django `filters` and `order` input of a list field, applied by the dataloader in the batch query
+    (see `dataloaders.RelatedPage`).
+
+    The arguments are compared and hashed by their normalized values (see `normalize_input`), so that the loads
+    with the same arguments (e.g. of different 'parent' instances) share a batch query.
+    """
+
+    __slots__ = ("filters", "order", "_normalized")
+
+    def __init__(self, filters: Optional[object] = None, order: Optional[object] = None):
+        self.filters = filters if filters is not UNSET else None
+        self.order = order if order is not UNSET else None
+        self._normalized = (normalize_input(self.filters), normalize_input(self.order))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, QueryArguments):
+            return NotImplemented
+        return self._normalized == other._normalized
+
+    def __hash__(self) -> int:
+        return hash(self._normalized)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(filters={self.filters!r}, order={self.order!r})"
+
+    def filter(self, queryset: "QuerySet", info: Optional["Info"] = None) -> "QuerySet":
+        """Filter the queryset by the filter input (`info` is passed to the custom filter methods)."""
+        return filters_module.apply(self.filters, queryset, info)
+
+    def get_order_by(self) -> tuple[str, ...]:
+        """Return `QuerySet.order_by()` fields given by the order input."""
+        if self.order is None:
+            return ()
+        return tuple(ordering.generate_order_args(self.order))
+
+
+def normalize_input(value: Any) -> Hashable:
+    """
+    Convert a (possibly nested) strawberry input value to a hashable value, skipping the unset input fields.
+    Inputs are identified by their GraphQL name, as the specialized classes of the generic inputs
+    (e.g. `FilterLookup[str]`) of the same GraphQL type aren't necessarily the same objects.
+    """
+    if value is None or value is UNSET:
+        return None
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        definition = getattr(value, "__strawberry_definition__", None)
+        return getattr(definition, "name", type(value).__qualname__), tuple(
+            (field.name, normalize_input(getattr(value, field.name)))
+            for field in dataclasses.fields(value)
+            if getattr(value, field.name) is not UNSET
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_input(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, normalize_input(item)) for key, item in value.items()))
+    if isinstance(value, Enum):
+        return type(value).__qualname__, value.value
+    return value
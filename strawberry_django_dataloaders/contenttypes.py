@@ -0,0 +1,202 @@
+"""
+Dataloaders of generic relations (`django.contrib.contenttypes`), which needs to be installed to use them.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Any, Collection, Hashable, Optional, Type
+
+from asgiref.sync import sync_to_async
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db.models import Model as DjangoModel
+from django.db.models import QuerySet
+
+from strawberry_django_dataloaders.core.dataloader import BaseDataLoader, _merge_only
+from strawberry_django_dataloaders.dataloaders import BasicPKDataLoader, BasicReverseFKDataLoader
+from strawberry_django_dataloaders.factories import BaseRelatedListDataLoaderFactory, PKDataLoaderFactory
+
+
+async def get_content_type_models(content_type_ids: Collection[int]) -> dict[int, Optional[Type["DjangoModel"]]]:
+    """
+    Return models of the content types (None for stale content types). Content types are cached
+    by `ContentType.objects`, so the database is queried only for the ones not looked up before.
+    """
+    return await sync_to_async(_get_content_type_models)(content_type_ids)
+
+
+def _get_content_type_models(content_type_ids: Collection[int]) -> dict[int, Optional[Type["DjangoModel"]]]:
+    models: dict[int, Optional[Type["DjangoModel"]]] = {}
+    for content_type_id in content_type_ids:
+        try:
+            models[content_type_id] = ContentType.objects.get_for_id(content_type_id).model_class()
+        except ContentType.DoesNotExist:
+            models[content_type_id] = None
+    return models
+
+
+class GenericFKDataLoader(BaseDataLoader):
+    """
+    Loader of generic foreign key targets (e.g. the commented object of a Comment), keys being
+    `(content_type_id, object_id)` tuples.
+
+    Keys of a batch are grouped by the content type and the instances of each model are loaded by its PK dataloader
+    (`PKDataLoaderFactory`), i.e. by one query per model. The PK dataloaders dispatch their batches at the same time,
+    so the queries run concurrently when the execution backend allows it (e.g. `thread_pool`).
+    Results are None for missing objects and stale content types (and for None keys, i.e. unset generic FKs).
+
+    EXAMPLE:
+        @strawberry.django.type(models.Comment)
+        class CommentType:
+            ...
+
+            @strawberry.field
+            async def content_object(self: "models.Comment", info: "Info") -> FruitType | ColorType | None:
+                return await GenericFKDataLoader(context=info.context).load((self.content_type_id, self.object_id))
+    """
+
+    def __init__(self, *args, **kwargs):
+        if not self._initialized:
+            self._pending_only: dict[Hashable, Optional[frozenset[str]]] = {}
+        super().__init__(*args, load_fn=self._load_batch, **kwargs)
+
+    def load(self, key: Optional[tuple[int, Any]], only: Optional[Collection[str]] = None):
+        """`only` fields are passed to the PK dataloaders of the target models."""
+        only = frozenset(only) if only is not None else None
+        self._pending_only[key] = _merge_only(self._pending_only[key], only) if key in self._pending_only else only
+        return super().load(key)
+
+    def reset(self) -> None:
+        super().reset()
+        self._pending_only.clear()
+
+    async def _load_batch(self, keys: list[tuple[int, Any]]) -> list[Optional["DjangoModel"]]:
+        models = await get_content_type_models({key[0] for key in keys if key is not None})
+        only_by_model: dict[Type["DjangoModel"], Optional[frozenset[str]]] = {}
+        keys_by_model: dict[Type["DjangoModel"], list[tuple[int, Any]]] = defaultdict(list)
+        for key in dict.fromkeys(keys):
+            only = self._pending_only.pop(key, None)
+            model = models[key[0]] if key is not None else None
+            if model is None:
+                continue
+            only_by_model[model] = _merge_only(only_by_model[model], only) if model in keys_by_model else only
+            keys_by_model[model].append(key)
+
+        async def load_model_instance(loader: BasicPKDataLoader, key: tuple[int, Any]) -> Optional["DjangoModel"]:
+            try:
+                pk = loader.model._meta.pk.to_python(key[1])
+            except (ValidationError, ValueError, TypeError):
+                return None  # malformed object id, e.g. a text one pointing to a model with an integer PK
+            return await loader.load(pk, only=only_by_model[loader.model])
+
+        async def load_model_instances(model: Type["DjangoModel"], model_keys: list[tuple[int, Any]]) -> list:
+            loader = PKDataLoaderFactory.get_loader_class(model)(context=self.context)
+            return await asyncio.gather(*(load_model_instance(loader, key) for key in model_keys))
+
+        instances: dict[tuple[int, Any], Optional["DjangoModel"]] = {}
+        model_instances = await asyncio.gather(
+            *(load_model_instances(model, model_keys) for model, model_keys in keys_by_model.items())
+        )
+        for model_keys, loaded in zip(keys_by_model.values(), model_instances):
+            instances.update(zip(model_keys, loaded))
+        return [instances.get(key) for key in keys]
+
+
+class BasicGenericRelationDataLoader(BasicReverseFKDataLoader):
+    """
+    Base loader for reversed generic foreign key relationship, i.e. `GenericRelation` (e.g. get Comments of a Fruit).
+
+    EXAMPLE - load comments of a fruit:
+        CONSIDER DJANGO MODELS:
+            class Comment(models.Model):
+                content_type = models.ForeignKey(ContentType, ...)
+                object_id = models.PositiveIntegerField()
+                content_object = GenericForeignKey("content_type", "object_id")
+
+            class Fruit(models.Model):
+                comments = GenericRelation("Comment")
+
+        1. DATALOADER DEFINITION
+        class FruitCommentsDataLoader(BasicGenericRelationDataLoader):
+            model = Comment
+            parent_model = Fruit
+            reverse_path = "object_id"
+            content_type_path = "content_type"
+    """
+
+    parent_model: Type["DjangoModel"]  # model the loaded instances are related to
+    reverse_path: str  # the object id field of the generic foreign key
+    content_type_path: str = "content_type"  # the content type field of the generic foreign key
+
+    @classmethod
+    def get_related_queryset(cls, keys: list[Any], only: Optional[Collection[str]] = None) -> QuerySet:
+        # filtered through the join, so that the content type doesn't need to be looked up in the DB beforehand
+        parent_opts = cls.parent_model._meta
+        return (
+            super()
+            .get_related_queryset(keys, only=only)
+            .filter(
+                **{
+                    f"{cls.content_type_path}__app_label": parent_opts.app_label,
+                    f"{cls.content_type_path}__model": parent_opts.model_name,
+                }
+            )
+        )
+
+    @classmethod
+    def get_fusable_filter(cls, keys: list[Any], **kwargs: Any) -> None:
+        # instances of other batches can have the same object ID, with another content type
+        return None
+
+    @classmethod
+    def get_batch_results(cls, keys: list[Any], instances: list["DjangoModel"]) -> list[list["DjangoModel"]]:
+        # object id field can be of a different type than the primary key (e.g. a text field)
+        to_parent_key = cls.parent_model._meta.pk.to_python
+        key_to_instances: dict[Any, list["DjangoModel"]] = defaultdict(list)
+        for instance in instances:
+            key_to_instances[to_parent_key(getattr(instance, cls.reverse_path))].append(instance)
+        return [key_to_instances.get(key, []) for key in keys]
+
+
+class GenericRelationDataLoaderFactory(BaseRelatedListDataLoaderFactory):
+    """
+    Base factory for `GenericRelation` dataloaders. For example, get comments of a Fruit.
+    Dataloaders are generated per model, 'parent' model, `reverse_path` (the object id field) and `order_by`.
+
+    EXAMPLE:
+        @strawberry.django.type(models.Fruit)
+        class FruitType:
+            comments: list[CommentType] = strawberry.django.field(
+                resolver=GenericRelationDataLoaderFactory.as_resolver(),
+            )
+    """
+
+    loader_class = BasicGenericRelationDataLoader
+    relation_name: str = "generic"
+    supports_aggregates = False
+
+    @classmethod
+    def get_loader_key(cls, model: Type["DjangoModel"], **kwargs):
+        parent_model: Type["DjangoModel"] = kwargs["parent_model"]
+        content_type_path = kwargs.get("content_type_path", "content_type")
+        return f"{super().get_loader_key(model, **kwargs)}-{parent_model._meta.label}-{content_type_path}"
+
+    @classmethod
+    def get_loader_class_kwargs(cls, model: Type["DjangoModel"], **kwargs):
+        return {
+            **super().get_loader_class_kwargs(model, **kwargs),
+            "parent_model": kwargs["parent_model"],
+            "content_type_path": kwargs.get("content_type_path", "content_type"),
+        }
+
+    @classmethod
+    def get_reverse_path(cls, relation: GenericRelation) -> str:
+        return relation.object_id_field_name
+
+    @classmethod
+    def get_relation_kwargs(cls, relation: GenericRelation) -> dict:
+        return {
+            "reverse_path": cls.get_reverse_path(relation),
+            "parent_model": relation.model,
+            "content_type_path": relation.content_type_field_name,
+        }
@@ -0,0 +1,100 @@
+import enum
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.db.models import QuerySet
+
+from strawberry_django_dataloaders.settings import get_setting
+
+if TYPE_CHECKING:
+    from django.db.models import Model as DjangoModel  # pragma: nocover
+
+SUPPORTS_ASYNC_ORM: bool = hasattr(QuerySet, "__aiter__")  # Django 4.1+
+
+_thread_pool_executor: Optional[ThreadPoolExecutor] = None
+
+
+class ExecutionBackend(str, enum.Enum):
+    """How the dataloader queries are executed."""
+
+    # `asgiref.sync_to_async` with `thread_sensitive=True` - all queries share a single thread
+    SYNC_TO_ASYNC = "sync_to_async"
+    # Django async ORM (`async for`), falls back to THREAD_POOL on Django versions not supporting it. The async ORM
+    # runs the queries by thread-sensitive `sync_to_async` as well, so it doesn't increase the throughput
+    ASYNC_ORM = "async_orm"
+    # non-thread-sensitive pool of worker threads, each having its own (persistent) DB connection. Falls back
+    # to SYNC_TO_ASYNC while the request's connection is in a transaction, the workers wouldn't see its writes
+    THREAD_POOL = "thread_pool"
+
+
+def get_thread_pool_executor() -> ThreadPoolExecutor:
+    global _thread_pool_executor
+    if _thread_pool_executor is None:
+        _thread_pool_executor = ThreadPoolExecutor(
+            max_workers=get_setting("THREAD_POOL_MAX_WORKERS"),
+            thread_name_prefix="dataloader",
+        )
+    return _thread_pool_executor
+
+
+def _close_unusable_connections() -> None:
+    """
+    Worker threads aren't handled by the request/response cycle (`close_old_connections`), close their connections
+    which are no longer usable. With `CONN_MAX_AGE = 0` the connection of a worker is kept for its next batches,
+    otherwise each batch would open a new connection - the number of them is bounded by `THREAD_POOL_MAX_WORKERS`.
+    """
+    for connection in connections.all():
+        if connection.connection is None:
+            continue
+        if connection.settings_dict["CONN_MAX_AGE"] == 0:
+            if connection.errors_occurred and not connection.is_usable():
+                connection.close()
+        else:
+            connection.close_if_unusable_or_obsolete()
+
+
+def _call_in_worker(func: Callable, *args: Any) -> Any:
+    _close_unusable_connections()
+    return func(*args)
+
+
+def _call_in_transaction(using: str, func: Callable, *args: Any) -> tuple[bool, Any]:
+    """
+    Call the function (in the thread of the request) if the `using` connection is in a transaction, as the worker
+    threads wouldn't see its uncommitted writes. Return whether it was called and its result.
+    """
+    if connections[using].in_atomic_block:
+        return True, func(*args)
+    return False, None
+
+
+async def _call_in_thread_pool(using: str, func: Callable, *args: Any) -> Any:
+    called, result = await sync_to_async(_call_in_transaction)(using, func, *args)
+    if called:
+        return result
+    return await sync_to_async(_call_in_worker, thread_sensitive=False, executor=get_thread_pool_executor())(
+        func, *args
+    )
+
+
+async def evaluate_queryset(queryset: "QuerySet", backend: ExecutionBackend) -> list["DjangoModel"]:
+    """Fetch all rows of the queryset using the given execution backend."""
+    backend = ExecutionBackend(backend)
+    if backend is ExecutionBackend.ASYNC_ORM and SUPPORTS_ASYNC_ORM:
+        return [instance async for instance in queryset]
+    if backend is ExecutionBackend.SYNC_TO_ASYNC:
+        return await sync_to_async(list)(queryset)
+    return await _call_in_thread_pool(queryset.db, list, queryset)
+
+
+async def run_in_backend(backend: ExecutionBackend, using: str, func: Callable, *args: Any) -> Any:
+    """
+    Call the blocking (database) function, querying the `using` database, with the given execution backend.
+    There is no async database API in Django, so `async_orm` calls it by `sync_to_async`, as the async ORM does.
+    """
+    backend = ExecutionBackend(backend)
+    if backend is ExecutionBackend.THREAD_POOL or (backend is ExecutionBackend.ASYNC_ORM and not SUPPORTS_ASYNC_ORM):
+        return await _call_in_thread_pool(using, func, *args)
+    return await sync_to_async(func)(*args)
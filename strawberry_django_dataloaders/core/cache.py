@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from strawberry.dataloader import AbstractCache
+
+
+class BoundedCache(AbstractCache):
+    """
+    Dataloader cache map keeping at most `max_entries` values (least recently used are evicted first)
+    for at most `ttl` seconds. None means no limit.
+    Keys are mapped by `cache_key_fn` (e.g. the dataloader's) the same way as by strawberry's `DefaultCache`.
+    `on_evict` is called with the key of each value dropped by the cache itself (not by `delete` or `clear`).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[Hashable], Any]] = None,
+        cache_key_fn: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.cache_key_fn: Callable[[Any], Hashable] = cache_key_fn if cache_key_fn is not None else lambda key: key
+        # cache key -> (key, future, expiration time)
+        self.entries: OrderedDict[Hashable, tuple[Any, Any, Optional[float]]] = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        cache_key = self.cache_key_fn(key)
+        entry = self.entries.get(cache_key)
+        if entry is None:
+            return None
+        _, future, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._evict(cache_key)
+            return None
+        self.entries.move_to_end(cache_key)
+        return future
+
+    def set(self, key: Any, value: Any) -> None:
+        cache_key = self.cache_key_fn(key)
+        self.entries[cache_key] = (key, value, time.monotonic() + self.ttl if self.ttl is not None else None)
+        self.entries.move_to_end(cache_key)
+        if self.max_entries is not None:
+            while len(self.entries) > self.max_entries:
+                self._evict(next(iter(self.entries)))
+
+    def delete(self, key: Any) -> None:
+        self.entries.pop(self.cache_key_fn(key), None)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def _evict(self, cache_key: Hashable) -> None:
+        key, _, _ = self.entries.pop(cache_key)
+        if self.on_evict is not None:
+            self.on_evict(key)
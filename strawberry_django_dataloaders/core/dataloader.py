@@ -1,40 +1,644 @@
-from typing import TYPE_CHECKING, Type
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Collection, Hashable, Iterator, Mapping, Optional, Type
 
-from asgiref.sync import sync_to_async
-from strawberry.dataloader import DataLoader
+from django.db import connections, router
+from django.db.models import F, Q
+from strawberry.dataloader import Batch, DataLoader, dispatch_batch, should_create_new_batch
+
+from strawberry_django_dataloaders import instrumentation
+from strawberry_django_dataloaders.core.backends import ExecutionBackend, evaluate_queryset, run_in_backend
+from strawberry_django_dataloaders.core.cache import BoundedCache
+from strawberry_django_dataloaders.core.dispatch import call_after_ticks
+from strawberry_django_dataloaders.core.lookups import ArrayAny
+from strawberry_django_dataloaders.core.statements import (
+    PreparedStatement,
+    StatementKeys,
+    StatementKeysLookup,
+    get_prepared_statement,
+)
+from strawberry_django_dataloaders.rows import as_rows
+from strawberry_django_dataloaders.settings import get_setting
 
 if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper  # pragma: nocover
     from django.db.models import Model as DjangoModel  # pragma: nocover
+    from django.db.models import Lookup, QuerySet  # pragma: nocover
+    from strawberry.types import Info  # pragma: nocover
 
+    from strawberry_django_dataloaders.core.scheduler import BatchScheduler  # pragma: nocover
     from strawberry_django_dataloaders.views import DataloaderContext  # pragma: nocover
 
+# set for the batches loaded after `DataloaderContext.use_primary_db` was set
+_use_primary_db: ContextVar[bool] = ContextVar("strawberry_django_dataloaders_use_primary_db", default=False)
+# scheduler fusing the queries of the batch being loaded with other batches, if the dataloader fuses its batches
+_batch_scheduler: ContextVar[Optional["BatchScheduler"]] = ContextVar(
+    "strawberry_django_dataloaders_batch_scheduler", default=None
+)
+# `select_related` paths of the batch being loaded
+_select_related: ContextVar[tuple[str, ...]] = ContextVar("strawberry_django_dataloaders_select_related", default=())
+# GraphQL info passed to `get_queryset` of the strawberry-django type of the batch being loaded
+_query_info: ContextVar[Optional["Info"]] = ContextVar("strawberry_django_dataloaders_query_info", default=None)
+
 
 class BaseDataLoader(DataLoader):
-    _instance_cache = None
+    """
+    Base of the dataloaders, cached in the request context (see `__new__`).
+
+    CACHE POLICY:
+        Loaded values are cached for the whole lifetime of the context by default. For long-lived contexts
+        (e.g. subscriptions over websockets) or very large queries, the cache can be bounded:
+            - `cache_max_entries` - keep at most this many values, evicting the least recently used ones,
+            - `cache_ttl` - keep the values for at most this many seconds,
+            - `use_cache = False` - don't cache at all, just batch the loads of the same event loop iteration.
+        `cache_max_entries` and `cache_ttl` default to the `CACHE_MAX_ENTRIES` and `CACHE_TTL` settings.
+        `DataloaderContext.clear_dataloaders()` drops all the dataloaders of a context, e.g. between subscription
+        events.
+
+    BATCH SCHEDULING:
+        A batch is dispatched at the end of the event loop iteration it was created in by default. Nested async
+        resolvers often reach the dataloader in different iterations, producing several small batches instead of
+        a large one. The batches can be collected for longer:
+            - `batch_window` - dispatch the batch this many seconds after it was created,
+            - `batch_ticks` - dispatch the batch after this many event loop iterations,
+            - `dispatch_when_idle = True` - hold the batches until the resolvers of the request are parked,
+              see `core.dispatch.IdleDispatcher` (takes precedence over the window and ticks),
+            - `max_batch_size` - start a new batch once the current one has this many keys.
+        All of them default to the `BATCH_WINDOW`, `BATCH_TICKS`, `DISPATCH_WHEN_IDLE` and `MAX_BATCH_SIZE` settings.
+    """
 
-    def __new__(cls, context: "DataloaderContext", force_new: bool = False) -> "BaseDataLoader":
+    _initialized: bool = False
+    use_cache: bool = True
+    cache_max_entries: Optional[int] = None
+    cache_ttl: Optional[float] = None  # seconds
+    max_batch_size: Optional[int] = None
+    batch_window: Optional[float] = None  # seconds
+    batch_ticks: Optional[int] = None
+    dispatch_when_idle: Optional[bool] = None
+
+    def __new__(cls, context: "DataloaderContext", force_new: bool = False, **kwargs) -> "BaseDataLoader":
         """
         Returns a dataloader instance.
         Takes the instance from request context cache or creates a new one if it does not exist there yet.
         This makes the dataloader "semi-singleton" in the sense that they are singleton in the context of each request.
+
+        Pass `force_new=True` to replace the instance stored in the context with a fresh one.
         """
         if force_new or cls not in context.dataloaders:
             context.dataloaders[cls] = super().__new__(cls)
         return context.dataloaders[cls]
 
-    def __init__(self, context: "DataloaderContext", **kwargs):
-        if self._instance_cache is None:
-            self._instance_cache = context.dataloaders[self.__class__]
+    def __init__(self, context: "DataloaderContext", force_new: bool = False, **kwargs):
+        # Python calls `__init__` on whatever `__new__` returns, i.e. also on the instance reused from the context.
+        # Initializing it again would wipe its cache map, so it's done only once per instance.
+        if self._initialized:
+            return
+        self.context = context
+        kwargs.setdefault("cache", self.use_cache)
+        if kwargs["cache"] and kwargs.get("cache_map") is None and self.is_cache_bounded():
+            kwargs["cache_map"] = BoundedCache(
+                max_entries=self.get_cache_max_entries(),
+                ttl=self.get_cache_ttl(),
+                on_evict=self.cache_evicted,
+                cache_key_fn=kwargs.get("cache_key_fn"),
+            )
+        kwargs.setdefault("max_batch_size", self.get_max_batch_size())
         super().__init__(**kwargs)
+        self._initialized = True
+
+    def load(self, key: Any) -> Awaitable:
+        # the same as `DataLoader.load`, dispatching the new batches by `dispatch`
+        if self.cache:
+            future = self.cache_map.get(key)
+            if future is not None and not future.cancelled():
+                return future
+        future = self.loop.create_future()
+        if self.cache:
+            self.cache_map.set(key, future)
+        if self.batch is None or should_create_new_batch(self, self.batch):
+            self.batch = Batch()
+            self.dispatch(self.batch)
+        if self.dispatches_when_idle():
+            self.context.idle_dispatcher.key_added(future)
+        self.batch.add_task(key, future)
+        return future
+
+    def dispatch(self, batch: Batch) -> None:
+        """Schedule the dispatch of a new batch, see BATCH SCHEDULING."""
+        if self.dispatches_when_idle():
+            self.context.idle_dispatcher.schedule(self, batch)
+            return
+        batch_window = self.get_batch_window()
+        if batch_window:
+            self.loop.call_later(batch_window, self.loop.create_task, self.dispatch_batch(batch))
+        else:
+            call_after_ticks(self.get_batch_ticks() or 1, self.loop.create_task, self.dispatch_batch(batch))
+
+    async def dispatch_batch(self, batch: Batch) -> None:
+        await dispatch_batch(self, batch)
+
+    @classmethod
+    def get_max_batch_size(cls) -> Optional[int]:
+        return cls.max_batch_size if cls.max_batch_size is not None else get_setting("MAX_BATCH_SIZE")
+
+    @classmethod
+    def get_batch_window(cls) -> Optional[float]:
+        return cls.batch_window if cls.batch_window is not None else get_setting("BATCH_WINDOW")
+
+    @classmethod
+    def get_batch_ticks(cls) -> Optional[int]:
+        return cls.batch_ticks if cls.batch_ticks is not None else get_setting("BATCH_TICKS")
+
+    @classmethod
+    def dispatches_when_idle(cls) -> bool:
+        return cls.dispatch_when_idle if cls.dispatch_when_idle is not None else get_setting("DISPATCH_WHEN_IDLE")
+
+    @classmethod
+    def get_cache_max_entries(cls) -> Optional[int]:
+        return cls.cache_max_entries if cls.cache_max_entries is not None else get_setting("CACHE_MAX_ENTRIES")
+
+    @classmethod
+    def get_cache_ttl(cls) -> Optional[float]:
+        return cls.cache_ttl if cls.cache_ttl is not None else get_setting("CACHE_TTL")
+
+    @classmethod
+    def is_cache_bounded(cls) -> bool:
+        return cls.get_cache_max_entries() is not None or cls.get_cache_ttl() is not None
+
+    def cache_evicted(self, key: Hashable) -> None:
+        """Called when the bounded cache drops the value of the key."""
+
+    def reset(self) -> None:
+        """Drop all cached values and forget the current batch, keeping the instance registered in the context."""
+        self.clear_all()
+        self.batch = None
 
 
 class BaseDjangoModelDataLoader(BaseDataLoader):
+    """
+    Base loader of Django model instances.
+
+    Supports column projection - `load(key, only=[...])` loads just the given model fields (`QuerySet.only()`).
+    Fields requested by all `load` calls in a batch are merged, and fields required by the loader itself
+    (see `get_required_only_fields`) are always added. Loading the key without `only` loads all the fields.
+
+    Subclasses define the batch query (`get_batch_queryset`) and how the fetched instances are paired with the keys
+    (`get_batch_results`). The query is executed by the `execution_backend` (defaults to the
+    `EXECUTION_BACKEND` setting).
+
+    Loaded instances are added to the identity map of the request (`DataloaderContext.identity_map`), so that
+    each row is represented by a single instance per request, shared by all the dataloaders
+    (set `use_identity_map = False` to opt out). The identity map isn't used with a bounded or disabled cache
+    (see `BaseDataLoader`), as it would keep the instances for the whole lifetime of the context.
+
+    Queries are sent to the `using` database alias (by default `router.db_for_read(model)`, i.e. it can be
+    a read replica). Once `DataloaderContext.use_primary_db` is set (e.g. after a mutation), the following batches
+    of the request read from `router.db_for_write(model)` instead.
+
+    With `row_mode = True`, lightweight `rows.ModelRow` records (loaded through `values_list()`) are returned
+    instead of model instances - see `rows.ModelRow` for their limitations.
+
+    With `fuse_batches = True` (defaults to the `FUSE_BATCHES` setting), batches of different dataloaders
+    of the same model dispatched at the same time are fetched by a single query, see `core.scheduler.BatchScheduler`.
+
+    Related instances of a forward FK / one-to-one path can be joined to the batch query by
+    `load(key, select_related={path: PK dataloader class})` - the joined instances are primed into the PK dataloaders,
+    so that loading them later doesn't query the database (see `auto_dataloader_field(lookahead=True)`).
+
+    With `django_type` set (a strawberry-django type defining `get_queryset`), the batch queries are filtered
+    by the `get_queryset(queryset, info)` of the type, `info` being the one passed to the latest `load(key, info=...)`
+    of the batch (so it shouldn't depend on anything else than the request, e.g. `info.context.request.user`).
+    Such dataloaders don't fuse their batches and don't take the instances from the identity map, as these could
+    have been loaded without the filter.
+
+    Each batch is reported to the observers of `instrumentation` (keys, rows, query time, etc.).
+
+    Large batches are split into several queries of at most `max_keys_per_query` keys (by default derived
+    from the max number of query parameters of the DB backend, or the `MAX_QUERY_PARAMS` setting if the backend
+    doesn't declare it, e.g. PostgreSQL). On PostgreSQL, `array_parameter = True` passes
+    all the keys as a single array parameter (`= ANY(%s)`) instead.
+
+    Batches of at least `parallel_threshold` keys (defaults to the `PARALLEL_THRESHOLD` setting, None = never)
+    are split into `parallel_shards` shards (defaults to the `PARALLEL_SHARDS` setting), which are queried at the same
+    time by the workers of the `thread_pool` execution backend (each having its own DB connection), regardless of
+    the `execution_backend`. The parallel queries don't see uncommitted changes of the request, so they aren't used
+    once `DataloaderContext.use_primary_db` is set, and run on the request's thread while it's in a transaction.
+
+    With `prepared_statements = True` (defaults to the `PREPARED_STATEMENTS` setting), the batch query is compiled
+    to SQL once per dataloader class, database alias, projection and number of key placeholders
+    (see `get_statement_keys_count`) and then only executed with the new keys (see `core.statements`), skipping
+    the queryset building and compilation on each batch. The batch queryset therefore must not depend on anything
+    else than the dataloader class, the projection and `get_batch_queryset` kwargs. Not used in row mode,
+    with `select_related` and with `django_type`.
+    """
+
     model: Type["DjangoModel"] = NotImplemented
+    execution_backend: Optional[ExecutionBackend] = None
+    max_keys_per_query: Optional[int] = None  # defaults to the `MAX_KEYS_PER_QUERY` setting
+    array_parameter: Optional[bool] = None  # defaults to the `ARRAY_PARAMETER` setting
+    # query parameters reserved for the other conditions of the query when the limit is derived from the DB backend
+    reserved_query_params: int = 99
+    use_identity_map: bool = True
+    row_mode: bool = False
+    using: Optional[str] = None  # database alias, None means given by the database routers
+    fuse_batches: Optional[bool] = None  # defaults to the `FUSE_BATCHES` setting
+    parallel_threshold: Optional[int] = None  # defaults to the `PARALLEL_THRESHOLD` setting
+    parallel_shards: Optional[int] = None  # defaults to the `PARALLEL_SHARDS` setting
+    django_type: Optional[type] = None  # strawberry-django type whose `get_queryset` filters the batch queries
+    prepared_statements: Optional[bool] = None  # defaults to the `PREPARED_STATEMENTS` setting
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, load_fn=self.load_fn, **kwargs)
+        if not self._initialized:
+            # projection of the keys waiting for the batch dispatch and of the already dispatched keys (None = all)
+            self._pending_only: dict[Hashable, Optional[frozenset[str]]] = {}
+            self._loaded_only: dict[Hashable, Optional[frozenset[str]]] = {}
+            self._batch_queued_at: Optional[float] = None
+            # `select_related` paths of the batch waiting for the dispatch, with PK dataloaders of the joined instances
+            self._pending_select_related: dict[str, Type["BaseDjangoModelDataLoader"]] = {}
+            self._info: Optional["Info"] = None  # info of the latest load, see `django_type`
+        super().__init__(*args, load_fn=self._load_batch, **kwargs)
+
+    def load(
+        self,
+        key: Any,
+        only: Optional[Collection[str]] = None,
+        select_related: Optional[Mapping[str, Type["BaseDjangoModelDataLoader"]]] = None,
+        info: Optional["Info"] = None,
+    ) -> Awaitable:
+        if info is not None:
+            self._info = info
+        only = frozenset(only) if only is not None else None
+        if key in self._pending_only:
+            self._pending_only[key] = _merge_only(self._pending_only[key], only)
+        elif not self.cache or self.cache_map.get(key) is None:
+            self._pending_only[key] = only
+        elif key in self._loaded_only:
+            loaded_only = self._loaded_only[key]
+            if loaded_only is not None and (only is None or not only <= loaded_only):
+                # the cached instance doesn't have all the requested fields loaded, load it again
+                self.clear(key)
+                del self._loaded_only[key]
+                self._pending_only[key] = _merge_only(loaded_only, only)
+        if key in self._pending_only:
+            if self._batch_queued_at is None:
+                self._batch_queued_at = time.perf_counter()
+            if select_related:
+                self._pending_select_related.update(select_related)
+        return super().load(key)
+
+    def reset(self) -> None:
+        """Also drops the instances of the model from the identity map, so that PK dataloaders load them again."""
+        super().reset()
+        self._pending_only.clear()
+        self._loaded_only.clear()
+        self._batch_queued_at = None
+        self._pending_select_related.clear()
+        self._info = None
+        if self.uses_identity_map():
+            self.context.identity_map.clear(self.model)
+
+    def uses_identity_map(self) -> bool:
+        return self.use_identity_map and not self.row_mode and self.cache and not self.is_cache_bounded()
+
+    def cache_evicted(self, key: Hashable) -> None:
+        self._loaded_only.pop(key, None)
+
+    async def _load_batch(self, keys: list[Hashable]) -> list:
+        unique_keys = dict.fromkeys(keys)
+        with self._batch_scope(keys, unique_keys):
+            return await self._load_batch_results(keys, unique_keys)
+
+    @contextmanager
+    def _batch_scope(self, keys: list[Hashable], unique_keys: Collection[Hashable]) -> Iterator[None]:
+        """Report the batch loaded within the block to `instrumentation`, with the request settings of the queries."""
+        started_at = time.perf_counter()
+        stats = instrumentation.BatchStats(
+            loader=self.__class__,
+            keys=len(keys),
+            unique_keys=len(unique_keys),
+            queue_wait=started_at - (self._batch_queued_at or started_at),
+        )
+        self._batch_queued_at = None
+        instrumentation.start_batch(stats)
+        use_primary_db_token = _use_primary_db.set(self.context.use_primary_db)
+        batch_scheduler_token = _batch_scheduler.set(self.context.batch_scheduler if self.uses_fusion() else None)
+        try:
+            yield
+        except BaseException as e:
+            stats.error = e
+            raise
+        finally:
+            _batch_scheduler.reset(batch_scheduler_token)
+            _use_primary_db.reset(use_primary_db_token)
+            stats.duration = time.perf_counter() - started_at
+            instrumentation.finish_batch(self.context, stats)
+
+    def _pop_batch_only(self, keys: list[Hashable], unique_keys: Collection[Hashable]) -> Optional[frozenset[str]]:
+        """Return the merged projection of the batch keys (None = all the fields), see `load(key, only=...)`."""
+        only: Optional[frozenset[str]] = frozenset()
+        for key in unique_keys:
+            only = _merge_only(only, self._pending_only.pop(key, None))
+        if self.cache:
+            for key in keys:
+                self._loaded_only[key] = only
+        return only
+
+    def _pop_batch_select_related(self) -> dict[str, Type["BaseDjangoModelDataLoader"]]:
+        """Return the `select_related` paths of the batch (with PK dataloaders of the joined instances)."""
+        select_related, self._pending_select_related = self._pending_select_related, {}
+        return select_related if not self.row_mode else {}
+
+    @contextmanager
+    def _batch_query_scope(self, select_related: Collection[str]) -> Iterator[None]:
+        """Make the `select_related` paths and the info of the batch available to `get_queryset`."""
+        select_related_token = _select_related.set(tuple(select_related))
+        query_info_token = _query_info.set(self._info)
+        try:
+            yield
+        finally:
+            _query_info.reset(query_info_token)
+            _select_related.reset(select_related_token)
+
+    async def _load_batch_results(self, keys: list[Hashable], unique_keys: Collection[Hashable]) -> list:
+        only = self._pop_batch_only(keys, unique_keys)
+        select_related = self._pop_batch_select_related()
+        if only is not None:
+            # the traversed relations can't be deferred
+            only = only | self.get_required_only_fields() | {path.split("__")[0] for path in select_related}
+        with self._batch_query_scope(select_related):
+            if only is None:
+                results = await self.__class__.load_fn(keys)
+            else:
+                results = await self.__class__.load_fn(keys, only=only)
+        if select_related:
+            # primed from the loaded instances, the ones in the identity map may not have the joined relations
+            self.prime_select_related(results, select_related)
+        if self.uses_identity_map():
+            results = self.context.identity_map.add_results(results)
+        return results
+
+    def prime_select_related(
+        self,
+        results: list,
+        select_related: Mapping[str, Type["BaseDjangoModelDataLoader"]],
+    ) -> None:
+        """Prime the PK dataloaders with the instances joined to the results by `select_related`."""
+        for path, loader_class in select_related.items():
+            loader = self.context.dataloaders.get(loader_class) or loader_class(context=self.context)
+            for instance in _iter_result_instances(results):
+                related = _get_joined_instance(instance, path)
+                if related is not None:
+                    loader.prime_instance(related)
+
+    @classmethod
+    def get_required_only_fields(cls) -> frozenset[str]:
+        """Fields which need to be loaded even when projection is used (e.g. those used to pair results with keys)."""
+        return frozenset({cls.model._meta.pk.attname})
+
+    @classmethod
+    def get_queryset(cls, only: Optional[Collection[str]] = None) -> "QuerySet":
+        queryset = cls.model.objects.using(cls.get_db_alias())
+        if only is not None:
+            queryset = queryset.only(*only)
+        select_related = _select_related.get()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if cls.django_type is not None:
+            queryset = cls.django_type.get_queryset(queryset, _query_info.get())
+        return queryset
 
     @classmethod
-    @sync_to_async
-    def load_fn(cls, keys: list[str]):
+    def get_execution_backend(cls) -> ExecutionBackend:
+        return ExecutionBackend(cls.execution_backend or get_setting("EXECUTION_BACKEND"))
+
+    @classmethod
+    async def load_fn(cls, keys: list[str], only: Optional[Collection[str]] = None) -> list:
+        instances = await cls.fetch_instances(list(dict.fromkeys(keys)), only=only)
+        return cls.get_batch_results(keys, instances)
+
+    @classmethod
+    async def fetch_instances(
+        cls,
+        keys: list[str],
+        only: Optional[Collection[str]] = None,
+        **kwargs: Any,
+    ) -> list["DjangoModel"]:
+        """Fetch instances of the (unique) keys, in several queries if needed. Kwargs go to `get_batch_queryset`."""
+        scheduler = _batch_scheduler.get()
+        if scheduler is not None and not _select_related.get():
+            keys_filter = cls.get_fusable_filter(keys, **kwargs)
+            max_keys = cls.get_max_keys_per_query()
+            if keys_filter is not None and (max_keys is None or len(keys) <= max_keys):
+                only = frozenset(only) if only is not None else None
+                return await scheduler.fetch(cls, keys_filter, len(keys), only=only)
+        if cls.uses_parallel_loading(len(keys)):
+            chunks = [chunk for shard in cls.get_keys_shards(keys) for chunk in cls.get_keys_chunks(shard)]
+            # shards of the 'parent' keys are disjoint, concatenating their instances keeps the order of each 'parent'
+            chunks_instances = await asyncio.gather(
+                *(cls._fetch_chunk(chunk, only, ExecutionBackend.THREAD_POOL, **kwargs) for chunk in chunks)
+            )
+            return [instance for chunk_instances in chunks_instances for instance in chunk_instances]
+        backend = cls.get_execution_backend()
+        instances: list["DjangoModel"] = []
+        for keys_chunk in cls.get_keys_chunks(keys):
+            instances.extend(await cls._fetch_chunk(keys_chunk, only, backend, **kwargs))
+        return instances
+
+    @classmethod
+    async def _fetch_chunk(
+        cls,
+        keys: list[str],
+        only: Optional[Collection[str]],
+        backend: ExecutionBackend,
+        **kwargs: Any,
+    ) -> list["DjangoModel"]:
+        started_at = time.perf_counter()
+        if cls.uses_prepared_statements(**kwargs):
+            only = frozenset(only) if only is not None else None
+            instances = await run_in_backend(backend, cls.get_db_alias(), cls._fetch_prepared, keys, only, kwargs)
+        else:
+            queryset = cls.get_batch_queryset(keys, only=only, **kwargs)
+            if cls.row_mode:
+                queryset = as_rows(queryset)
+            instances = await evaluate_queryset(queryset, backend)
+        instrumentation.record_query(len(instances), time.perf_counter() - started_at)
+        return instances
+
+    @classmethod
+    def _fetch_prepared(
+        cls,
+        keys: list[str],
+        only: Optional[frozenset[str]],
+        kwargs: dict[str, Any],
+    ) -> list["DjangoModel"]:
+        if not keys:
+            return []
+        # prepared in the database thread, compiling the query may need to query the DB (e.g. its version)
+        statement = cls.get_prepared_statement(len(keys), only, **kwargs)
+        if statement is None:
+            return list(cls.get_batch_queryset(keys, only=only, **kwargs))
+        return statement.execute(keys)
+
+    @classmethod
+    def uses_prepared_statements(cls, **kwargs: Any) -> bool:
+        """Whether the batch query (with the `get_batch_queryset` kwargs) is executed as a prepared statement."""
+        prepared_statements = (
+            cls.prepared_statements if cls.prepared_statements is not None else get_setting("PREPARED_STATEMENTS")
+        )
+        return prepared_statements and not cls.row_mode and cls.django_type is None and not _select_related.get()
+
+    @classmethod
+    def get_statement_keys_count(cls, keys_count: int) -> Optional[int]:
+        """
+        Number of key placeholders of the statement of `keys_count` keys - the nearest higher power of two
+        (at most `get_max_keys_per_query()`), so that there are a few statements per dataloader only.
+        None means all the keys are passed as a single array parameter.
+        """
+        if cls.uses_array_parameter():
+            return None
+        count = 1 << (keys_count - 1).bit_length()
+        max_keys = cls.get_max_keys_per_query()
+        return min(count, max(max_keys, keys_count)) if max_keys is not None else count
+
+    @classmethod
+    def get_prepared_statement(
+        cls,
+        keys_count: int,
+        only: Optional[frozenset[str]] = None,
+        **kwargs: Any,
+    ) -> Optional[PreparedStatement]:
+        """Return the (cached) statement of the batch query of `keys_count` keys, None if it can't be prepared."""
+        keys = StatementKeys(cls.get_statement_keys_count(keys_count))
+        alias = cls.get_db_alias()
+        return get_prepared_statement(
+            (cls, alias, only, keys.count, tuple(sorted(kwargs.items()))),
+            lambda: PreparedStatement.prepare(cls.get_batch_queryset(keys, only=only, **kwargs), keys),
+        )
+
+    @classmethod
+    def get_parallel_threshold(cls) -> Optional[int]:
+        return cls.parallel_threshold if cls.parallel_threshold is not None else get_setting("PARALLEL_THRESHOLD")
+
+    @classmethod
+    def get_parallel_shards(cls) -> int:
+        return cls.parallel_shards if cls.parallel_shards is not None else get_setting("PARALLEL_SHARDS")
+
+    @classmethod
+    def uses_parallel_loading(cls, keys_count: int) -> bool:
+        """Whether the batch of `keys_count` (unique) keys is loaded by parallel queries."""
+        threshold = cls.get_parallel_threshold()
+        return (
+            threshold is not None
+            and keys_count >= threshold
+            and cls.get_parallel_shards() > 1
+            and not _use_primary_db.get()
+        )
+
+    @classmethod
+    def get_keys_shards(cls, keys: list[str]) -> Iterator[list[str]]:
+        """Split the keys into (at most) `get_parallel_shards()` shards of about the same size."""
+        shard_size = max(-(-len(keys) // cls.get_parallel_shards()), 1)  # ceil
+        for i in range(0, len(keys), shard_size):
+            yield keys[i : i + shard_size]
+
+    @classmethod
+    def get_db_alias(cls) -> str:
+        """Return alias of the database the batch is read from."""
+        if _use_primary_db.get():
+            return router.db_for_write(cls.model)
+        return cls.using or router.db_for_read(cls.model)
+
+    @classmethod
+    def get_connection(cls) -> "BaseDatabaseWrapper":
+        return connections[cls.get_db_alias()]
+
+    @classmethod
+    def uses_array_parameter(cls) -> bool:
+        array_parameter = cls.array_parameter if cls.array_parameter is not None else get_setting("ARRAY_PARAMETER")
+        return array_parameter and cls.get_connection().vendor == "postgresql"
+
+    @classmethod
+    def get_max_keys_per_query(cls) -> Optional[int]:
+        """Max number of keys in a single query, None means no limit."""
+        if cls.uses_array_parameter():
+            return None
+        max_keys = cls.max_keys_per_query or get_setting("MAX_KEYS_PER_QUERY")
+        if max_keys is not None:
+            return max_keys
+        max_params: Optional[int] = cls.get_connection().features.max_query_params
+        if max_params is None:
+            max_params = get_setting("MAX_QUERY_PARAMS")
+        return max(max_params - cls.reserved_query_params, 1) if max_params is not None else None
+
+    @classmethod
+    def get_keys_chunks(cls, keys: list[str]) -> Iterator[list[str]]:
+        max_keys = cls.get_max_keys_per_query()
+        if max_keys is None:
+            yield keys
+            return
+        for i in range(0, len(keys), max_keys):
+            yield keys[i : i + max_keys]
+
+    @classmethod
+    def get_keys_filter(cls, path: str, keys: list[str]) -> "Q | Lookup":
+        """Return filter of the instances with `path` value in `keys`, to be passed to `QuerySet.filter()`."""
+        if isinstance(keys, StatementKeys):
+            return StatementKeysLookup(F(path), keys)
+        if cls.uses_array_parameter():
+            return ArrayAny(F(path), keys)
+        return Q(**{f"{path}__in": keys})
+
+    @classmethod
+    def uses_fusion(cls) -> bool:
+        if cls.django_type is not None:
+            return False  # the fused query is built by `get_queryset` of one of the dataloaders
+        return cls.fuse_batches if cls.fuse_batches is not None else get_setting("FUSE_BATCHES")
+
+    @classmethod
+    def get_fusable_filter(cls, keys: list[str], **kwargs: Any) -> Optional["Q | Lookup"]:
+        """
+        Return filter of the batch instances if the batch query can be fused with batches of other dataloaders
+        of the model (the batch results need to be paired by `get_batch_results`, ignoring instances of other keys),
+        None if it can't. Kwargs are those of `get_batch_queryset`.
+        """
+        return None
+
+    @classmethod
+    def get_batch_queryset(cls, keys: list[str], only: Optional[Collection[str]] = None) -> "QuerySet":
+        """Return (not yet evaluated) queryset of all the instances needed for the batch of keys."""
+        raise NotImplementedError  # pragma: nocover
+
+    @classmethod
+    def get_batch_results(cls, keys: list[str], instances: list["DjangoModel"]) -> list:
+        """Pair fetched instances with the keys - return results ordered in the same way as input 'keys'."""
         raise NotImplementedError  # pragma: nocover
+
+
+def _iter_result_instances(results: list) -> Iterator["DjangoModel"]:
+    for result in results:
+        if isinstance(result, list):
+            yield from result
+        elif result is not None:
+            yield result
+
+
+def _get_joined_instance(instance: "DjangoModel", path: str) -> Optional["DjangoModel"]:
+    """Return the related instance of the `select_related` path, None if it wasn't joined (or is null)."""
+    related: Optional["DjangoModel"] = instance
+    for name in path.split("__"):
+        related = related._state.fields_cache.get(name)
+        if related is None:
+            return None
+    return related
+
+
+def _merge_only(
+    only: Optional[frozenset[str]],
+    other: Optional[frozenset[str]],
+) -> Optional[frozenset[str]]:
+    """Union of two projections, None meaning all the fields."""
+    if only is None or other is None:
+        return None
+    return only | other
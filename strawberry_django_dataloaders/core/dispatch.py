@@ -0,0 +1,75 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from strawberry.dataloader import Batch  # pragma: nocover
+
+    from strawberry_django_dataloaders.core.dataloader import BaseDataLoader  # pragma: nocover
+
+
+class IdleDispatcher:
+    """
+    Request-wide dispatcher of the dataloader batches (with `dispatch_when_idle = True`), kept
+    in `DataloaderContext.idle_dispatcher`. Instead of dispatching each batch at the end of the event loop iteration
+    it was created in, the batches are held until the resolvers of the request are parked, but at most `max_ticks`
+    event loop iterations. Then all the held batches are dispatched at once.
+
+    The resolvers are considered parked once none of the request's loads dispatched earlier is still in flight
+    (their results would let the resolvers load more keys) and `idle_ticks` consecutive event loop iterations pass
+    without any key being added to the held batches. Only the loads of this request are tracked, so concurrent
+    requests on the same event loop don't delay each other.
+
+    This collects the loads of nested async resolvers reaching the dataloaders in different event loop iterations
+    into a single batch (i.e. query) per dataloader.
+    """
+
+    def __init__(self, idle_ticks: int = 2, max_ticks: int = 50):
+        self.idle_ticks = idle_ticks
+        self.max_ticks = max_ticks
+        self._pending: list[tuple["BaseDataLoader", "Batch"]] = []
+        self._outstanding = 0  # loads of the request not settled yet - held or in flight
+        self._held = 0  # loads in the held batches
+        self._active = False  # a key was added to the held batches in the current event loop iteration
+        self._ticks = 0
+        self._idle_ticks = 0
+
+    def schedule(self, loader: "BaseDataLoader", batch: "Batch") -> None:
+        """Hold the new `batch` of the `loader` until the resolvers are parked."""
+        if not self._pending:
+            self._ticks = self._idle_ticks = 0
+            asyncio.get_running_loop().call_soon(self._tick)
+        self._pending.append((loader, batch))
+
+    def key_added(self, future: asyncio.Future) -> None:
+        """Called when a key (with its `future`) is added to a held batch."""
+        self._active = True
+        self._held += 1
+        self._outstanding += 1
+        future.add_done_callback(self._load_settled)
+
+    def _load_settled(self, future: asyncio.Future) -> None:
+        self._outstanding -= 1
+
+    def _tick(self) -> None:
+        self._ticks += 1
+        if not self._is_idle() and self._ticks < self.max_ticks:
+            asyncio.get_running_loop().call_soon(self._tick)
+            return
+        pending, self._pending = self._pending, []
+        self._held = 0
+        for loader, batch in pending:
+            asyncio.ensure_future(loader.dispatch_batch(batch))
+
+    def _is_idle(self) -> bool:
+        in_flight = self._outstanding - self._held
+        self._idle_ticks = 0 if self._active or in_flight else self._idle_ticks + 1
+        self._active = False
+        return self._idle_ticks >= self.idle_ticks
+
+
+def call_after_ticks(ticks: int, callback: Callable[..., Any], *args: Any) -> None:
+    """Call the callback in the `ticks`-th following iteration of the running event loop."""
+    if ticks <= 1:
+        asyncio.get_running_loop().call_soon(callback, *args)
+    else:
+        asyncio.get_running_loop().call_soon(call_after_ticks, ticks - 1, callback, *args)
@@ -8,11 +8,19 @@ from strawberry_django_dataloaders.core.dataloader import BaseDataLoader
 if TYPE_CHECKING:
     from django.db.models import Model as DjangoModel  # pragma: nocover
 
+# batch scheduling options of the dataloaders (see `BaseDataLoader`), accepted by the model dataloader factories
+SCHEDULING_OPTIONS: tuple[str, ...] = ("max_batch_size", "batch_window", "batch_ticks", "dispatch_when_idle")
+
 
 class BaseDataLoaderFactory:
     loader_class: Type["BaseDataLoader"]
     registered_dataloaders: dict[Hashable, Type["BaseDataLoader"]] = {}
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # each factory keeps its own registry, so that loader keys of different factories can't collide
+        cls.registered_dataloaders = {}
+
     @classmethod
     def get_loader_class(cls, *args, **kwargs) -> Type["BaseDataLoader"]:
         """Generates dataloader classes at runtime when they are used the first time, later gets them from cache."""
@@ -51,11 +59,46 @@ class BaseDataLoaderFactory:
             @strawberry.django.type(models.User)
             class UserType:
                 favourite_fruit = strawberry.django.field(resolver=<Factory>.as_resolver(args, kwargs))
+
+        Django model dataloader factories accept `projection=True`, which makes the resolver load only the model
+        fields selected in the GraphQL query (see `selection.get_selected_only_fields`).
         """
         raise NotImplementedError  # pragma: nocover
 
 
 class BaseDjangoModelDataLoaderFactory(BaseDataLoaderFactory):
+    """
+    Base factory of Django model dataloaders. Besides their own kwargs, the factories accept options common to all
+    the model dataloaders - `row_mode`, `using` (database alias) and `django_type` (strawberry-django type whose
+    `get_queryset` filters the batch queries), which become part of the loader key. So do the batch scheduling
+    options (`max_batch_size`, `batch_window`, `batch_ticks` and `dispatch_when_idle`, see `BaseDataLoader`):
+        PKDataLoaderFactory.get_loader_class(models.Color, batch_ticks=3)
+    """
+
+    @classmethod
+    def get_loader_options_key(cls, **kwargs) -> str:
+        """Return the part of the loader key given by the options common to model dataloaders (empty by default)."""
+        key = "-rows" if kwargs.get("row_mode") else ""
+        if kwargs.get("using"):
+            key += f"@{kwargs['using']}"
+        django_type = kwargs.get("django_type")
+        if django_type is not None:
+            key += f"-{django_type.__module__}.{django_type.__qualname__}"
+        scheduling = [f"{name}={kwargs[name]}" for name in SCHEDULING_OPTIONS if kwargs.get(name) is not None]
+        if scheduling:
+            key += f"-{','.join(scheduling)}"
+        return key
+
+    @classmethod
+    def get_loader_options(cls, **kwargs) -> dict[str, Any]:
+        """Return dataloader class attributes given by the options common to model dataloaders."""
+        return {
+            "row_mode": kwargs.get("row_mode", False),
+            "using": kwargs.get("using"),
+            "django_type": kwargs.get("django_type"),
+            **{name: kwargs[name] for name in SCHEDULING_OPTIONS if kwargs.get(name) is not None},
+        }
+
     @classmethod
     def get_loader_class(
         cls,
@@ -0,0 +1,22 @@
+from typing import Any
+
+from django.db.models import Lookup
+
+
+class ArrayAny(Lookup):
+    """
+    `<field> = ANY(%s)` lookup passing all the values as a single array parameter (PostgreSQL only).
+    Unlike `IN (%s, %s, ...)`, the statement is the same for any number of values,
+    so it doesn't hit the limit of query parameters and its query plan can be reused.
+
+    Usage: `queryset.filter(ArrayAny(F("pk"), [1, 2, 3]))`
+    """
+
+    lookup_name = "any"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection) -> tuple[str, list[Any]]:
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        field = self.lhs.output_field
+        values = [field.get_db_prep_value(value, connection, prepared=False) for value in self.rhs]
+        return f"{lhs} = ANY(%s)", [*lhs_params, values]
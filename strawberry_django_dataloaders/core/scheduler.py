@@ -0,0 +1,103 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Hashable, Optional, Type
+
+from django.db.models import Q
+
+from strawberry_django_dataloaders import instrumentation
+from strawberry_django_dataloaders.core.backends import evaluate_queryset
+from strawberry_django_dataloaders.rows import as_rows
+
+if TYPE_CHECKING:
+    from django.db.models import Lookup  # pragma: nocover
+    from django.db.models import Model as DjangoModel  # pragma: nocover
+
+    from strawberry_django_dataloaders.core.dataloader import BaseDjangoModelDataLoader  # pragma: nocover
+
+
+@dataclass
+class PendingFetch:
+    """Instances requested by a dataloader batch, waiting to be fetched by a fused query."""
+
+    loader: Type["BaseDjangoModelDataLoader"]
+    keys: int  # number of keys, counted against the keys limit of the fused query
+    filter: "Q | Lookup"
+    only: Optional[frozenset[str]]
+    future: asyncio.Future = field(default_factory=lambda: asyncio.get_running_loop().create_future())
+
+
+class BatchScheduler:
+    """
+    Fuses the batches of different dataloaders of the same model (e.g. a PK dataloader and reverse FK dataloaders
+    of the model), dispatched in the same event loop iteration, into a single query.
+
+    The query selects rows matching any of the batch filters (OR'ed), with the union of their projections,
+    and each dataloader pairs the rows with its keys (`get_batch_results`), ignoring the rows of the other batches.
+    Only the batches of the same database alias, execution backend and row mode are fused, up to the keys limit
+    of a single query (`get_max_keys_per_query`). The scheduler is kept in `DataloaderContext.batch_scheduler`.
+    """
+
+    def __init__(self):
+        self._pending: dict[Hashable, list[PendingFetch]] = {}
+
+    async def fetch(
+        self,
+        loader: Type["BaseDjangoModelDataLoader"],
+        keys_filter: "Q | Lookup",
+        keys: int,
+        only: Optional[frozenset[str]] = None,
+    ) -> list["DjangoModel"]:
+        """Return instances matching `keys_filter` (and possibly other instances of the model)."""
+        group = (
+            loader.model,
+            loader.get_db_alias(),
+            loader.get_execution_backend(),
+            loader.row_mode,
+        )
+        pending = PendingFetch(loader, keys, keys_filter, only)
+        if group not in self._pending:
+            self._pending[group] = []
+            # the flush runs in the next loop iteration, after the other batches dispatched in this one
+            asyncio.get_running_loop().call_soon(asyncio.ensure_future, self._flush(group))
+        self._pending[group].append(pending)
+        return await pending.future
+
+    async def _flush(self, group: Hashable) -> None:
+        pending = self._pending.pop(group)
+        max_keys = pending[0].loader.get_max_keys_per_query()
+        chunk: list[PendingFetch] = []
+        for fetch in pending:
+            if chunk and max_keys is not None and sum(f.keys for f in chunk) + fetch.keys > max_keys:
+                await self._fetch_fused(chunk)
+                chunk = []
+            chunk.append(fetch)
+        await self._fetch_fused(chunk)
+
+    @staticmethod
+    async def _fetch_fused(pending: list[PendingFetch]) -> None:
+        loader = pending[0].loader
+        only: Optional[frozenset[str]] = frozenset()
+        for fetch in pending:
+            only = None if only is None or fetch.only is None else only | fetch.only
+        started_at = time.perf_counter()
+        try:
+            queryset = loader.get_queryset(only=only).filter(reduce(or_, (_as_q(f.filter) for f in pending)))
+            queryset = queryset.order_by("pk")
+            if loader.row_mode:
+                queryset = as_rows(queryset)
+            instances = await evaluate_queryset(queryset, loader.get_execution_backend())
+        except Exception as e:
+            for fetch in pending:
+                fetch.future.set_exception(e)
+            return
+        # counted in the statistics of the batch which scheduled the flush (the context is copied from its task)
+        instrumentation.record_query(len(instances), time.perf_counter() - started_at)
+        for fetch in pending:
+            fetch.future.set_result(instances)
+
+
+def _as_q(keys_filter: "Q | Lookup") -> Q:
+    return keys_filter if isinstance(keys_filter, Q) else Q(keys_filter)
@@ -0,0 +1,164 @@
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import Lookup
+from django.db.models.query import ModelIterable
+
+from strawberry_django_dataloaders.core.cache import BoundedCache
+from strawberry_django_dataloaders.settings import get_setting
+
+if TYPE_CHECKING:
+    from django.db.models import Field, QuerySet  # pragma: nocover
+    from django.db.models import Model as DjangoModel  # pragma: nocover
+
+_statements: Optional[BoundedCache] = None
+_statements_lock = threading.Lock()
+
+
+class _KeyParameter:
+    """Placeholder of a key in the parameters of a compiled statement."""
+
+    def __repr__(self) -> str:
+        return "<key>"
+
+
+KEY_PARAMETER = _KeyParameter()
+
+
+class StatementKeys:
+    """
+    Keys passed to `get_batch_queryset` when the batch statement is being prepared. `get_keys_filter` turns them
+    into `count` key placeholders (`IN (%s, ...)`), or into a single array placeholder (`= ANY(%s)`) if `count` is None.
+    """
+
+    def __init__(self, count: Optional[int] = None):
+        self.count = count
+        self.field: Optional["Field"] = None  # field the keys are compared with, set when the statement is compiled
+
+    def __len__(self) -> int:
+        return self.count or 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count})"
+
+
+class StatementKeysLookup(Lookup):
+    """`<field> IN (%s, ...)` / `<field> = ANY(%s)` lookup of the `StatementKeys` placeholders."""
+
+    lookup_name = "statement_keys"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection) -> tuple[str, list[Any]]:
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        keys: StatementKeys = self.rhs
+        keys.field = self.lhs.output_field
+        if keys.count is None:
+            return f"{lhs} = ANY(%s)", [*lhs_params, KEY_PARAMETER]
+        return f"{lhs} IN ({', '.join(['%s'] * keys.count)})", [*lhs_params, *[KEY_PARAMETER] * keys.count]
+
+
+class PreparedStatement:
+    """
+    SQL of a dataloader batch query compiled once, executed with the parameters of the keys only.
+    Rows are converted by the DB backend converters of the selected columns and turned into model instances
+    by `Model.from_db`, the same way as the queryset would do it.
+
+    Batches with fewer keys than the placeholders of the statement repeat the last key (which doesn't change
+    the result of `IN (...)`), so that a few statements (see `BaseDjangoModelDataLoader.get_statement_keys_count`)
+    serve any number of keys.
+    """
+
+    def __init__(self, queryset: "QuerySet", keys: StatementKeys):
+        self.using: str = queryset.db
+        self.model: type["DjangoModel"] = queryset.model
+        self.keys_count = keys.count
+        compiler = queryset.query.get_compiler(using=self.using)
+        sql, params = compiler.as_sql()
+        if keys.field is None:
+            raise ValueError("The batch queryset isn't filtered by the keys.")
+        self.keys_field: "Field" = keys.field
+        self.sql: str = sql
+        self.params: list[Any] = list(params)
+        self.key_positions: list[int] = [i for i, param in enumerate(self.params) if param is KEY_PARAMETER]
+        select = compiler.select[: compiler.col_count]
+        select_fields = compiler.klass_info["select_fields"]
+        self.model_fields = slice(select_fields[0], select_fields[-1] + 1)
+        self.field_names: list[str] = [column[0].target.attname for column in select[self.model_fields]]
+        self.annotation_col_map: dict[str, int] = dict(compiler.annotation_col_map)
+        self.converters: list[tuple[int, list[Callable], Any]] = [
+            (position, converters, expression)
+            for position, (converters, expression) in compiler.get_converters([column[0] for column in select]).items()
+        ]
+
+    @classmethod
+    def prepare(cls, queryset: "QuerySet", keys: StatementKeys) -> Optional["PreparedStatement"]:
+        """Compile the batch queryset, None if it can't be prepared (e.g. it doesn't return model instances)."""
+        if queryset._iterable_class is not ModelIterable or queryset.query.select_related:
+            return None
+        try:
+            return cls(queryset, keys)
+        except (EmptyResultSet, ValueError):
+            return None
+
+    def get_params(self, keys: list[Any]) -> list[Any]:
+        connection = connections[self.using]
+        values = [self.keys_field.get_db_prep_value(key, connection, prepared=False) for key in keys]
+        params = self.params.copy()
+        if self.keys_count is None:
+            params[self.key_positions[0]] = values
+        else:
+            values.extend([values[-1]] * (self.keys_count - len(values)))
+            for position, value in zip(self.key_positions, values):
+                params[position] = value
+        return params
+
+    def execute(self, keys: list[Any]) -> list["DjangoModel"]:
+        """Fetch the instances of the (at most `keys_count`, at least one) keys."""
+        connection = connections[self.using]
+        with connection.cursor() as cursor:
+            cursor.execute(self.sql, self.get_params(keys))
+            rows = cursor.fetchall()
+        instances = []
+        for row in rows:
+            if self.converters:
+                row = list(row)
+                for position, converters, expression in self.converters:
+                    value = row[position]
+                    for converter in converters:
+                        value = converter(value, expression, connection)
+                    row[position] = value
+            instance = self.model.from_db(self.using, self.field_names, row[self.model_fields])
+            for name, position in self.annotation_col_map.items():
+                setattr(instance, name, row[position])
+            instances.append(instance)
+        return instances
+
+
+def get_prepared_statement(
+    key: Hashable,
+    prepare: Callable[[], Optional[PreparedStatement]],
+) -> Optional[PreparedStatement]:
+    """
+    Return the statement cached under the `key`, prepare (and cache) it by `prepare` if there is none.
+    At most `PREPARED_STATEMENTS_MAX_ENTRIES` statements are kept (least recently used are dropped first).
+    """
+    global _statements
+    with _statements_lock:
+        if _statements is None:
+            _statements = BoundedCache(max_entries=get_setting("PREPARED_STATEMENTS_MAX_ENTRIES"))
+        cached = _statements.get(key)
+    if cached is not None:
+        return cached[0]
+    statement = prepare()
+    with _statements_lock:
+        _statements.set(key, (statement,))  # wrapped, as None (can't be prepared) is cached too
+    return statement
+
+
+def clear_prepared_statements() -> None:
+    """Drop all the cached statements (e.g. after the `get_queryset` of a dataloader changed)."""
+    global _statements
+    with _statements_lock:
+        _statements = None
@@ -1,9 +1,27 @@
+import time
 from collections import defaultdict
+from enum import Enum
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Collection, Mapping, NamedTuple, Optional
 
+import django
 from asgiref.sync import sync_to_async
+from django.db.models import Aggregate as DjangoAggregate
+from django.db.models import Avg, Count, F, Max, Min
 from django.db.models import Model as DjangoModel
+from django.db.models import OrderBy, QuerySet, Sum, Window
+from django.db.models.functions import RowNumber
 
-from strawberry_django_dataloaders.core.dataloader import BaseDjangoModelDataLoader
+from strawberry_django_dataloaders import instrumentation
+from strawberry_django_dataloaders.arguments import QueryArguments
+from strawberry_django_dataloaders.core.dataloader import BaseDjangoModelDataLoader, _query_info
+from strawberry_django_dataloaders.identity_map import get_loaded_fields
+from strawberry_django_dataloaders.rows import as_rows
+from strawberry_django_dataloaders.shared_cache import SharedModelCache
+
+if TYPE_CHECKING:
+    from strawberry.dataloader import Batch  # pragma: nocover
+    from strawberry.types import Info  # pragma: nocover
 
 
 class BasicPKDataLoader(BaseDjangoModelDataLoader):
@@ -24,18 +42,232 @@ class BasicPKDataLoader(BaseDjangoModelDataLoader):
             async def travian_alliance(self: "models.TravianAccount", info: "Info") -> list["TravianVillageType"]:
                 return await BasicPKTravianAllianceDataLoader(context=info.context).load(self.travian_alliance_id)
 
+    SHARED CACHE:
+        Instances of rarely changing models (e.g. a list of countries) can be additionally cached across requests
+        in the Django cache framework - set `shared_cache = True`. Only the keys not found in the cache are fetched
+        from the database (always with all the fields, regardless of the requested projection). Cached instances
+        are invalidated on `post_save`, `post_delete` and `m2m_changed` signals of the model.
+        Use `shared_cache.invalidate_model` after bulk operations which don't send signals (e.g. `QuerySet.update()`).
+        At most `shared_cache_max_entries` instances are cached, the oldest ones are evicted first
+        (see `shared_cache.SharedModelCache`).
+
+    IDENTITY MAP:
+        Instances already loaded within the request by any dataloader (e.g. a reverse FK dataloader of the same model)
+        are taken from the request identity map, without querying the database.
     """
 
+    shared_cache: bool = False
+    shared_cache_timeout: Optional[int] = 300  # seconds, None means no expiration
+    shared_cache_max_entries: Optional[int] = 10_000  # max number of cached instances of the model
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.shared_cache and cls.model is not NotImplemented:
+            # connect the invalidation signals right away, writes may happen before any batch is loaded
+            SharedModelCache.register(cls.model)
+
+    def load(
+        self,
+        key: Any,
+        only: Optional[Collection[str]] = None,
+        select_related: Optional[Mapping[str, type[BaseDjangoModelDataLoader]]] = None,
+        info: Optional["Info"] = None,
+    ) -> Awaitable:
+        if (
+            self.uses_identity_map()
+            and self.django_type is None
+            and key not in self._pending_only
+            and self.cache_map.get(key) is None
+        ):
+            instance = self.context.identity_map.get(self.model, key, only=only)
+            if instance is not None:
+                self.prime(key, instance)
+                self._loaded_only[key] = get_loaded_fields(instance)
+        if self.shared_cache:
+            select_related = None  # the joined instances would be cached across requests too
+        return super().load(key, only=only, select_related=select_related, info=info)
+
+    def prime_instance(self, instance: "DjangoModel") -> None:
+        """Prime the dataloader with an instance loaded by another dataloader (e.g. joined by `select_related`)."""
+        if self.uses_identity_map():
+            instance = self.context.identity_map.add(instance)
+        if self.cache and self.cache_map.get(instance.pk) is None:
+            self.prime(instance.pk, instance)
+            self._loaded_only[instance.pk] = get_loaded_fields(instance)
+
+    @classmethod
+    def get_shared_cache(cls) -> SharedModelCache:
+        return SharedModelCache(cls.model, timeout=cls.shared_cache_timeout, max_entries=cls.shared_cache_max_entries)
+
     @classmethod
-    @sync_to_async
-    def load_fn(cls, keys: list[str]) -> list[DjangoModel | None]:
-        instances: list["DjangoModel"] = list(cls.model.objects.filter(pk__in=keys))
+    async def load_fn(cls, keys: list[str], only: Optional[Collection[str]] = None) -> list[DjangoModel | None]:
+        if not cls.shared_cache:
+            return await super().load_fn(keys, only=only)
+        shared_cache = cls.get_shared_cache()
+        instances: dict[str, "DjangoModel"] = await sync_to_async(shared_cache.get_many, thread_sensitive=False)(keys)
+        missing_keys = [key for key in keys if key not in instances]
+        if missing_keys:
+            fetched = await super().load_fn(missing_keys)
+            fetched_instances = {key: inst for key, inst in zip(missing_keys, fetched) if inst is not None}
+            await sync_to_async(shared_cache.set_many, thread_sensitive=False)(fetched_instances)
+            instances.update(fetched_instances)
+        return [instances.get(key) for key in keys]
+
+    @classmethod
+    def get_batch_queryset(cls, keys: list[str], only: Optional[Collection[str]] = None) -> QuerySet:
+        return cls.get_queryset(only=only).filter(cls.get_keys_filter("pk", keys))
+
+    @classmethod
+    def get_fusable_filter(cls, keys: list[str], **kwargs: Any) -> Any:
+        return cls.get_keys_filter("pk", keys)
+
+    @classmethod
+    def get_batch_results(cls, keys: list[str], instances: list["DjangoModel"]) -> list[DjangoModel | None]:
         # ensure instances are ordered in the same way as input 'keys'
         id_to_instance: dict[str, "DjangoModel"] = {inst.pk: inst for inst in instances}
         return [id_to_instance.get(id_) for id_ in keys]
 
 
-class BasicReverseFKDataLoader(BaseDjangoModelDataLoader):
+class BasicUniqueFieldDataLoader(BaseDjangoModelDataLoader):
+    """
+    Base loader of instances by a unique field other than the primary key, returning an instance or None per key.
+    Used for foreign keys with `to_field` and for the reverse side of one-to-one relationships.
+
+    EXAMPLE - load the fruit of a fruit plant (reverse side of `Fruit.plant` one-to-one field):
+        1. DATALOADER DEFINITION
+        class PlantFruitDataLoader(BasicUniqueFieldDataLoader):
+            model = Fruit
+            field = "plant_id"
+
+        2. USAGE
+        @strawberry.django.type(models.FruitPlant)
+        class FruitPlantType:
+            ...
+
+            @strawberry.field
+            async def fruit(self: "models.FruitPlant", info: "Info") -> Optional["FruitType"]:
+                return await PlantFruitDataLoader(context=info.context).load(self.pk)
+    """
+
+    field: str  # attname of the unique field the instances are loaded by
+
+    @classmethod
+    def get_required_only_fields(cls) -> frozenset[str]:
+        return super().get_required_only_fields() | {cls.field}
+
+    @classmethod
+    def get_batch_queryset(cls, keys: list[Any], only: Optional[Collection[str]] = None) -> QuerySet:
+        return cls.get_queryset(only=only).filter(cls.get_keys_filter(cls.field, keys))
+
+    @classmethod
+    def get_fusable_filter(cls, keys: list[Any], **kwargs: Any) -> Any:
+        return cls.get_keys_filter(cls.field, keys)
+
+    @classmethod
+    def get_batch_results(cls, keys: list[Any], instances: list["DjangoModel"]) -> list[DjangoModel | None]:
+        key_to_instance: dict[Any, "DjangoModel"] = {getattr(inst, cls.field): inst for inst in instances}
+        return [key_to_instance.get(key) for key in keys]
+
+    def prime_instance(self, instance: "DjangoModel") -> None:
+        """Prime the dataloader with an instance loaded by another dataloader (e.g. joined by `select_related`)."""
+        if self.uses_identity_map():
+            instance = self.context.identity_map.add(instance)
+        key = getattr(instance, self.field)
+        if self.cache and key is not None and self.cache_map.get(key) is None:
+            self.prime(key, instance)
+            self._loaded_only[key] = get_loaded_fields(instance)
+
+
+SUPPORTS_WINDOW_FILTERING: bool = django.VERSION >= (4, 2)
+
+
+class RelatedPage(NamedTuple):
+    """
+    Key of a page of related instances - at most `limit` instances of the 'parent' `key`, skipping `offset`,
+    filtered and ordered by the `arguments` (strawberry-django filter and order input), if given.
+    """
+
+    key: Any
+    offset: int = 0
+    limit: Optional[int] = None
+    arguments: Optional[QueryArguments] = None
+
+
+class BaseRelatedListDataLoader(BaseDjangoModelDataLoader):
+    """
+    Base loader of lists of related instances (reverse FK and many-to-many relationships).
+
+    The lists are ordered by `order_by` (and primary key). Loading a `RelatedPage` key instead of the 'parent' key
+    loads just a page of the list - the pages of all the 'parents' are loaded in a single query, which limits
+    the number of rows per 'parent' in SQL, using `ROW_NUMBER() OVER (PARTITION BY <reverse_path> ORDER BY ...)`.
+    The `RelatedPage` key can also carry filter and order `arguments`, applied in the batch query as well
+    (the order input takes precedence over `order_by`).
+    Keys with different offset/limit or arguments within a batch are loaded by separate queries.
+    """
+
+    reverse_path: str
+    order_by: tuple[str, ...] = ()
+    row_number_annotation: str = "dataloader_row_number"
+
+    @classmethod
+    async def load_fn(cls, keys: list[Any], only: Optional[Collection[str]] = None) -> list[list[DjangoModel]]:
+        parent_keys_by_page: dict[tuple[int, Optional[int], Optional[QueryArguments]], list[Any]] = defaultdict(list)
+        for key in dict.fromkeys(keys):
+            page = key if isinstance(key, RelatedPage) else RelatedPage(key)
+            parent_keys_by_page[(page.offset, page.limit, page.arguments)].append(page.key)
+
+        pages: dict[RelatedPage, list[DjangoModel]] = {}
+        for (offset, limit, arguments), parent_keys in parent_keys_by_page.items():
+            fetch_kwargs = {"arguments": arguments} if arguments is not None else {}
+            instances = await cls.fetch_instances(parent_keys, only=only, offset=offset, limit=limit, **fetch_kwargs)
+            for parent_key, related in zip(parent_keys, cls.get_batch_results(parent_keys, instances)):
+                # slicing in SQL isn't supported by older Django versions
+                stop = offset + limit if limit is not None else None
+                pages[RelatedPage(parent_key, offset, limit, arguments)] = (
+                    related if SUPPORTS_WINDOW_FILTERING else related[offset:stop]
+                )
+        return [pages[key if isinstance(key, RelatedPage) else RelatedPage(key)] for key in keys]
+
+    @classmethod
+    def get_batch_queryset(
+        cls,
+        keys: list[Any],
+        only: Optional[Collection[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        arguments: Optional[QueryArguments] = None,
+    ) -> QuerySet:
+        queryset = cls.get_related_queryset(keys, only=only)
+        order_by = cls.order_by
+        if arguments is not None:
+            queryset = arguments.filter(queryset, info=_query_info.get())
+            order_by = (*arguments.get_order_by(), *order_by)
+        queryset = queryset.order_by(*order_by, "pk")
+        if (offset == 0 and limit is None) or not SUPPORTS_WINDOW_FILTERING:
+            return queryset
+        row_number = Window(
+            RowNumber(),
+            partition_by=[F(cls.reverse_path)],
+            order_by=[_to_order_by(field) for field in (*order_by, "pk")],
+        )
+        queryset = queryset.annotate(**{cls.row_number_annotation: row_number})
+        queryset = queryset.filter(**{f"{cls.row_number_annotation}__gt": offset})
+        if limit is not None:
+            queryset = queryset.filter(**{f"{cls.row_number_annotation}__lte": offset + limit})
+        return queryset
+
+    @classmethod
+    def uses_prepared_statements(cls, arguments: Optional[QueryArguments] = None, **kwargs: Any) -> bool:
+        # custom filter methods of the arguments may depend on the request
+        return arguments is None and super().uses_prepared_statements(**kwargs)
+
+    @classmethod
+    def get_related_queryset(cls, keys: list[Any], only: Optional[Collection[str]] = None) -> QuerySet:
+        """Return queryset of all the related instances of the 'parent' keys."""
+        raise NotImplementedError  # pragma: nocover
+
+
+class BasicReverseFKDataLoader(BaseRelatedListDataLoader):
     """
     Base loader for reversed FK relationship (e.g. get BlogPosts of a User).
 
@@ -53,16 +285,279 @@ class BasicReverseFKDataLoader(BaseDjangoModelDataLoader):
             @strawberry.field
             async def blog_posts(self: "models.User", info: "Info") -> list["BlogPostType"]:
                 return await BlogPostsBasicReverseFKDataLoader(context=info.context).load(self.pk)
+
+    STREAMING:
+        For export-like queries returning all the related instances of many 'parents', `stream(keys)` reads
+        the instances ordered by `reverse_path` through `QuerySet.iterator(chunk_size=stream_chunk_size)`
+        (server-side cursors on PostgreSQL) and yields the related instances of each 'parent' as soon as its group
+        is complete, so that the memory is bounded by the chunk size (and the largest group), not by the total result.
+        With `streaming = True`, the dataloader resolves `load(key)` of each 'parent' as soon as its group is read
+        (batches of `RelatedPage` keys are loaded as usual). The instances aren't added to the identity map
+        and the dataloader doesn't cache the resolved lists (`use_cache` is ignored).
+        The queries are run by `sync_to_async` (the cursor can't move between threads), regardless of
+        the `execution_backend`.
     """
 
     reverse_path: str  # path to the 'parent' model from the reverse relationship
+    streaming: bool = False
+    stream_chunk_size: int = 2000
+
+    def __init__(self, *args, **kwargs):
+        if self.streaming:
+            kwargs["cache"] = False  # the streamed lists would be kept for the lifetime of the context
+        super().__init__(*args, **kwargs)
+
+    def uses_identity_map(self) -> bool:
+        return not self.streaming and super().uses_identity_map()
+
+    async def dispatch_batch(self, batch: "Batch") -> None:
+        keys = [task.key for task in batch.tasks]
+        if not self.streaming or not keys or any(isinstance(key, RelatedPage) for key in keys):
+            await super().dispatch_batch(batch)
+            return
+        batch.dispatched = True
+        tasks_by_key: dict[Any, list] = defaultdict(list)
+        for task in batch.tasks:
+            tasks_by_key[task.key].append(task)
+        try:
+            with self._batch_scope(keys, tasks_by_key):
+                only = self._pop_batch_only(keys, tasks_by_key)
+                select_related = self._pop_batch_select_related()
+                if only is not None:
+                    only = only | self.get_required_only_fields() | {path.split("__")[0] for path in select_related}
+                with self._batch_query_scope(select_related):
+                    async for key, instances in self.stream(list(tasks_by_key), only=only):
+                        if select_related:
+                            self.prime_select_related([instances], select_related)
+                        for task in tasks_by_key.pop(key, ()):
+                            if not task.future.cancelled():
+                                task.future.set_result(instances)
+        except Exception as e:
+            for tasks in tasks_by_key.values():
+                for task in tasks:
+                    if not task.future.done():
+                        task.future.set_exception(e)
+
+    @classmethod
+    async def stream(
+        cls,
+        keys: list[Any],
+        only: Optional[Collection[str]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[tuple[Any, list[DjangoModel]]]:
+        """
+        Yield `(key, related instances)` of each of the (unique) keys, the 'parents' with related instances
+        in the order of `reverse_path`, followed by those without any (of each chunk of the keys,
+        see `get_keys_chunks`).
+        """
+        chunk_size = chunk_size or cls.stream_chunk_size
+        for keys_chunk in cls.get_keys_chunks(list(dict.fromkeys(keys))):
+            started_at = time.perf_counter()
+            queryset = cls.get_batch_queryset(keys_chunk, only=only)
+            queryset = queryset.order_by(cls.reverse_path, *queryset.query.order_by)
+            if cls.row_mode:
+                queryset = as_rows(queryset)
+            iterator = queryset.iterator(chunk_size=chunk_size)
+            # thread sensitive - the cursor is used by a single thread
+            fetch_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)))
+            missing_keys = dict.fromkeys(keys_chunk)
+            rows = 0
+            group_key, group = None, []
+            try:
+                while instances := await fetch_chunk():
+                    rows += len(instances)
+                    for instance in instances:
+                        key = getattr(instance, cls.reverse_path)
+                        if group and key != group_key:
+                            missing_keys.pop(group_key, None)
+                            yield group_key, group
+                            group = []
+                        group_key = key
+                        group.append(instance)
+            finally:
+                await sync_to_async(iterator.close)()
+            instrumentation.record_query(rows, time.perf_counter() - started_at)
+            if group:
+                missing_keys.pop(group_key, None)
+                yield group_key, group
+            for key in missing_keys:
+                yield key, []
+
+    @classmethod
+    def get_required_only_fields(cls) -> frozenset[str]:
+        return super().get_required_only_fields() | {cls.reverse_path}
+
+    @classmethod
+    def get_related_queryset(cls, keys: list[str], only: Optional[Collection[str]] = None) -> QuerySet:
+        return cls.get_queryset(only=only).filter(cls.get_keys_filter(cls.reverse_path, keys))
+
+    @classmethod
+    def get_fusable_filter(
+        cls,
+        keys: list[str],
+        offset: int = 0,
+        limit: Optional[int] = None,
+        arguments: Optional[QueryArguments] = None,
+        **kwargs: Any,
+    ) -> Any:
+        # the fused query is ordered by the primary key only, can't be paginated per 'parent' nor filtered
+        if cls.order_by or offset or limit is not None or arguments is not None:
+            return None
+        return cls.get_keys_filter(cls.reverse_path, keys)
 
     @classmethod
-    @sync_to_async
-    def load_fn(cls, keys: list[str]) -> list[list[DjangoModel]]:
-        instances: list["DjangoModel"] = list(cls.model.objects.filter(**{f"{cls.reverse_path}__in": keys}))
+    def get_batch_results(cls, keys: list[str], instances: list["DjangoModel"]) -> list[list[DjangoModel]]:
         # ensure that instances are ordered the same way as input 'ids'
         id_to_instances: dict[str, list["DjangoModel"]] = defaultdict(list)
         for instance in instances:
             id_to_instances[getattr(instance, cls.reverse_path)].append(instance)
         return [id_to_instances.get(key, []) for key in keys]
+
+
+class BasicM2MDataLoader(BaseRelatedListDataLoader):
+    """
+    Base loader for many-to-many relationship (e.g. get Tags of a BlogPost, or BlogPosts of a Tag).
+    Loads the related instances of all the keys in a single query (joining the through table) with the key
+    of the 'parent' instance annotated on each row.
+
+    EXAMPLE - load tags of blog post:
+        CONSIDER DJANGO MODELS:
+            class BlogPost(models.Model):
+                tags = models.ManyToManyField("Tag", related_name="blog_posts")
+
+        1. DATALOADER DEFINITION
+        class BlogPostTagsBasicM2MDataLoader(BasicM2MDataLoader):
+            model = Tag
+            reverse_path = 'blog_posts'  # the reverse side would be `model = BlogPost` and `reverse_path = 'tags'`
+
+        2. USAGE
+        @strawberry.django.type(models.BlogPost)
+        class BlogPostType:
+            ...
+
+            @strawberry.field
+            async def tags(self: "models.BlogPost", info: "Info") -> list["TagType"]:
+                return await BlogPostTagsBasicM2MDataLoader(context=info.context).load(self.pk)
+    """
+
+    reverse_path: str  # query path from the loaded model to the 'parent' model of the many-to-many relationship
+    parent_key_annotation: str = "dataloader_parent_key"
+
+    @classmethod
+    def get_related_queryset(cls, keys: list[str], only: Optional[Collection[str]] = None) -> QuerySet:
+        return (
+            cls.get_queryset(only=only)
+            .filter(cls.get_keys_filter(cls.reverse_path, keys))
+            .annotate(**{cls.parent_key_annotation: F(cls.reverse_path)})
+        )
+
+    @classmethod
+    def get_batch_results(cls, keys: list[str], instances: list["DjangoModel"]) -> list[list[DjangoModel]]:
+        # ensure that instances are ordered the same way as input 'ids'
+        id_to_instances: dict[str, list["DjangoModel"]] = defaultdict(list)
+        for instance in instances:
+            id_to_instances[getattr(instance, cls.parent_key_annotation)].append(instance)
+        return [id_to_instances.get(key, []) for key in keys]
+
+
+class Aggregate(str, Enum):
+    COUNT = "count"
+    EXISTS = "exists"
+    SUM = "sum"
+    MAX = "max"
+    MIN = "min"
+    AVG = "avg"
+
+
+class BasicRelatedAggregateDataLoader(BaseDjangoModelDataLoader):
+    """
+    Base loader of an aggregate of related instances (reverse FK or many-to-many relationships),
+    e.g. number of BlogPosts of a User. Loads the values of all the keys in a single `GROUP BY reverse_path` query.
+    'Parents' without any related instance get 0 (count), False (exists) or None (other aggregates).
+
+    EXAMPLE - load max rating of user's blog posts:
+        1. DATALOADER DEFINITION
+        class BlogPostsMaxRatingDataLoader(BasicRelatedAggregateDataLoader):
+            model = BlogPost
+            reverse_path = 'user_id'
+            aggregate = Aggregate.MAX
+            aggregate_field = 'rating'
+
+        2. USAGE
+        @strawberry.django.type(models.User)
+        class UserType:
+            ...
+
+            @strawberry.field
+            async def blog_posts_max_rating(self: "models.User", info: "Info") -> Optional[int]:
+                return await BlogPostsMaxRatingDataLoader(context=info.context).load(self.pk)
+    """
+
+    reverse_path: str  # query path from the aggregated model to the 'parent' model
+    aggregate: Aggregate = Aggregate.COUNT
+    aggregate_field: str = "pk"  # field of the aggregated model, not used by count and exists
+    value_annotation: str = "dataloader_value"
+
+    @classmethod
+    def get_aggregate_expression(cls) -> DjangoAggregate:
+        aggregate = Aggregate(cls.aggregate)
+        if aggregate in (Aggregate.COUNT, Aggregate.EXISTS):
+            return Count("pk")
+        return {Aggregate.SUM: Sum, Aggregate.MAX: Max, Aggregate.MIN: Min, Aggregate.AVG: Avg}[aggregate](
+            cls.aggregate_field
+        )
+
+    @classmethod
+    def get_default_value(cls) -> Any:
+        """Value of the 'parents' without any related instance."""
+        return {Aggregate.COUNT: 0, Aggregate.EXISTS: False}.get(Aggregate(cls.aggregate))
+
+    @classmethod
+    def get_batch_queryset(cls, keys: list[Any], only: Optional[Collection[str]] = None) -> QuerySet:
+        return (
+            cls.get_queryset()
+            .filter(cls.get_keys_filter(cls.reverse_path, keys))
+            .order_by()  # default ordering of the model would be added to GROUP BY
+            .values(cls.reverse_path)
+            .annotate(**{cls.value_annotation: cls.get_aggregate_expression()})
+        )
+
+    @classmethod
+    def get_batch_results(cls, keys: list[Any], instances: list[dict[str, Any]]) -> list[Any]:
+        key_to_value = {row[cls.reverse_path]: row[cls.value_annotation] for row in instances}
+        if Aggregate(cls.aggregate) == Aggregate.EXISTS:
+            return [key in key_to_value for key in keys]
+        return [key_to_value.get(key, cls.get_default_value()) for key in keys]
+
+
+class ReverseFKCountDataLoader(BasicRelatedAggregateDataLoader):
+    """
+    Base loader of the number of instances in a reversed FK relationship (e.g. number of BlogPosts of a User).
+
+    EXAMPLE:
+        class UserBlogPostsCountDataLoader(ReverseFKCountDataLoader):
+            model = BlogPost
+            reverse_path = 'user_id'
+    """
+
+    aggregate = Aggregate.COUNT
+
+
+class M2MCountDataLoader(BasicRelatedAggregateDataLoader):
+    """
+    Base loader of the number of instances in a many-to-many relationship (e.g. number of Tags of a BlogPost).
+
+    EXAMPLE:
+        class BlogPostTagsCountDataLoader(M2MCountDataLoader):
+            model = Tag
+            reverse_path = 'blog_posts'
+    """
+
+    aggregate = Aggregate.COUNT
+
+
+def _to_order_by(field: str) -> OrderBy:
+    """Convert `QuerySet.order_by()`-like field (e.g. '-name') to an expression."""
+    if field.startswith("-"):
+        return OrderBy(F(field[1:]), descending=True)
+    return OrderBy(F(field))
@@ -10,3 +10,9 @@ class BaseError(Exception):
 class UnsupportedRelationError(BaseError):
     message: str = "Unsupported relation"
     code: str = "unsupported_relation"
+
+
+@dataclass
+class QueryGuardError(BaseError):
+    message: str = "Query budget exceeded or N+1 queries detected"
+    code: str = "query_guard"
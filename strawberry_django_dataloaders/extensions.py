@@ -0,0 +1,18 @@
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+
+class PrimaryDatabaseAfterMutationExtension(SchemaExtension):
+    """
+    Makes dataloaders read from the primary database (`router.db_for_write`) for the rest of the request
+    once a mutation is executed, so that the mutation result doesn't come from a lagging read replica.
+    The execution context needs to be `DataloaderContext`.
+
+    EXAMPLE:
+        schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PrimaryDatabaseAfterMutationExtension])
+    """
+
+    def on_execute(self):
+        if self.execution_context.operation_type == OperationType.MUTATION:
+            self.execution_context.context.use_primary_db = True
+        yield
@@ -1,13 +1,27 @@
-from typing import Callable, Coroutine, Type
+from typing import Awaitable, Callable, Coroutine, Optional, Sequence, Type
 
-from django.db.models import ManyToOneRel
+from django.apps import apps
+from django.db.models import ForeignObjectRel, ManyToManyField, ManyToManyRel, ManyToOneRel, OneToOneRel
 from django.db.models import Model as DjangoModel
 from django.db.models.fields.related import RelatedField
+from strawberry import relay
+from strawberry.relay.types import PREFIX as CONNECTION_CURSOR_PREFIX
 from strawberry.types import Info
 from strawberry_django.fields.field import StrawberryDjangoField
+from strawberry_django.pagination import OffsetPaginationInput
 
+from . import exceptions
 from .core.factory import BaseDjangoModelDataLoaderFactory
-from .dataloaders import BasicPKDataLoader, BasicReverseFKDataLoader
+from .dataloaders import (
+    Aggregate,
+    BasicM2MDataLoader,
+    BasicPKDataLoader,
+    BasicRelatedAggregateDataLoader,
+    BasicReverseFKDataLoader,
+    BasicUniqueFieldDataLoader,
+    RelatedPage,
+)
+from .selection import get_selected_only_fields
 
 
 class PKDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
@@ -36,26 +50,208 @@ class PKDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
 
     @classmethod
     def get_loader_key(cls, model: Type["DjangoModel"], **kwargs):
-        return model
+        options_key = cls.get_loader_options_key(**kwargs)
+        return f"{model}{options_key}" if options_key else model
 
     @classmethod
     def get_loader_class_kwargs(cls, model: Type["DjangoModel"], **kwargs):
         return {
             "model": model,
+            **cls.get_loader_options(**kwargs),
         }
 
     @classmethod
-    def as_resolver(cls) -> Callable[["DjangoModel", Info], Coroutine]:
+    def as_resolver(
+        cls,
+        projection: bool = False,
+        row_mode: bool = False,
+        using: Optional[str] = None,
+    ) -> Callable[["DjangoModel", Info], Coroutine]:
         async def resolver(root: "DjangoModel", info: "Info"):  # beware, first argument needs to be called 'root'
             field_data: "StrawberryDjangoField" = info._field
             relation: "RelatedField" = root._meta.get_field(field_name=field_data.django_name)
-            pk = getattr(root, relation.attname)
-            return await cls.get_loader_class(field_data.django_model)(context=info.context).load(pk)
+            # foreign keys with `to_field` and reverse one-to-one relations are loaded by the unique field
+            loader, key_attname = get_to_one_loader_class(
+                relation, field_data.django_model, row_mode=row_mode, using=using
+            )
+            only = get_selected_only_fields(info) if projection else None
+            return await loader(context=info.context).load(getattr(root, key_attname), only=only)
 
         return resolver
 
 
-class ReverseFKDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
+class UniqueFieldDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
+    """
+    Base factory for dataloaders of instances by a unique field (see `BasicUniqueFieldDataLoader`).
+    Dataloaders are generated per model and `field` (attname of the unique field).
+
+    EXAMPLE:
+        @strawberry.django.type(models.FruitPlant)
+        class FruitPlantType:
+            ...
+            @strawberry.field
+            async def fruit(self: "models.FruitPlant", info: "Info") -> Optional["FruitType"]:
+                loader = UniqueFieldDataLoaderFactory.get_loader_class("tests.Fruit", field="plant_id")
+                return await loader(context=info.context).load(self.pk)
+    """
+
+    loader_class = BasicUniqueFieldDataLoader
+
+    @classmethod
+    def get_loader_key(cls, model: Type["DjangoModel"], **kwargs):
+        return f"{model}-{kwargs['field']}" + cls.get_loader_options_key(**kwargs)
+
+    @classmethod
+    def get_loader_class_kwargs(cls, model: Type["DjangoModel"], **kwargs):
+        return {
+            "model": model,
+            "field": kwargs["field"],
+            **cls.get_loader_options(**kwargs),
+        }
+
+
+class BaseRelatedListDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
+    """
+    Base factory for dataloaders of lists of related instances (reverse FK and many-to-many relationships).
+    Dataloaders are generated per model, `reverse_path` and `order_by`.
+
+    Besides the plain resolver (`as_resolver`), the lists can be paginated (in SQL, per 'parent' instance):
+        - `as_resolver(pagination=True)` adds strawberry-django `pagination: OffsetPaginationInput` argument,
+        - `as_connection_resolver()` resolves a relay `ListConnection` with `first`/`after`/`last`/`before` arguments
+          (`last` needs to be combined with `before`).
+    """
+
+    relation_name: str = "related"
+    # whether the related instances can be aggregated per 'parent' by `RelatedAggregateDataLoaderFactory`
+    supports_aggregates: bool = True
+
+    @classmethod
+    def get_loader_key(cls, model: Type["DjangoModel"], **kwargs):
+        reverse_path = kwargs.get("reverse_path")
+        if not reverse_path:
+            raise ValueError(
+                f"{cls.__name__}: 'reverse_path' not specified for {cls.relation_name} relation of {model.__name__}."
+            )
+        order_by = tuple(kwargs.get("order_by") or ())
+        key = f"{model}-{reverse_path}" + (f"-{','.join(order_by)}" if order_by else "")
+        return key + cls.get_loader_options_key(**kwargs)
+
+    @classmethod
+    def get_loader_class_kwargs(cls, model: Type["DjangoModel"], **kwargs):
+        return {
+            "model": model,
+            "reverse_path": kwargs["reverse_path"],
+            "order_by": tuple(kwargs.get("order_by") or ()),
+            **cls.get_loader_options(**kwargs),
+        }
+
+    @classmethod
+    def get_reverse_path(cls, relation: "RelatedField | ForeignObjectRel") -> str:
+        """Return path from the related model back to the model the `relation` is accessed from."""
+        raise NotImplementedError  # pragma: nocover
+
+    @classmethod
+    def get_relation_kwargs(cls, relation: "RelatedField | ForeignObjectRel") -> dict:
+        """Return kwargs of `get_loader_class` identifying the `relation`."""
+        return {"reverse_path": cls.get_reverse_path(relation)}
+
+    @classmethod
+    async def load_related(
+        cls,
+        root: "DjangoModel",
+        info: "Info",
+        *,
+        projection: bool = False,
+        order_by: Sequence[str] = (),
+        row_mode: bool = False,
+        using: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        connection: bool = False,
+    ) -> list["DjangoModel"]:
+        field_data: "StrawberryDjangoField" = info._field
+        relation = root._meta.get_field(field_name=field_data.django_name)
+        loader = cls.get_loader_class(
+            field_data.django_model,
+            **cls.get_relation_kwargs(relation),
+            order_by=order_by,
+            row_mode=row_mode,
+            using=using,
+        )
+        key = root.pk if offset == 0 and limit is None else RelatedPage(root.pk, offset, limit)
+        only = get_selected_only_fields(info, connection=connection) if projection else None
+        return await loader(context=info.context).load(key, only=only)
+
+    @classmethod
+    def as_resolver(
+        cls,
+        projection: bool = False,
+        order_by: Sequence[str] = (),
+        row_mode: bool = False,
+        using: Optional[str] = None,
+        pagination: bool = False,
+    ) -> Callable[..., Coroutine]:
+        async def resolver(root: "DjangoModel", info: "Info"):  # beware, first argument needs to be called 'root'
+            return await cls.load_related(
+                root, info, projection=projection, order_by=order_by, row_mode=row_mode, using=using
+            )
+
+        async def paginated_resolver(
+            root: "DjangoModel",
+            info: "Info",
+            pagination: Optional[OffsetPaginationInput] = None,
+        ):
+            if pagination is None:
+                return await resolver(root, info)
+            limit = pagination.limit if pagination.limit >= 0 else None
+            return await cls.load_related(
+                root,
+                info,
+                projection=projection,
+                order_by=order_by,
+                row_mode=row_mode,
+                using=using,
+                offset=pagination.offset,
+                limit=limit,
+            )
+
+        return paginated_resolver if pagination else resolver
+
+    @classmethod
+    def as_connection_resolver(
+        cls,
+        projection: bool = False,
+        order_by: Sequence[str] = (),
+        row_mode: bool = False,
+        using: Optional[str] = None,
+    ) -> Callable[..., Coroutine]:
+        async def resolver(
+            root: "DjangoModel",
+            info: "Info",
+            first: Optional[int] = None,
+            after: Optional[str] = None,
+            last: Optional[int] = None,
+            before: Optional[str] = None,
+        ) -> relay.ListConnection:
+            async def load_page(offset: int, limit: int) -> list["DjangoModel"]:
+                return await cls.load_related(
+                    root,
+                    info,
+                    projection=projection,
+                    order_by=order_by,
+                    row_mode=row_mode,
+                    using=using,
+                    offset=offset,
+                    limit=limit,
+                    connection=True,
+                )
+
+            return await load_connection(load_page, info, first=first, after=after, last=last, before=before)
+
+        return resolver
+
+
+class ReverseFKDataLoaderFactory(BaseRelatedListDataLoaderFactory):
     """
     Base factory for reverse FK relationship dataloaders. For example, get blog posts of a User.
 
@@ -81,27 +277,242 @@ class ReverseFKDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
     """
 
     loader_class = BasicReverseFKDataLoader
+    relation_name = "reverse"
+
+    @classmethod
+    def get_reverse_path(cls, relation: "ManyToOneRel") -> str:
+        return relation.field.attname
+
+
+class M2MDataLoaderFactory(BaseRelatedListDataLoaderFactory):
+    """
+    Base factory for many-to-many relationship dataloaders. For example, get tags of a BlogPost (or vice versa).
+    Works for both sides of the relation and for relations with a custom `through` model.
+
+    EXAMPLE:
+        CONSIDER DJANGO MODELS:
+            class Tag(models.Model):
+                ...
+
+            class BlogPost(models.Model):
+                tags = models.ManyToManyField("Tag", related_name="blog_posts")
+
+        THE FACTORY WOULD BE USED IN A FOLLOWING MANNER:
+            @strawberry.django.type(models.BlogPost)
+            class BlogPostType:
+                ...
+                @strawberry.field
+                async def tags(self: "models.BlogPost", info: "Info") -> list["TagType"]:
+                    loader = M2MDataLoaderFactory.get_loader_class(
+                        '<app_name>.Tag',
+                        reverse_path='blog_posts',
+                    )
+                    return await loader(context=info.context).load(self.pk)
+    """
+
+    loader_class = BasicM2MDataLoader
+    relation_name = "m2m"
+
+    @classmethod
+    def get_reverse_path(cls, relation: "ManyToManyField | ManyToManyRel") -> str:
+        return get_m2m_reverse_path(relation)
+
+
+class RelatedAggregateDataLoaderFactory(BaseDjangoModelDataLoaderFactory):
+    """
+    Base factory for dataloaders of aggregates (count, exists, sum, max, min, avg) of reverse FK
+    and many-to-many relationships. For example, get number of blog posts of a User.
+
+    EXAMPLE:
+        THE FACTORY WOULD BE USED IN A FOLLOWING MANNER:
+            @strawberry.django.type(models.User)
+            class UserType:
+                ...
+                @strawberry.field
+                async def blog_posts_count(self: "models.User", info: "Info") -> int:
+                    loader = RelatedAggregateDataLoaderFactory.get_loader_class(
+                        '<app_name>.BlogPost',
+                        reverse_path='published_by_id',
+                        aggregate='count',
+                    )
+                    return await loader(context=info.context).load(self.pk)
+
+                # or
+                blog_posts_max_rating: Optional[int] = strawberry.django.field(
+                    field_name="blog_posts",
+                    resolver=RelatedAggregateDataLoaderFactory.as_resolver(aggregate="max", aggregate_field="rating"),
+                )
+    """
+
+    loader_class = BasicRelatedAggregateDataLoader
 
     @classmethod
     def get_loader_key(cls, model: Type["DjangoModel"], **kwargs):
         reverse_path = kwargs.get("reverse_path")
         if not reverse_path:
-            raise ValueError(f"{cls.__name__}: 'reverse_path' not specified for reverse relation of {model.__name__}.")
-        return f"{model}-{reverse_path}"
+            raise ValueError(f"{cls.__name__}: 'reverse_path' not specified for aggregate of {model.__name__}.")
+        aggregate = Aggregate(kwargs.get("aggregate", Aggregate.COUNT))
+        key = f"{model}-{reverse_path}-{aggregate.value}-{kwargs.get('aggregate_field') or 'pk'}"
+        return key + cls.get_loader_options_key(**kwargs)
 
     @classmethod
     def get_loader_class_kwargs(cls, model: Type["DjangoModel"], **kwargs):
         return {
             "model": model,
             "reverse_path": kwargs["reverse_path"],
+            "aggregate": Aggregate(kwargs.get("aggregate", Aggregate.COUNT)),
+            "aggregate_field": kwargs.get("aggregate_field") or "pk",
+            **cls.get_loader_options(**kwargs),
         }
 
     @classmethod
-    def as_resolver(cls) -> Callable[["DjangoModel", Info], Coroutine]:
+    def get_reverse_path(cls, relation: "RelatedField | ForeignObjectRel") -> str:
+        """Return path from the related model to the 'parent' one, by which the aggregates are grouped."""
+        factory = get_related_list_factory(relation)
+        if not factory.supports_aggregates:
+            # grouping by the object id only would mix the related instances of all the content types
+            raise exceptions.UnsupportedRelationError(f"Aggregates of generic relation {relation!r} are not supported.")
+        return factory.get_reverse_path(relation)
+
+    @classmethod
+    def as_resolver(
+        cls,
+        aggregate: "Aggregate | str" = Aggregate.COUNT,
+        aggregate_field: Optional[str] = None,
+        using: Optional[str] = None,
+    ) -> Callable[["DjangoModel", "Info"], Coroutine]:
         async def resolver(root: "DjangoModel", info: "Info"):  # beware, first argument needs to be called 'root'
             field_data: "StrawberryDjangoField" = info._field
-            relation: "ManyToOneRel" = root._meta.get_field(field_name=field_data.django_name)
-            loader = cls.get_loader_class(field_data.django_model, reverse_path=relation.field.attname)
+            relation = root._meta.get_field(field_name=field_data.django_name)
+            loader = cls.get_loader_class(
+                relation.related_model,
+                reverse_path=cls.get_reverse_path(relation),
+                aggregate=aggregate,
+                aggregate_field=aggregate_field,
+                using=using,
+            )
             return await loader(context=info.context).load(root.pk)
 
         return resolver
+
+
+def get_to_one_loader_class(
+    relation: "RelatedField | OneToOneRel",
+    model: Optional[Type["DjangoModel"]] = None,
+    **kwargs,
+) -> tuple[Type[BasicPKDataLoader | BasicUniqueFieldDataLoader], str]:
+    """
+    Return dataloader class of the instance related through the forward FK / one-to-one or reverse one-to-one
+    `relation`, and attname of the 'parent' instance to be used as the key. The instances are loaded by the
+    primary key, or by the unique field for foreign keys with `to_field` and reverse one-to-one relations.
+    Kwargs (`row_mode`, `using`) go to `get_loader_class`. `model` defaults to the related model.
+    """
+    model = model or relation.related_model
+    if relation.concrete:
+        target_field = relation.target_field
+        if target_field.primary_key:
+            return PKDataLoaderFactory.get_loader_class(model, **kwargs), relation.attname
+        return (
+            UniqueFieldDataLoaderFactory.get_loader_class(model, field=target_field.attname, **kwargs),
+            relation.attname,
+        )
+    field = relation.field  # reverse side of the one-to-one field
+    loader_class = UniqueFieldDataLoaderFactory.get_loader_class(model, field=field.attname, **kwargs)
+    return loader_class, field.target_field.attname
+
+
+def get_related_list_factory(
+    relation: "RelatedField | ForeignObjectRel",
+) -> Type[BaseRelatedListDataLoaderFactory]:
+    """
+    Return factory of dataloaders of the list of instances related through the (reverse FK, M2M
+    or generic) `relation`.
+    """
+    if apps.is_installed("django.contrib.contenttypes"):
+        from .contenttypes import GenericRelation, GenericRelationDataLoaderFactory
+
+        if isinstance(relation, GenericRelation):
+            return GenericRelationDataLoaderFactory
+    if relation.one_to_many:
+        return ReverseFKDataLoaderFactory
+    elif relation.many_to_many:
+        return M2MDataLoaderFactory
+    else:
+        raise exceptions.UnsupportedRelationError(f"Unsupported relation on {relation.__repr__()}.")
+
+
+def get_m2m_reverse_path(relation: "ManyToManyField | ManyToManyRel") -> str:
+    """Return query path from the related model back to the model the many-to-many `relation` is accessed from."""
+    if isinstance(relation, ManyToManyRel):
+        return relation.field.name  # reverse side - the path is the m2m field itself
+    related_name = relation.remote_field.related_name
+    if related_name and related_name.endswith("+"):
+        raise exceptions.UnsupportedRelationError(
+            f"Many-to-many relation {relation!r} without the reverse relation (related_name={related_name!r}) "
+            "can't be loaded by a dataloader, the related model can't be filtered by it."
+        )
+    return relation.related_query_name()
+
+
+async def load_connection(
+    load_page: Callable[[int, int], Awaitable[list["DjangoModel"]]],
+    info: "Info",
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    last: Optional[int] = None,
+    before: Optional[str] = None,
+) -> relay.ListConnection:
+    """Resolve relay `ListConnection` of the instances returned by `load_page(offset, limit)`."""
+    start, end = get_connection_slice(info, first=first, after=after, last=last, before=before)
+    nodes = await load_page(start, end - start + 1)  # overfetch by one to find out whether there is a next page
+    edges = [
+        relay.Edge(cursor=relay.to_base64(CONNECTION_CURSOR_PREFIX, start + i), node=node)
+        for i, node in enumerate(nodes[: end - start])
+    ]
+    return relay.ListConnection(
+        edges=edges,
+        page_info=relay.PageInfo(
+            has_next_page=len(nodes) > end - start,
+            has_previous_page=start > 0,
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
+
+
+def get_connection_slice(
+    info: "Info",
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    last: Optional[int] = None,
+    before: Optional[str] = None,
+) -> tuple[int, int]:
+    """Translate relay pagination arguments to start and end offsets (the same way `relay.ListConnection` does)."""
+    max_results: int = info.schema.config.relay_max_results
+    start, end = 0, None
+    if after:
+        start = _parse_connection_cursor(after) + 1
+    if before:
+        end = _parse_connection_cursor(before)
+    if first is not None:
+        if not 0 <= first <= max_results:
+            raise ValueError(f"Argument 'first' must be a non-negative integer not higher than {max_results}.")
+        if end is not None:
+            start = max(0, end - 1)
+        end = start + first
+    if last is not None:
+        if not 0 <= last <= max_results:
+            raise ValueError(f"Argument 'last' must be a non-negative integer not higher than {max_results}.")
+        if end is None:
+            raise ValueError("Argument 'last' is supported only together with 'before' or 'first'.")
+        start = max(start, end - last)
+    if end is None:
+        end = start + max_results
+    return start, end
+
+
+def _parse_connection_cursor(cursor: str) -> int:
+    cursor_type, offset = relay.from_base64(cursor)
+    if cursor_type != CONNECTION_CURSOR_PREFIX:
+        raise ValueError(f"Invalid cursor '{cursor}'.")
+    return int(offset)
@@ -1,39 +1,338 @@
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Type
 
 import strawberry.django
-from strawberry import UNSET
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from strawberry import UNSET, relay
+from strawberry_django.arguments import argument
+from strawberry_django.fields.field import StrawberryDjangoField
+from strawberry_django.pagination import OffsetPaginationInput
 
 from . import exceptions, factories
+from .arguments import QueryArguments
+from .dataloaders import BasicPKDataLoader, BasicUniqueFieldDataLoader, RelatedPage
+from .selection import get_connection_node_selections, get_selected_only_fields, iter_selected_fields
 
 if TYPE_CHECKING:
     from django.db.models import Model as DjangoModel  # pragma: nocover
     from django.db.models.fields.related import RelatedField  # pragma: nocover
+    from strawberry.arguments import StrawberryArgument  # pragma: nocover
+    from strawberry.field import StrawberryField  # pragma: nocover
+    from strawberry.schema.name_converter import NameConverter  # pragma: nocover
     from strawberry.types import Info  # pragma: nocover
-    from strawberry_django.fields.field import StrawberryDjangoField  # pragma: nocover
+    from strawberry.types.nodes import Selection  # pragma: nocover
 
+    from .core.dataloader import BaseDataLoader, BaseDjangoModelDataLoader  # pragma: nocover
+    from .views import DataloaderContext  # pragma: nocover
 
-async def get_dataloader_resolver(root: "DjangoModel", info: "Info"):
-    field_data: "StrawberryDjangoField" = info._field
-    relation: "RelatedField" = root._meta.get_field(field_name=field_data.django_name)
+
+@dataclass(frozen=True)
+class DataloaderRelation:
+    """Relation resolved by an auto dataloader field, resolved on the first use of the field and cached on it."""
+
+    loader_class: Type["BaseDataLoader"]
+    key_attname: str  # attribute of the 'parent' instance used as the dataloader key
+    projection: bool = False
+    # content type attribute of the 'parent' instance for generic FKs, the key being (content type ID, object ID)
+    content_type_attname: Optional[str] = None
+    lookahead: bool = False  # join nested to-one relations of the selection, see `get_selected_select_related`
+
+    def get_load_kwargs(self, info: "Info", connection: bool = False) -> dict[str, Any]:
+        """Return kwargs of the dataloader `load` derived from the selection of the field."""
+        kwargs: dict[str, Any] = {
+            "only": get_selected_only_fields(info, connection=connection) if self.projection else None
+        }
+        if self.lookahead:
+            kwargs["select_related"] = get_selected_select_related(
+                info, connection=connection, using=self.loader_class.using
+            )
+        if getattr(self.loader_class, "django_type", None) is not None:
+            kwargs["info"] = info  # passed to `get_queryset` of the type
+        return kwargs
+
+    def get_key(self, root: "DjangoModel") -> Any:
+        key = getattr(root, self.key_attname)
+        if self.content_type_attname is None:
+            return key
+        content_type_id = getattr(root, self.content_type_attname)
+        return (content_type_id, key) if content_type_id is not None and key is not None else None
+
+    def get_loader(self, context: "DataloaderContext") -> "BaseDataLoader":
+        # skips `__new__` and `__init__` of the dataloader when the instance already exists in the context
+        return context.dataloaders.get(self.loader_class) or self.loader_class(context=context)
+
+
+def get_dataloader_relation(root: "DjangoModel", field_data: "StrawberryDjangoField") -> DataloaderRelation:
+    """Return the relation of the field, cached per model of the 'parent' instance (types can be inherited)."""
+    return get_model_dataloader_relation(root.__class__, field_data)
+
+
+def get_model_dataloader_relation(
+    model: Type["DjangoModel"], field_data: "StrawberryDjangoField"
+) -> DataloaderRelation:
+    relations: Optional[dict[Type["DjangoModel"], DataloaderRelation]] = getattr(
+        field_data, "dataloader_relations", None
+    )
+    if relations is None:  # a dataloader resolver used in a field not created by `auto_dataloader_field`
+        relations = field_data.dataloader_relations = {}
+    relation = relations.get(model)
+    if relation is None:
+        relation = relations[model] = resolve_dataloader_relation(model, field_data)
+    return relation
+
+
+def resolve_dataloader_relation(model: Type["DjangoModel"], field_data: "StrawberryDjangoField") -> DataloaderRelation:
+    relation: "RelatedField" = model._meta.get_field(field_name=field_data.django_name)
+    projection: bool = getattr(field_data, "dataloader_projection", False)
+    aggregate: Optional[str] = getattr(field_data, "dataloader_aggregate", None)
+    using: Optional[str] = getattr(field_data, "dataloader_using", None)
+    if apps.is_installed("django.contrib.contenttypes"):
+        from .contenttypes import GenericFKDataLoader, GenericForeignKey
+
+        if isinstance(relation, GenericForeignKey):
+            # the target model is known only per instance - the instances are loaded by their PK dataloaders
+            return DataloaderRelation(
+                GenericFKDataLoader,
+                key_attname=relation.fk_field,
+                content_type_attname=model._meta.get_field(relation.ct_field).attname,
+            )
+    if aggregate is not None:
+        loader_class = factories.RelatedAggregateDataLoaderFactory.get_loader_class(
+            relation.related_model,
+            reverse_path=factories.RelatedAggregateDataLoaderFactory.get_reverse_path(relation),
+            aggregate=aggregate,
+            aggregate_field=getattr(field_data, "dataloader_aggregate_field", None),
+            using=using,
+        )
+        return DataloaderRelation(loader_class, key_attname=model._meta.pk.attname)
+    row_mode: bool = getattr(field_data, "dataloader_row_mode", False)
+    lookahead: bool = getattr(field_data, "dataloader_lookahead", False) and not row_mode
+    django_type = get_queryset_type(field_data)
     if relation.many_to_one or relation.one_to_one:
-        return await factories.PKDataLoaderFactory.as_resolver()(root, info)
-    elif relation.one_to_many:
-        return await factories.ReverseFKDataLoaderFactory.as_resolver()(root, info)
-    else:
-        raise exceptions.UnsupportedRelationError(f"Unsupported relation on {relation.__repr__()}.")
+        loader_class, key_attname = factories.get_to_one_loader_class(
+            relation,
+            field_data.django_model,
+            row_mode=row_mode,
+            using=using,
+            django_type=django_type,
+        )
+        return DataloaderRelation(
+            loader_class,
+            key_attname=key_attname,
+            projection=projection,
+            lookahead=lookahead,
+        )
+    factory = factories.get_related_list_factory(relation)
+    loader_class = factory.get_loader_class(
+        field_data.django_model,
+        **factory.get_relation_kwargs(relation),
+        order_by=getattr(field_data, "dataloader_order_by", ()),
+        row_mode=row_mode,
+        using=using,
+        django_type=django_type,
+    )
+    return DataloaderRelation(
+        loader_class,
+        key_attname=model._meta.pk.attname,
+        projection=projection,
+        lookahead=lookahead,
+    )
+
+
+def get_queryset_type(field_data: "StrawberryDjangoField") -> Optional[type]:
+    """Return the strawberry-django type of the field if it defines `get_queryset`, to be applied by the dataloader."""
+    django_type = field_data.django_type
+    return django_type if django_type is not None and hasattr(django_type, "get_queryset") else None
+
+
+def get_selected_select_related(
+    info: "Info",
+    connection: bool = False,
+    using: Optional[str] = None,
+) -> dict[str, Type["BaseDjangoModelDataLoader"]]:
+    """
+    Return `select_related` paths of the forward FK and one-to-one relations selected within the selection
+    of the field currently being resolved (recursively), which are resolved by auto dataloader fields
+    with PK dataloaders (reading from the same `using` database), mapped to the PK dataloader classes.
+    """
+    field_data: "StrawberryDjangoField" = info._field
+    selections = info.selected_fields[0].selections
+    if connection:
+        selections = get_connection_node_selections(selections)
+    return _get_select_related(
+        field_data.django_type,
+        field_data.django_model,
+        selections,
+        info.schema.config.name_converter,
+        using=using,
+    )
+
+
+def _get_select_related(
+    django_type: Optional[type],
+    model: Optional[Type["DjangoModel"]],
+    selections: list["Selection"],
+    name_converter: "NameConverter",
+    using: Optional[str] = None,
+    prefix: str = "",
+) -> dict[str, Type["BaseDjangoModelDataLoader"]]:
+    if django_type is None or model is None:
+        return {}
+    type_fields: dict[str, "StrawberryField"] = {
+        name_converter.from_field(type_field): type_field for type_field in django_type.__strawberry_definition__.fields
+    }
+    select_related: dict[str, Type["BaseDjangoModelDataLoader"]] = {}
+    for selected_field in iter_selected_fields(selections):
+        type_field = type_fields.get(selected_field.name)
+        if type_field is None or getattr(type_field, "dataloader_relations", None) is None:
+            continue  # not an auto dataloader field
+        try:
+            model_field = model._meta.get_field(type_field.django_name)
+        except FieldDoesNotExist:
+            continue
+        if not (
+            model_field.concrete and model_field.is_relation and (model_field.many_to_one or model_field.one_to_one)
+        ):
+            continue
+        loader_class = get_model_dataloader_relation(model, type_field).loader_class
+        if (
+            not issubclass(loader_class, (BasicPKDataLoader, BasicUniqueFieldDataLoader))
+            or loader_class.row_mode
+            or loader_class.using != using
+            or loader_class.django_type is not None  # the join would bypass `get_queryset` of the type
+        ):
+            continue
+        path = f"{prefix}{model_field.name}"
+        select_related[path] = loader_class
+        select_related.update(
+            _get_select_related(
+                type_field.django_type,
+                loader_class.model,
+                selected_field.selections,
+                name_converter,
+                using=using,
+                prefix=f"{path}__",
+            )
+        )
+    return select_related
+
+
+class DataloaderField(StrawberryDjangoField):
+    """
+    Field of `auto_dataloader_field`. Lists of related instances get the strawberry-django `filters` and `order`
+    arguments (of the field, or of the related type), which are handed over to the dataloader resolvers
+    as `QueryArguments` (see `get_query_arguments`), to be applied in the batch query.
+    """
+
+    dataloader_query_arguments: bool = False  # set for the dataloader resolvers, which apply the arguments
+
+    @property
+    def arguments(self) -> list["StrawberryArgument"]:
+        arguments = super().arguments
+        if not self.dataloader_query_arguments or not (self.is_list or self.is_connection):
+            return arguments
+        names = {arg.python_name for arg in arguments}
+        filters, order = self.get_filters(), self.get_order()
+        if filters is not None and "filters" not in names:
+            arguments = [*arguments, argument("filters", filters, is_optional=True)]
+        if order is not None and "order" not in names:
+            arguments = [*arguments, argument("order", order, is_optional=True)]
+        return arguments
+
+    @arguments.setter
+    def arguments(self, value: list["StrawberryArgument"]):
+        args_prop = super(DataloaderField, self.__class__).arguments
+        args_prop.fset(self, value)
+
+    def get_result(self, source, info, args, kwargs):
+        if self.dataloader_query_arguments and ("filters" in kwargs or "order" in kwargs):
+            kwargs = kwargs.copy()
+            arguments = QueryArguments(kwargs.pop("filters", None), kwargs.pop("order", None))
+            if arguments.filters is not None or arguments.order is not None:
+                # handed over to the resolver (see `get_query_arguments`), the path is unique per resolved field
+                info.context.dataloader_query_arguments[_get_path_key(info)] = arguments
+        return super().get_result(source, info, args, kwargs)
+
+
+def get_query_arguments(info: "Info") -> Optional[QueryArguments]:
+    """Return (and forget) filter and order arguments of the `DataloaderField` being resolved, None if not given."""
+    return info.context.dataloader_query_arguments.pop(_get_path_key(info), None)
+
+
+def _get_path_key(info: "Info") -> tuple:
+    return tuple(info.path.as_list())
+
+
+async def get_dataloader_resolver(root: "DjangoModel", info: "Info"):
+    relation = get_dataloader_relation(root, info._field)
+    key = relation.get_key(root)
+    arguments = get_query_arguments(info)
+    if arguments is not None:
+        key = RelatedPage(key, arguments=arguments)
+    return await relation.get_loader(info.context).load(key, **relation.get_load_kwargs(info))
+
+
+async def get_paginated_dataloader_resolver(
+    root: "DjangoModel",
+    info: "Info",
+    pagination: Optional[OffsetPaginationInput] = None,
+):
+    if pagination is None:
+        return await get_dataloader_resolver(root, info)
+    relation = get_dataloader_relation(root, info._field)
+    key = RelatedPage(
+        relation.get_key(root),
+        offset=pagination.offset,
+        limit=pagination.limit if pagination.limit >= 0 else None,
+        arguments=get_query_arguments(info),
+    )
+    return await relation.get_loader(info.context).load(key, **relation.get_load_kwargs(info))
+
+
+async def get_connection_dataloader_resolver(
+    root: "DjangoModel",
+    info: "Info",
+    first: Optional[int] = None,
+    after: Optional[str] = None,
+    last: Optional[int] = None,
+    before: Optional[str] = None,
+) -> relay.ListConnection:
+    relation = get_dataloader_relation(root, info._field)
+    loader = relation.get_loader(info.context)
+    key = relation.get_key(root)
+    arguments = get_query_arguments(info)
+    load_kwargs = relation.get_load_kwargs(info, connection=True)
+
+    async def load_page(offset: int, limit: int) -> list["DjangoModel"]:
+        return await loader.load(RelatedPage(key, offset, limit, arguments), **load_kwargs)
+
+    return await factories.load_connection(load_page, info, first=first, after=after, last=last, before=before)
 
 
 def auto_dataloader_field(
-    resolver=get_dataloader_resolver,
+    resolver=None,
     *,
     name=None,
     field_name=None,
     filters=UNSET,
+    order=UNSET,
     default=UNSET,
+    projection: bool = False,
+    order_by: Sequence[str] = (),
+    pagination: bool = False,
+    aggregate: Optional[str] = None,
+    aggregate_field: Optional[str] = None,
+    row_mode: bool = False,
+    using: Optional[str] = None,
+    lookahead: bool = False,
     **kwargs,
 ) -> Any:
     """
-    A field which has automatic dataloader resolver based on the relationship type (one-to-one, one-to-many, etc.).
+    A field which has automatic dataloader resolver based on the relationship type
+    (one-to-one, one-to-many, many-to-many, etc.).
+    Foreign keys with `to_field` and the reverse side of one-to-one relations are loaded by the unique field
+    (`BasicUniqueFieldDataLoader`), resolving a single instance or None.
 
     EXAMPLE:
         CONSIDER DJANGO MODELS:
@@ -52,12 +351,96 @@ def auto_dataloader_field(
                 color: ColorType = fields.auto_dataloader_field()
                 varieties: list[FruitVarietyType] = fields.auto_dataloader_field()
                 eaters: list[FruitEaterType] = fields.auto_dataloader_field()
+
+    With `projection=True`, only the model fields selected in the GraphQL query are loaded (`QuerySet.only()`).
+    Custom resolvers of the related type which use other model fields need to declare them with `only` hints.
+
+    Lists of related instances (reverse FK and many-to-many relations) can be ordered with `order_by`
+    (e.g. `order_by=["-created_at"]`), and `pagination=True` adds the strawberry-django `pagination` argument.
+    Both are applied per 'parent' instance in the batch query.
+
+    With `aggregate` ("count", "exists", "sum", "max", "min" or "avg"), the field resolves an aggregate
+    of the related instances (of `aggregate_field` for sum/max/min/avg) instead of the instances themselves:
+        eaters_count: int = fields.auto_dataloader_field(field_name="eaters", aggregate="count")
+
+    With `row_mode=True`, the related instances are loaded as lightweight `rows.ModelRow` records
+    (see `BaseDjangoModelDataLoader.row_mode`), which fits types reading plain columns (and dataloader fields).
+
+    `using` sets the database alias the instances are read from (by default given by the database routers).
+
+    With `lookahead=True`, forward FK and one-to-one relations selected within the field selection (recursively),
+    which are resolved by auto dataloader fields too, are joined to the batch query (`select_related`),
+    and the joined instances are primed into the PK dataloaders of the nested fields:
+        eaters: list[FruitEaterType] = fields.auto_dataloader_field(lookahead=True)
+    resolves `eaters { favouriteFruit { color { name } } }` by a single query.
+
+    Lists of related instances get the strawberry-django `filters` and `order` arguments (`filters`/`order`
+    of the field, or of the related type), applied in the batch query, and the `get_queryset` of the related type
+    (if defined) is applied to the batch queries of all the relations. Loads with the same (normalized) filter
+    and order input share a batch query, the others are loaded by separate queries:
+        eaters: list[FruitEaterType] = fields.auto_dataloader_field(filters=FruitEaterFilter, order=FruitEaterOrder)
+    `get_queryset` is called with the `info` of one of the fields of the batch, i.e. it shouldn't depend on anything
+    else than the request (e.g. `info.context.request.user`).
+
+    Generic relations (`django.contrib.contenttypes`) are supported too - a `GenericForeignKey` field
+    (typically of a union type) is loaded by `contenttypes.GenericFKDataLoader` and a `GenericRelation`
+    like a reverse FK relation.
     """
-    return strawberry.django.field(
+    query_arguments = resolver is None or resolver is get_connection_dataloader_resolver
+    if resolver is None:
+        resolver = get_paginated_dataloader_resolver if pagination else get_dataloader_resolver
+    kwargs.setdefault("field_cls", DataloaderField)
+    field = strawberry.django.field(
         resolver=resolver,
         name=name,
         field_name=field_name,
         filters=filters,
+        order=order,
         default=default,
         **kwargs,
     )
+    field.dataloader_query_arguments = query_arguments
+    field.dataloader_projection = projection
+    field.dataloader_order_by = tuple(order_by)
+    field.dataloader_aggregate = aggregate
+    field.dataloader_aggregate_field = aggregate_field
+    field.dataloader_row_mode = row_mode
+    field.dataloader_using = using
+    field.dataloader_lookahead = lookahead
+    field.dataloader_relations = {}  # see `get_dataloader_relation`
+    return field
+
+
+def auto_dataloader_connection(
+    resolver=get_connection_dataloader_resolver,
+    *,
+    name=None,
+    field_name=None,
+    projection: bool = False,
+    order_by: Sequence[str] = (),
+    row_mode: bool = False,
+    using: Optional[str] = None,
+    lookahead: bool = False,
+    **kwargs,
+) -> Any:
+    """
+    A field resolving a reverse FK or many-to-many relation as a relay `ListConnection`
+    with `first`/`after`/`last`/`before` arguments, loaded by a dataloader.
+    The pagination (and the `filters`/`order` arguments) is applied per 'parent' instance in the batch query.
+
+    EXAMPLE:
+        @strawberry_django.type(models.Fruit)
+        class FruitType:
+            eaters: relay.ListConnection[FruitEaterType] = fields.auto_dataloader_connection(order_by=["name"])
+    """
+    return auto_dataloader_field(
+        resolver,
+        name=name,
+        field_name=field_name,
+        projection=projection,
+        order_by=order_by,
+        row_mode=row_mode,
+        using=using,
+        lookahead=lookahead,
+        **kwargs,
+    )
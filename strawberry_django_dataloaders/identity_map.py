@@ -0,0 +1,84 @@
+from typing import TYPE_CHECKING, Any, Collection, Hashable, Optional, Type
+
+from django.db.models import Model as DjangoModel
+
+if TYPE_CHECKING:
+    from django.db.models import Field  # pragma: nocover
+
+
+class IdentityMap:
+    """
+    Model instances loaded within a request, keyed by (model, pk).
+
+    Dataloaders add all the instances they load, so that each database row is represented by a single Python object
+    per request - an instance loaded again (e.g. by another dataloader) is replaced with the one already in the map,
+    which gets the newly loaded fields and the related instances joined by `select_related`. PK dataloaders look
+    the instances up here before querying the database.
+    """
+
+    def __init__(self):
+        self.instances: dict[tuple[Type["DjangoModel"], Hashable], "DjangoModel"] = {}
+
+    def get(
+        self,
+        model: Type["DjangoModel"],
+        pk: Hashable,
+        only: Optional[Collection[str]] = None,
+    ) -> Optional["DjangoModel"]:
+        """Return the instance if it's in the map with all the `only` fields loaded (None = all the fields)."""
+        instance = self.instances.get((model, pk))
+        if instance is None:
+            return None
+        deferred = instance.get_deferred_fields()
+        if not deferred:
+            return instance
+        if only is None or any(_get_attname(model, name) in deferred for name in only):
+            return None
+        return instance
+
+    def add(self, instance: "DjangoModel") -> "DjangoModel":
+        """Add the instance to the map, return the instance representing its row in the request."""
+        key = (type(instance), instance.pk)
+        existing = self.instances.get(key)
+        if existing is None or existing is instance:
+            self.instances[key] = instance
+            return instance
+        for attname in existing.get_deferred_fields() - instance.get_deferred_fields():
+            existing.__dict__[attname] = instance.__dict__[attname]
+        for name, related in instance._state.fields_cache.items():
+            existing._state.fields_cache.setdefault(name, related)
+        return existing
+
+    def add_results(self, results: list[Any]) -> list[Any]:
+        """Add instances within dataloader results (instances or lists of instances) to the map, see `add`."""
+        return [self._add_result(result) for result in results]
+
+    def _add_result(self, result: Any) -> Any:
+        if isinstance(result, DjangoModel):
+            return self.add(result)
+        if isinstance(result, list):
+            return [self.add(item) if isinstance(item, DjangoModel) else item for item in result]
+        return result
+
+    def clear(self, model: Optional[Type["DjangoModel"]] = None) -> None:
+        """Remove instances of the model (or all of them) from the map."""
+        if model is None:
+            self.instances.clear()
+            return
+        for key in [key for key in self.instances if key[0] is model]:
+            del self.instances[key]
+
+
+def get_loaded_fields(instance: "DjangoModel") -> Optional[frozenset[str]]:
+    """Names and attnames of the loaded concrete fields, None if all of them are loaded."""
+    deferred = instance.get_deferred_fields()
+    if not deferred:
+        return None
+    fields: list["Field"] = instance._meta.concrete_fields
+    return frozenset(name for field in fields if field.attname not in deferred for name in (field.name, field.attname))
+
+
+def _get_attname(model: Type["DjangoModel"], name: str) -> str:
+    if name == "pk":
+        return model._meta.pk.attname
+    return model._meta.get_field(name).attname
@@ -0,0 +1,184 @@
+import logging
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Protocol, Type
+
+from django.conf import settings as django_settings
+from django.dispatch import Signal
+from strawberry.extensions import SchemaExtension
+
+if TYPE_CHECKING:
+    from strawberry_django_dataloaders.core.dataloader import BaseDataLoader  # pragma: nocover
+    from strawberry_django_dataloaders.views import DataloaderContext  # pragma: nocover
+
+# sent after each batch of a dataloader is loaded, with `sender` = dataloader class, `context` and `stats` kwargs
+batch_loaded = Signal()
+
+
+@dataclass
+class BatchStats:
+    """Statistics of a single batch (`load_fn` call) of a dataloader. Times are in seconds."""
+
+    loader: Type["BaseDataLoader"]
+    keys: int  # number of keys in the batch
+    unique_keys: int
+    queries: int = 0
+    rows: int = 0  # rows returned by the database
+    query_time: float = 0  # time spent executing the queries (including the hop to the DB thread)
+    queue_wait: float = 0  # time from the first `load` of the batch until the batch was dispatched
+    duration: float = 0  # total time of the batch
+    error: Optional[BaseException] = None
+
+
+class DataloaderObserver(Protocol):
+    def batch_loaded(self, context: "DataloaderContext", stats: BatchStats) -> None:
+        ...  # pragma: nocover
+
+
+_observers: list[DataloaderObserver] = []
+_current_batch: ContextVar[Optional[BatchStats]] = ContextVar("strawberry_django_dataloaders_batch", default=None)
+
+
+def register_observer(observer: DataloaderObserver) -> None:
+    """Register an observer notified about batches of all the requests (e.g. `LoggingObserver()`)."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def unregister_observer(observer: DataloaderObserver) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def start_batch(stats: BatchStats) -> None:
+    """Make `record_query` add the queries of the current task to `stats`."""
+    _current_batch.set(stats)
+
+
+def get_current_batch() -> Optional[BatchStats]:
+    """Return statistics of the batch being loaded in the current task (or the DB thread running its queries)."""
+    return _current_batch.get()
+
+
+def record_query(rows: int, query_time: float) -> None:
+    """Add a query executed by a dataloader to the statistics of the batch being loaded (if any)."""
+    stats = _current_batch.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.rows += rows
+        stats.query_time += query_time
+
+
+def finish_batch(context: "DataloaderContext", stats: BatchStats) -> None:
+    """Notify the observers (request ones first, then the global ones) and send the `batch_loaded` signal."""
+    _current_batch.set(None)
+    for observer in [*context.dataloader_observers, *_observers]:
+        observer.batch_loaded(context, stats)
+    batch_loaded.send(sender=stats.loader, context=context, stats=stats)
+
+
+class LoggingObserver:
+    """Logs statistics of each batch."""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        self.logger = logger or logging.getLogger("strawberry_django_dataloaders")
+        self.level = level
+
+    def batch_loaded(self, context: "DataloaderContext", stats: BatchStats) -> None:
+        self.logger.log(
+            self.level,
+            "%s: %d keys (%d unique), %d queries, %d rows, query time %.2f ms, queue wait %.2f ms%s",
+            stats.loader.__name__,
+            stats.keys,
+            stats.unique_keys,
+            stats.queries,
+            stats.rows,
+            stats.query_time * 1000,
+            stats.queue_wait * 1000,
+            f", failed: {stats.error!r}" if stats.error is not None else "",
+        )
+
+
+@dataclass
+class LoaderSummary:
+    batches: int = 0
+    keys: int = 0
+    unique_keys: int = 0
+    queries: int = 0
+    rows: int = 0
+    query_time_ms: float = 0
+    queue_wait_ms: float = 0
+    batch_sizes: list[int] = field(default_factory=list)
+    # number of batches per batch size bucket (unique keys), see `get_batch_size_bucket`
+    batch_size_histogram: dict[str, int] = field(default_factory=dict)
+
+
+def get_batch_size_bucket(size: int) -> str:
+    """Return the power of two bucket of the batch size, e.g. "1", "2-3", "4-7", "8-15", ..."""
+    if size <= 1:
+        return str(size)
+    low = 1 << (size.bit_length() - 1)
+    return f"{low}-{2 * low - 1}"
+
+
+class SummaryObserver:
+    """Collects per-dataloader summary of the batches."""
+
+    def __init__(self):
+        self.summary: dict[str, LoaderSummary] = defaultdict(LoaderSummary)
+
+    def batch_loaded(self, context: "DataloaderContext", stats: BatchStats) -> None:
+        summary = self.summary[stats.loader.__name__]
+        summary.batches += 1
+        summary.keys += stats.keys
+        summary.unique_keys += stats.unique_keys
+        summary.queries += stats.queries
+        summary.rows += stats.rows
+        summary.query_time_ms += stats.query_time * 1000
+        summary.queue_wait_ms += stats.queue_wait * 1000
+        summary.batch_sizes.append(stats.unique_keys)
+        bucket = get_batch_size_bucket(stats.unique_keys)
+        summary.batch_size_histogram[bucket] = summary.batch_size_histogram.get(bucket, 0) + 1
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {name: asdict(summary) for name, summary in self.summary.items()}
+
+
+class DataloaderStatsExtension(SchemaExtension):
+    """
+    Adds summary of the dataloader batches of the request to the `extensions` of the response:
+        {"extensions": {"dataloaders": {"<dataloader class>": {"batches": ..., "keys": ..., ...}}}}
+
+    The summary is added only in debug mode (Django `DEBUG` setting, unless overridden by the `debug` attribute).
+    The execution context needs to be `DataloaderContext`. Pass the class (not an instance) to the schema,
+    so that each request gets its own summary.
+
+    EXAMPLE:
+        schema = strawberry.Schema(query=Query, extensions=[DataloaderStatsExtension])
+    """
+
+    debug: Optional[bool] = None
+
+    def __init__(self, *, execution_context):
+        super().__init__(execution_context=execution_context)
+        self.observer = SummaryObserver()
+
+    def is_enabled(self) -> bool:
+        return self.debug if self.debug is not None else django_settings.DEBUG
+
+    def on_operation(self):
+        if not self.is_enabled():
+            yield
+            return
+        observers: list[DataloaderObserver] = self.execution_context.context.dataloader_observers
+        observers.append(self.observer)
+        try:
+            yield
+        finally:
+            observers.remove(self.observer)
+
+    def get_results(self) -> dict[str, Any]:
+        if not self.is_enabled():
+            return {}
+        return {"dataloaders": self.observer.as_dict()}
@@ -0,0 +1,52 @@
+"""
+Pytest fixtures of the package. Enable them in `conftest.py`:
+    pytest_plugins = ["strawberry_django_dataloaders.pytest_plugin"]
+"""
+from typing import Iterator, Optional
+
+import pytest
+
+from strawberry_django_dataloaders.query_guard import QueryReport, register_report_handler, unregister_report_handler
+
+
+class QueryGuard:
+    """
+    Collects the reports of the GraphQL operations executed by schemas with `QueryGuardExtension` during a test.
+    `max_queries` and `repeat_threshold` (if set) override those of the extension.
+    """
+
+    def __init__(self):
+        self.reports: list[QueryReport] = []
+        self.max_queries: Optional[int] = None
+        self.repeat_threshold: Optional[int] = None
+
+    def report(self, report: QueryReport) -> None:
+        self.reports.append(report)
+
+    def get_violations(self) -> list[QueryReport]:
+        violations = []
+        for report in self.reports:
+            if self.max_queries is not None:
+                report.max_queries = self.max_queries
+            if self.repeat_threshold is not None:
+                report.repeat_threshold = self.repeat_threshold
+            if report.has_violations():
+                violations.append(report)
+        return violations
+
+
+@pytest.fixture
+def query_guard() -> Iterator[QueryGuard]:
+    """
+    Fails the test if any GraphQL operation executed with `QueryGuardExtension` exceeded the query budget
+    or ran N+1 queries, naming the GraphQL field paths of the unbatched queries.
+    """
+    guard = QueryGuard()
+    register_report_handler(guard)
+    try:
+        yield guard
+    finally:
+        unregister_report_handler(guard)
+    violations = guard.get_violations()
+    if violations:
+        pytest.fail("\n\n".join(report.format() for report in violations), pytrace=False)
@@ -0,0 +1,238 @@
+import logging
+import re
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from inspect import isawaitable
+from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Type
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from strawberry.extensions import SchemaExtension
+
+from strawberry_django_dataloaders import instrumentation
+from strawberry_django_dataloaders.exceptions import QueryGuardError
+from strawberry_django_dataloaders.settings import get_setting
+
+if TYPE_CHECKING:
+    from django.db.backends.base.base import BaseDatabaseWrapper  # pragma: nocover
+    from graphql.pyutils import Path  # pragma: nocover
+
+    from strawberry_django_dataloaders.core.dataloader import BaseDataLoader  # pragma: nocover
+
+logger = logging.getLogger("strawberry_django_dataloaders")
+
+_IN_PLACEHOLDERS_RE = re.compile(r"IN \((?:%s, )*%s\)")
+
+
+@dataclass
+class QueryRecord:
+    """SQL query executed during a GraphQL operation."""
+
+    sql: str
+    duration: float  # seconds
+    path: Optional[str]  # GraphQL path of the field being resolved (without list indexes), None = outside resolvers
+    loader: Optional[Type["BaseDataLoader"]]  # dataloader whose batch issued the query, None = unbatched
+
+    @property
+    def shape(self) -> str:
+        """SQL with the placeholders of `IN (...)` collapsed, so that queries of any number of keys match."""
+        return _IN_PLACEHOLDERS_RE.sub("IN (...)", self.sql)
+
+
+@dataclass
+class RepeatedQuery:
+    """Query of the same shape executed many times outside the dataloaders - a likely N+1 problem."""
+
+    shape: str
+    count: int
+    paths: list[str]
+
+
+@dataclass
+class QueryReport:
+    """Queries of a GraphQL operation, checked against the query budget and for N+1 problems."""
+
+    operation_name: Optional[str]
+    queries: list[QueryRecord] = field(default_factory=list)
+    max_queries: Optional[int] = None  # query budget of the operation, None means no budget
+    repeat_threshold: Optional[int] = None  # number of unbatched queries of the same shape flagged as N+1
+
+    @property
+    def unbatched_queries(self) -> list[QueryRecord]:
+        return [query for query in self.queries if query.loader is None]
+
+    @property
+    def repeated_queries(self) -> list[RepeatedQuery]:
+        if self.repeat_threshold is None:
+            return []
+        by_shape: dict[str, list[QueryRecord]] = defaultdict(list)
+        for query in self.unbatched_queries:
+            by_shape[query.shape].append(query)
+        return [
+            RepeatedQuery(
+                shape=shape,
+                count=len(queries),
+                paths=sorted({query.path or "<operation>" for query in queries}),
+            )
+            for shape, queries in by_shape.items()
+            if len(queries) >= self.repeat_threshold
+        ]
+
+    @property
+    def budget_exceeded(self) -> bool:
+        return self.max_queries is not None and len(self.queries) > self.max_queries
+
+    def has_violations(self) -> bool:
+        return self.budget_exceeded or bool(self.repeated_queries)
+
+    def format(self) -> str:
+        lines = [f"GraphQL operation {self.operation_name or '<anonymous>'}: {len(self.queries)} queries"]
+        if self.budget_exceeded:
+            lines.append(f"  query budget of {self.max_queries} queries exceeded")
+        for repeated in self.repeated_queries:
+            lines.append(f"  N+1: {repeated.count}x by {', '.join(repeated.paths)}: {repeated.shape}")
+        unbatched: dict[tuple[str, str], int] = defaultdict(int)
+        for query in self.unbatched_queries:
+            unbatched[(query.path or "<operation>", query.shape)] += 1
+        for (path, shape), count in unbatched.items():
+            lines.append(f"  unbatched {count}x by {path}: {shape}")
+        return "\n".join(lines)
+
+
+class QueryReportHandler(Protocol):
+    def report(self, report: QueryReport) -> None:
+        ...  # pragma: nocover
+
+
+_report_handlers: list[QueryReportHandler] = []
+_current_report: ContextVar[Optional[QueryReport]] = ContextVar(
+    "strawberry_django_dataloaders_query_report", default=None
+)
+_current_path: ContextVar[Optional["Path"]] = ContextVar("strawberry_django_dataloaders_field_path", default=None)
+
+
+def register_report_handler(handler: QueryReportHandler) -> None:
+    """Register a handler receiving the reports of all the operations (e.g. the `query_guard` pytest fixture)."""
+    if handler not in _report_handlers:
+        _report_handlers.append(handler)
+
+
+def unregister_report_handler(handler: QueryReportHandler) -> None:
+    if handler in _report_handlers:
+        _report_handlers.remove(handler)
+
+
+def get_field_path(path: Optional["Path"]) -> Optional[str]:
+    """Return the GraphQL path without list indexes, e.g. "fruits.color.name"."""
+    if path is None:
+        return None
+    return ".".join(key for key in path.as_list() if isinstance(key, str))
+
+
+def _record_query(execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+    report = _current_report.get()
+    if report is None:
+        return execute(sql, params, many, context)
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        batch = instrumentation.get_current_batch()
+        report.queries.append(
+            QueryRecord(
+                sql=sql,
+                duration=time.perf_counter() - started_at,
+                path=get_field_path(_current_path.get()),
+                loader=batch.loader if batch is not None else None,
+            )
+        )
+
+
+def install_query_recorder(connection: "BaseDatabaseWrapper", **kwargs: Any) -> None:
+    """
+    Add the query recorder to the execute wrappers of the connection. Done for each new DB connection
+    (`connection_created` signal, including those of the worker threads), and for the connections of the current
+    thread when an operation starts. The recorder is no-op outside the operations checked by `QueryGuardExtension`.
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+connection_created.connect(install_query_recorder)
+
+
+class QueryGuardExtension(SchemaExtension):
+    """
+    Records the SQL queries of each GraphQL operation and matches them to the dataloader batches that issued them
+    (if any) and to the GraphQL field paths being resolved. Unbatched queries of the same shape repeated at least
+    `repeat_threshold` times (defaults to the `QUERY_GUARD_REPEAT_THRESHOLD` setting) are reported as N+1 problems,
+    and the total number of queries is checked against the `max_queries` budget (defaults to the `QUERY_BUDGET`
+    setting, None means no budget).
+
+    Violations are logged as warnings (`strawberry_django_dataloaders` logger), or raised as `QueryGuardError`
+    with `strict = True` (defaults to the `QUERY_GUARD_STRICT` setting). Reports of all the operations are passed
+    to the handlers registered by `register_report_handler` - the `query_guard` pytest fixture
+    (see `pytest_plugin`) fails the test on violations.
+
+    Recording the queries and field paths has an overhead on each resolved field, so the extension is meant
+    for development, tests and sampled production requests. Pass the class (not an instance) to the schema.
+
+    EXAMPLE:
+        schema = strawberry.Schema(query=Query, extensions=[QueryGuardExtension])
+    """
+
+    max_queries: Optional[int] = None
+    repeat_threshold: Optional[int] = None
+    strict: Optional[bool] = None
+
+    def get_max_queries(self) -> Optional[int]:
+        return self.max_queries if self.max_queries is not None else get_setting("QUERY_BUDGET")
+
+    def get_repeat_threshold(self) -> Optional[int]:
+        return (
+            self.repeat_threshold if self.repeat_threshold is not None else get_setting("QUERY_GUARD_REPEAT_THRESHOLD")
+        )
+
+    def is_strict(self) -> bool:
+        return self.strict if self.strict is not None else get_setting("QUERY_GUARD_STRICT")
+
+    def on_operation(self):
+        for connection in connections.all():
+            install_query_recorder(connection)
+        report = QueryReport(
+            operation_name=None,
+            max_queries=self.get_max_queries(),
+            repeat_threshold=self.get_repeat_threshold(),
+        )
+        token = _current_report.set(report)
+        try:
+            yield
+        finally:
+            _current_report.reset(token)
+        report.operation_name = self.execution_context.operation_name  # known once the document is parsed
+        for handler in _report_handlers:
+            handler.report(report)
+        if report.has_violations():
+            if self.is_strict():
+                raise QueryGuardError(report.format())
+            logger.warning(report.format())
+
+    def resolve(self, _next, root, info, *args, **kwargs) -> Any:
+        token = _current_path.set(info.path)
+        try:
+            result = _next(root, info, *args, **kwargs)
+        finally:
+            _current_path.reset(token)
+        if isawaitable(result):
+            return _await_in_path(result, info.path)
+        return result
+
+
+async def _await_in_path(result: Any, path: "Path") -> Any:
+    token = _current_path.set(path)
+    try:
+        return await result
+    finally:
+        _current_path.reset(token)
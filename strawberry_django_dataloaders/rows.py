@@ -0,0 +1,101 @@
+from functools import cache
+from typing import TYPE_CHECKING, Any, Iterator, Type
+
+from django.apps import apps
+from django.db.models import Model as DjangoModel
+from django.db.models.query import ModelIterable, ValuesListIterable
+from django.db.models.query_utils import DeferredAttribute
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet  # pragma: nocover
+    from django.db.models.options import Options  # pragma: nocover
+
+
+class ModelRow:
+    """
+    Lightweight read-only record of a model row, loaded by dataloaders in the row mode (`row_mode = True`).
+
+    Values of the loaded columns (and annotations) are accessible as attributes named by the field `attname`
+    (e.g. `color_id` for `color` foreign key), the same way as on model instances, together with `pk` and `_meta`.
+    The records skip `Model.__init__`, `pre_init`/`post_init` signals and `ModelState`, but they have no model
+    methods and related objects can't be accessed through them (use dataloaders, which read the `attname`).
+
+    Values are kept in `__dict__` and the model field descriptors are reused, so that strawberry-django fields
+    resolve them as cheaply as the model instance attributes. `__class__` reports the model, so that the records
+    pass `isinstance` checks of strawberry-django types (`is_type_of`).
+    """
+
+    _meta: "Options"
+
+    @property
+    def __class__(self) -> Type["DjangoModel"]:
+        return self._meta.model
+
+    @classmethod
+    def from_values(cls, values: dict[str, Any]) -> "ModelRow":
+        row = cls.__new__(cls)
+        row.__dict__ = values
+        return row
+
+    @property
+    def pk(self) -> Any:
+        return self.__dict__[self._meta.pk.attname]
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (ModelRow, DjangoModel)) or self._meta.concrete_model != other._meta.concrete_model:
+            return NotImplemented
+        return self.pk == other.pk
+
+    def __hash__(self) -> int:
+        return hash(self.pk)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self.pk}>"
+
+    def __reduce__(self):
+        return _unpickle_row, (self._meta.label, self.__dict__)
+
+
+@cache
+def get_row_class(model: Type["DjangoModel"]) -> Type[ModelRow]:
+    """Return (cached) record class of the model rows."""
+    attrs: dict[str, Any] = {"_meta": model._meta, "__module__": ModelRow.__module__}
+    for field in model._meta.concrete_fields:
+        attrs[field.attname] = DeferredAttribute(field)
+    return type(f"{model.__name__}Row", (ModelRow,), attrs)
+
+
+class ModelRowIterable(ValuesListIterable):
+    """Yields `ModelRow` records of the values list queryset."""
+
+    def __iter__(self) -> Iterator[ModelRow]:
+        row_class = get_row_class(self.queryset.model)
+        names = self.queryset._fields
+        for values in super().__iter__():
+            yield row_class.from_values(dict(zip(names, values)))
+
+
+def as_rows(queryset: "QuerySet") -> "QuerySet":
+    """
+    Make the model queryset return `ModelRow` records with the loaded fields (respecting `only()`)
+    and annotations. Querysets of other than model instances (e.g. `values()`) are returned as they are.
+    """
+    if queryset._iterable_class is not ModelIterable:
+        return queryset
+    opts = queryset.model._meta
+    loaded_fields, defer = queryset.query.deferred_loading
+    if defer:
+        names = [field.attname for field in opts.concrete_fields if field.name not in loaded_fields]
+    else:
+        names = [opts.pk.attname]
+        for name in loaded_fields:
+            attname = opts.pk.attname if name == "pk" else opts.get_field(name).attname
+            if attname not in names:
+                names.append(attname)
+    queryset = queryset.values_list(*names, *queryset.query.annotation_select)
+    queryset._iterable_class = ModelRowIterable
+    return queryset
+
+
+def _unpickle_row(model_label: str, values: dict[str, Any]) -> ModelRow:
+    return get_row_class(apps.get_model(model_label)).from_values(values)
@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Iterator, Optional, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from strawberry.types.nodes import FragmentSpread, InlineFragment, SelectedField
+
+if TYPE_CHECKING:
+    from django.db.models import Model as DjangoModel  # pragma: nocover
+    from strawberry.field import StrawberryField  # pragma: nocover
+    from strawberry.types import Info  # pragma: nocover
+    from strawberry.types.nodes import Selection  # pragma: nocover
+    from strawberry_django.fields.field import StrawberryDjangoField  # pragma: nocover
+
+
+def get_selected_only_fields(info: "Info", connection: bool = False) -> Optional[frozenset[str]]:
+    """
+    Return names of the model fields needed to resolve the selection of the field currently being resolved.
+    The result is meant to be passed to `QuerySet.only()`.
+
+    Returns None when the fields can't be determined reliably (e.g. a custom resolver without `only` hints
+    or a fragment on another type is selected), in which case all the fields should be loaded.
+
+    With `connection=True`, the field resolves a relay connection and the selection of `edges { node }` is used.
+    """
+    field_data: "StrawberryDjangoField" = info._field
+    django_type = field_data.django_type
+    if django_type is None:
+        return None
+    model: Type["DjangoModel"] = field_data.django_model
+    name_converter = info.schema.config.name_converter
+    type_fields: dict[str, "StrawberryField"] = {
+        name_converter.from_field(type_field): type_field for type_field in django_type.__strawberry_definition__.fields
+    }
+
+    selections = info.selected_fields[0].selections
+    if connection:
+        selections = get_connection_node_selections(selections)
+
+    only: set[str] = set()
+    for selected_field in iter_selected_fields(selections):
+        if selected_field.name.startswith("__"):  # introspection, e.g. `__typename`
+            continue
+        type_field = type_fields.get(selected_field.name)
+        if type_field is None:
+            return None
+        field_only = get_type_field_only(model, type_field)
+        if field_only is None:
+            return None
+        only.update(field_only)
+    return frozenset(only)
+
+
+def get_type_field_only(model: Type["DjangoModel"], type_field: "StrawberryField") -> Optional[set[str]]:
+    """
+    Return model fields needed to resolve the strawberry type field, or None if they are unknown.
+    Fields with a custom resolver need to declare what they use via the strawberry-django `only` hints,
+    unless they resolve a relation (in which case the foreign key column is enough for dataloaders).
+    """
+    store = getattr(type_field, "store", None)
+    hints: set[str] = set(store.only) if store is not None else set()
+    django_name = getattr(type_field, "django_name", None) or type_field.python_name
+    try:
+        model_field = model._meta.get_field(django_name)
+    except FieldDoesNotExist:
+        return hints or None
+
+    if model_field.is_relation:
+        return hints | {model_field.name} if model_field.concrete else hints
+    if type_field.base_resolver is not None and not hints:
+        return None
+    return hints | {model_field.name}
+
+
+def iter_selected_fields(selections: list["Selection"]) -> Iterator[SelectedField]:
+    """Iterate over selected fields, including the ones selected through fragments."""
+    for selection in selections:
+        if isinstance(selection, (FragmentSpread, InlineFragment)):
+            yield from iter_selected_fields(selection.selections)
+        elif isinstance(selection, SelectedField):
+            yield selection
+
+
+def get_connection_node_selections(selections: list["Selection"]) -> list["Selection"]:
+    """Return selections of the nodes of a relay connection (`edges { node { ... } }`)."""
+    node_selections: list["Selection"] = []
+    for edges_field in iter_selected_fields(selections):
+        if edges_field.name != "edges":
+            continue
+        for node_field in iter_selected_fields(edges_field.selections):
+            if node_field.name == "node":
+                node_selections.extend(node_field.selections)
+    return node_selections
@@ -0,0 +1,58 @@
+from typing import Any
+
+from django.conf import settings as django_settings
+
+SETTINGS_NAME = "STRAWBERRY_DJANGO_DATALOADERS"
+
+DEFAULTS: dict[str, Any] = {
+    # how dataloader queries are executed, see `core.backends.ExecutionBackend`
+    "EXECUTION_BACKEND": "sync_to_async",
+    # maximum number of worker threads (i.e. persistent DB connections) of the 'thread_pool' execution backend
+    "THREAD_POOL_MAX_WORKERS": None,
+    # Django cache alias used by the cross-request cache of dataloaders with `shared_cache = True`
+    "SHARED_CACHE_ALIAS": "default",
+    # max number of keys in a single `IN (...)` query, None means derived from the DB backend parameters limit
+    "MAX_KEYS_PER_QUERY": None,
+    # max number of query parameters of DB backends not declaring their limit (65535 is the limit of PostgreSQL)
+    "MAX_QUERY_PARAMS": 65_535,
+    # pass the keys as a single array parameter (`= ANY(%s)`) instead of `IN (...)` on PostgreSQL
+    "ARRAY_PARAMETER": False,
+    # compile the batch queries of dataloaders once and execute them with new keys only, see `core.statements`
+    "PREPARED_STATEMENTS": False,
+    # max number of compiled batch queries kept in memory (least recently used are dropped)
+    "PREPARED_STATEMENTS_MAX_ENTRIES": 1000,
+    # fetch batches of different dataloaders of the same model dispatched at the same time by a single query
+    "FUSE_BATCHES": False,
+    # number of keys from which a batch is loaded by parallel queries on the thread pool, None means never
+    "PARALLEL_THRESHOLD": None,
+    # number of shards (parallel queries) the keys of a batch above `PARALLEL_THRESHOLD` are split into
+    "PARALLEL_SHARDS": 4,
+    # max number of keys in a single dataloader batch, None means no limit
+    "MAX_BATCH_SIZE": None,
+    # number of seconds the dataloader batches are collected for, None means until the end of the event loop iteration
+    "BATCH_WINDOW": None,
+    # number of event loop iterations the dataloader batches are collected for, None means 1
+    "BATCH_TICKS": None,
+    # hold the dataloader batches until the resolvers of the request are parked, see `core.dispatch.IdleDispatcher`
+    "DISPATCH_WHEN_IDLE": False,
+    # max number of queries of a GraphQL operation checked by `query_guard.QueryGuardExtension`, None means no budget
+    "QUERY_BUDGET": None,
+    # number of unbatched queries of the same shape reported as N+1 by `query_guard.QueryGuardExtension`
+    "QUERY_GUARD_REPEAT_THRESHOLD": 3,
+    # raise `QueryGuardError` on violations found by `query_guard.QueryGuardExtension` instead of logging a warning
+    "QUERY_GUARD_STRICT": False,
+    # max number of values cached by each dataloader (least recently used are evicted), None means no limit
+    "CACHE_MAX_ENTRIES": None,
+    # max number of seconds the values are cached by dataloaders, None means no limit
+    "CACHE_TTL": None,
+}
+
+
+def get_setting(name: str) -> Any:
+    """
+    Return the package setting. Settings are defined in Django settings as a dictionary, e.g.
+        STRAWBERRY_DJANGO_DATALOADERS = {
+            "EXECUTION_BACKEND": "async_orm",
+        }
+    """
+    return getattr(django_settings, SETTINGS_NAME, {}).get(name, DEFAULTS[name])
@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Optional, Type
+
+from django.core.cache import caches
+from django.db import connections, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from strawberry_django_dataloaders.settings import get_setting
+
+if TYPE_CHECKING:
+    from django.core.cache.backends.base import BaseCache  # pragma: nocover
+    from django.db.models import Model as DjangoModel  # pragma: nocover
+
+KEY_PREFIX = "strawberry_django_dataloaders"
+
+
+@dataclass
+class SharedCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class SharedModelCache:
+    """
+    Cross-request cache of model instances (keyed by primary key) in the Django cache framework.
+
+    Keys of a model are versioned - bumping the version invalidates all the cached instances of the model at once.
+    At most `max_entries` instances of a model are kept: each cached instance takes the next slot of a ring
+    of `max_entries` slots (shared by all the processes) and evicts the instance cached in it before, i.e. the oldest
+    ones are evicted first, one by one. Instances cached again take a new slot, so the old slot may evict them
+    earlier (they are fetched from the database again). `max_entries = None` leaves the culling to the cache backend.
+    Cached instances are invalidated automatically on `post_save`, `post_delete` and `m2m_changed` signals
+    of the models registered by `register` (done when a dataloader class with `shared_cache = True` is defined,
+    so that writes of processes never loading the dataloader invalidate the cache too).
+    """
+
+    registered_models: set[Type["DjangoModel"]] = set()
+    stats: dict[str, SharedCacheStats] = {}
+
+    def __init__(self, model: Type["DjangoModel"], timeout: Optional[int], max_entries: Optional[int]):
+        self.model = model
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.register(model)
+
+    @property
+    def cache(self) -> "BaseCache":
+        return get_cache()
+
+    @property
+    def model_stats(self) -> SharedCacheStats:
+        return self.stats.setdefault(self.model._meta.label_lower, SharedCacheStats())
+
+    def get_many(self, keys: Iterable[Hashable]) -> dict[Hashable, "DjangoModel"]:
+        keys = list(keys)
+        version = get_model_version(self.model)
+        cache_keys = {get_instance_key(self.model, version, key): key for key in keys}
+        cached = {cache_keys[cache_key]: inst for cache_key, inst in self.cache.get_many(cache_keys).items()}
+        self.model_stats.hits += len(cached)
+        self.model_stats.misses += len(keys) - len(cached)
+        return cached
+
+    def set_many(self, instances: dict[Hashable, "DjangoModel"]) -> None:
+        if not instances:
+            return
+        version = get_model_version(self.model)
+        if self.max_entries is not None:
+            instances = dict(list(instances.items())[-self.max_entries :])
+        entries = {get_instance_key(self.model, version, key): inst for key, inst in instances.items()}
+        if self.max_entries is not None:
+            entries.update(self._take_slots(version, list(instances)))
+        self.cache.set_many(entries, timeout=self.timeout)
+
+    def _take_slots(self, version: int, keys: list[Hashable]) -> dict[str, Hashable]:
+        """Evict the instances from the next ring slots of the keys, return the slot entries to store."""
+        model_key = get_model_key(self.model)
+        position_key = f"{model_key}:{version}:position"
+        self.cache.add(position_key, 0, timeout=None)
+        try:
+            end = self.cache.incr(position_key, len(keys))
+        except ValueError:  # evicted in the meantime
+            end = len(keys)
+        slot_keys = [f"{model_key}:{version}:slot:{pos % self.max_entries}" for pos in range(end - len(keys), end)]
+        evicted = set(self.cache.get_many(slot_keys).values()).difference(keys)
+        if evicted:
+            self.cache.delete_many([get_instance_key(self.model, version, key) for key in evicted])
+        return dict(zip(slot_keys, keys))
+
+    @classmethod
+    def register(cls, model: Type["DjangoModel"]) -> None:
+        """Invalidate cached instances of the model when they change."""
+        if model in cls.registered_models:
+            return
+        cls.registered_models.add(model)
+        dispatch_uid = f"{KEY_PREFIX}:{model._meta.label_lower}"
+        post_save.connect(_invalidate_instance, sender=model, dispatch_uid=dispatch_uid, weak=False)
+        post_delete.connect(_invalidate_instance, sender=model, dispatch_uid=dispatch_uid, weak=False)
+
+
+def get_cache() -> "BaseCache":
+    return caches[get_setting("SHARED_CACHE_ALIAS")]
+
+
+def get_model_key(model: Type["DjangoModel"]) -> str:
+    return f"{KEY_PREFIX}:{model._meta.label_lower}"
+
+
+def get_instance_key(model: Type["DjangoModel"], version: int, pk: Hashable) -> str:
+    return f"{get_model_key(model)}:{version}:{pk}"
+
+
+def get_model_version(model: Type["DjangoModel"]) -> int:
+    return get_cache().get_or_set(f"{get_model_key(model)}:version", 1, timeout=None)
+
+
+def invalidate_model(model: Type["DjangoModel"]) -> None:
+    """Invalidate all cached instances of the model (e.g. after `QuerySet.update()`, which sends no signals)."""
+    cache = get_cache()
+    version_key = f"{get_model_key(model)}:version"
+    try:
+        cache.incr(version_key)
+    except ValueError:  # no version stored yet, so nothing is cached
+        cache.set(version_key, 1, timeout=None)
+
+
+def invalidate_instances(model: Type["DjangoModel"], pks: Iterable[Hashable]) -> None:
+    version = get_model_version(model)
+    get_cache().delete_many([get_instance_key(model, version, pk) for pk in pks])
+
+
+def get_shared_cache_stats(model: Type["DjangoModel"]) -> SharedCacheStats:
+    """Return hit/miss counters of the shared cache of the model (counted per process)."""
+    return SharedModelCache.stats.setdefault(model._meta.label_lower, SharedCacheStats())
+
+
+def _invalidate_now_and_on_commit(using: Optional[str], invalidate: Callable[[], Any]) -> None:
+    """
+    Invalidate right away and once more after the transaction of the write commits - a concurrent reader
+    could cache the not yet committed (i.e. the old) row in the meantime.
+    """
+    invalidate()
+    connection = connections[using] if using is not None else None
+    if connection is not None and connection.in_atomic_block:
+        transaction.on_commit(invalidate, using=using)
+
+
+def _invalidate_instance(sender: Type["DjangoModel"], instance: "DjangoModel", **kwargs: Any) -> None:
+    pk = instance.pk
+    _invalidate_now_and_on_commit(kwargs.get("using"), lambda: invalidate_instances(sender, [pk]))
+
+
+def _invalidate_m2m(
+    sender: Type["DjangoModel"],
+    instance: "DjangoModel",
+    action: str,
+    model: Type["DjangoModel"],
+    pk_set: Optional[set],
+    **kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+    instance_model, instance_pk = instance.__class__, instance.pk
+    if pk_set is not None:
+        pk_set = set(pk_set)
+
+    def invalidate() -> None:
+        if instance_model in SharedModelCache.registered_models:
+            invalidate_instances(instance_model, [instance_pk])
+        if model in SharedModelCache.registered_models:
+            if pk_set is None:  # `clear()` doesn't tell which instances were affected
+                invalidate_model(model)
+            else:
+                invalidate_instances(model, pk_set)
+
+    _invalidate_now_and_on_commit(kwargs.get("using"), invalidate)
+
+
+m2m_changed.connect(_invalidate_m2m, dispatch_uid=f"{KEY_PREFIX}:m2m_changed")
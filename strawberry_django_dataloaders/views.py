@@ -4,15 +4,43 @@ from typing import TYPE_CHECKING, Type
 from strawberry.django.context import StrawberryDjangoContext
 from strawberry.django.views import AsyncGraphQLView
 
+from strawberry_django_dataloaders.core.dispatch import IdleDispatcher
+from strawberry_django_dataloaders.core.scheduler import BatchScheduler
+from strawberry_django_dataloaders.identity_map import IdentityMap
+
 if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse  # pragma: nocover
 
+    from strawberry_django_dataloaders.arguments import QueryArguments  # pragma: nocover
     from strawberry_django_dataloaders.core.dataloader import BaseDataLoader  # pragma: nocover
+    from strawberry_django_dataloaders.instrumentation import DataloaderObserver  # pragma: nocover
 
 
 @dataclass
 class DataloaderContext(StrawberryDjangoContext):
     dataloaders: dict[Type["BaseDataLoader"], "BaseDataLoader"] = field(default_factory=dict)
+    identity_map: IdentityMap = field(default_factory=IdentityMap)
+    # observers notified about the dataloader batches of this request only, see `instrumentation`
+    dataloader_observers: list["DataloaderObserver"] = field(default_factory=list)
+    # read from the primary database (`router.db_for_write`) instead of replicas, e.g. after a mutation
+    use_primary_db: bool = False
+    # fuses the queries of dataloaders of the same model, see `BaseDjangoModelDataLoader.fuse_batches`
+    batch_scheduler: BatchScheduler = field(default_factory=BatchScheduler)
+    # dispatches the batches once the resolvers are parked, see `BaseDataLoader.dispatch_when_idle`
+    idle_dispatcher: IdleDispatcher = field(default_factory=IdleDispatcher)
+    # filter and order arguments of the `fields.DataloaderField`s being resolved, by their GraphQL path
+    dataloader_query_arguments: dict[tuple, "QueryArguments"] = field(default_factory=dict)
+
+    def clear_dataloaders(self) -> None:
+        """
+        Drop all the dataloaders of the context with their caches, and the identity map. Meant to be called
+        in long-lived contexts, e.g. between the events of a subscription, so that the memory doesn't keep growing
+        and the following events don't see stale instances.
+        """
+        for loader in self.dataloaders.values():
+            loader.reset()
+        self.dataloaders.clear()
+        self.identity_map.clear()
 
 
 class DataloaderAsyncGraphQLView(AsyncGraphQLView):
@@ -1,15 +1,21 @@
 from dataclasses import dataclass, field
 from typing import Any, Callable, Coroutine, Type
+from unittest.mock import patch
 
 import pytest
+from django.db.backends.utils import CursorWrapper
 from django.http import HttpResponse
 from django.test import AsyncClient
 
+from strawberry_django_dataloaders.views import DataloaderContext
+
 from . import models
 from .tests import fixtures
 from .tests.fixtures import BaseResponseFixture
 from .tests.gql_queries import GQLQueries
 
+pytest_plugins = ["strawberry_django_dataloaders.pytest_plugin"]
+
 
 @dataclass
 class DbData:
@@ -28,6 +34,12 @@ class TestCollection:
     exp_response: Type[BaseResponseFixture]
 
 
+@pytest.fixture
+def context() -> DataloaderContext:
+    """Dataloader context of a request."""
+    return DataloaderContext(request=None, response=None)
+
+
 @pytest.fixture
 def db_data(db) -> DbData:
     """Generate some default db data."""
@@ -35,6 +47,7 @@ def db_data(db) -> DbData:
     fruit_plant_names = ["strawberry plant", "raspberry plant", None]
     color_names = ["red", "yellow", "orange"]
     eater_names = ["pepa", "josef"]
+    variety_names = ["garden", "wild"]
     data = DbData()
     for fruit_name, plant_name, color_name in zip(fruit_names, fruit_plant_names, color_names):
         color = models.Color.objects.create(name=color_name)
@@ -43,9 +56,51 @@ def db_data(db) -> DbData:
         data.colors.append(color)
 
     data.eaters = [models.FruitEater.objects.create(name=name, favourite_fruit=data.fruits[0]) for name in eater_names]
+
+    data.varieties = [models.FruitVariety.objects.create(name=name) for name in variety_names]
+    data.fruits[0].varieties.set(data.varieties)
+    data.fruits[1].varieties.set(data.varieties[1:])
+    data.eaters[0].tasted_fruits.set(data.fruits[:2], through_defaults={"rating": 5})
+    data.eaters[1].tasted_fruits.set(data.fruits[1:2], through_defaults={"rating": 3})
+    return data
+
+
+@pytest.fixture
+def large_db_data(db) -> DbData:
+    """Generate many fruits sharing a few colors, each fruit having a plant and an eater."""
+    fruits_count = 1200
+    data = DbData()
+    data.colors = models.Color.objects.bulk_create([models.Color(name=name) for name in ["red", "yellow", "orange"]])
+    plants = models.FruitPlant.objects.bulk_create([models.FruitPlant(name=f"plant {i}") for i in range(fruits_count)])
+    data.fruits = models.Fruit.objects.bulk_create(
+        [
+            models.Fruit(name=f"fruit {i}", color=data.colors[i % len(data.colors)], plant=plant)
+            for i, plant in enumerate(plants)
+        ]
+    )
+    data.eaters = models.FruitEater.objects.bulk_create(
+        [models.FruitEater(name=f"eater {i}", favourite_fruit=fruit) for i, fruit in enumerate(data.fruits)]
+    )
     return data
 
 
+@pytest.fixture
+def executed_queries() -> list[str]:
+    """
+    Collect SQL of all queries executed during the test.
+    Dataloaders run their queries in a worker thread, so the per-connection `CaptureQueriesContext` can't be used.
+    """
+    queries: list[str] = []
+    original_execute = CursorWrapper._execute
+
+    def _execute(self, sql, params, *args):
+        queries.append(sql)
+        return original_execute(self, sql, params, *args)
+
+    with patch.object(CursorWrapper, "_execute", _execute):
+        yield queries
+
+
 @pytest.fixture
 def arequest(
     async_client: AsyncClient,
@@ -66,6 +121,16 @@ def baseline_collection(db_data: DbData) -> TestCollection:
     return collection
 
 
+@pytest.fixture
+def m2m_collection(db_data: DbData) -> TestCollection:
+    collection = TestCollection(
+        query=GQLQueries.FRUITS_M2M,
+        exp_response=fixtures.FruitsM2MResponseFixture,
+        db_data=db_data,
+    )
+    return collection
+
+
 @pytest.fixture
 def empty_db_collection() -> TestCollection:
     collection = TestCollection(
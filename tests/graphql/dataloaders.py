@@ -14,3 +14,23 @@ class FruitPlantPKDataLoader(dataloaders.BasicPKDataLoader):
 class FruitEatersReverseFKDataLoader(dataloaders.BasicReverseFKDataLoader):
     model = models.FruitEater
     reverse_path = "favourite_fruit_id"
+
+
+class FruitVarietiesM2MDataLoader(dataloaders.BasicM2MDataLoader):
+    model = models.FruitVariety
+    reverse_path = "fruits"
+
+
+class FruitTastersM2MDataLoader(dataloaders.BasicM2MDataLoader):
+    model = models.FruitEater
+    reverse_path = "tasted_fruits"
+
+
+class ColorSharedCachePKDataLoader(dataloaders.BasicPKDataLoader):
+    model = models.Color
+    shared_cache = True
+
+
+class FruitVarietySharedCachePKDataLoader(dataloaders.BasicPKDataLoader):
+    model = models.FruitVariety
+    shared_cache = True
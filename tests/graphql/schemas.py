@@ -3,6 +3,9 @@ from functools import partial
 import strawberry
 import strawberry.django
 
+from strawberry_django_dataloaders.instrumentation import DataloaderStatsExtension
+from strawberry_django_dataloaders.query_guard import QueryGuardExtension
+
 from . import types
 
 
@@ -21,7 +24,75 @@ class AutoDataLoaderFieldsQuery:
     fruits: list[types.FruitTypeAutoDataLoaderFields] = strawberry.django.field()
 
 
+@strawberry.type
+class ProjectedAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypeProjectedAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class PaginatedAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypePaginatedAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class AggregateAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypeAggregateAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class RowModeAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypeRowModeAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class GenericAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypeGenericAutoDataLoaderFields] = strawberry.django.field()
+    comments: list[types.CommentType] = strawberry.django.field()
+
+
+@strawberry.type
+class LookaheadAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypeLookaheadAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class UniqueFieldAutoDataLoaderFieldsQuery:
+    plants: list[types.FruitPlantTypeAutoDataLoaderFields] = strawberry.django.field()
+    eaters: list[types.FruitEaterTypeAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class FilteredAutoDataLoaderFieldsQuery:
+    fruits: list[types.FruitTypeFilteredAutoDataLoaderFields] = strawberry.django.field()
+    eaters: list[types.FruitEaterTypeFilteredAutoDataLoaderFields] = strawberry.django.field()
+
+
+@strawberry.type
+class DelayedDataLoadersQuery:
+    fruits: list[types.FruitTypeDelayedDataLoaders] = strawberry.django.field()
+
+
+@strawberry.type
+class QueryGuardQuery:
+    fruits: list[types.FruitTypeAutoDataLoaderFields] = strawberry.django.field()
+    eaters: list[types.FruitEaterType] = strawberry.django.field()  # the favourite fruit isn't loaded by a dataloader
+
+
 _base_schema = partial(strawberry.Schema, mutation=None)
 dataloaders_schema = _base_schema(query=DataLoadersQuery)
 dataloader_factories_schema = _base_schema(query=DataLoaderFactoriesQuery)
 auto_dataloader_fields_schema = _base_schema(query=AutoDataLoaderFieldsQuery)
+projected_auto_dataloader_fields_schema = _base_schema(query=ProjectedAutoDataLoaderFieldsQuery)
+paginated_auto_dataloader_fields_schema = _base_schema(query=PaginatedAutoDataLoaderFieldsQuery)
+aggregate_auto_dataloader_fields_schema = _base_schema(query=AggregateAutoDataLoaderFieldsQuery)
+row_mode_auto_dataloader_fields_schema = _base_schema(query=RowModeAutoDataLoaderFieldsQuery)
+generic_auto_dataloader_fields_schema = _base_schema(query=GenericAutoDataLoaderFieldsQuery)
+lookahead_auto_dataloader_fields_schema = _base_schema(query=LookaheadAutoDataLoaderFieldsQuery)
+unique_field_auto_dataloader_fields_schema = _base_schema(query=UniqueFieldAutoDataLoaderFieldsQuery)
+filtered_auto_dataloader_fields_schema = _base_schema(query=FilteredAutoDataLoaderFieldsQuery)
+delayed_dataloaders_schema = _base_schema(query=DelayedDataLoadersQuery)
+instrumented_auto_dataloader_fields_schema = _base_schema(
+    query=AutoDataLoaderFieldsQuery,
+    extensions=[DataloaderStatsExtension],
+)
+query_guard_schema = _base_schema(query=QueryGuardQuery, extensions=[QueryGuardExtension])
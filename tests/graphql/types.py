@@ -1,5 +1,9 @@
+import asyncio
+
 import strawberry
 import strawberry.django
+import strawberry_django
+from strawberry import relay
 from strawberry.types import Info
 
 from strawberry_django_dataloaders import factories, fields
@@ -12,6 +16,7 @@ from . import dataloaders
 class FruitVarietyType:
     id: strawberry.auto
     name: strawberry.auto
+    description: strawberry.auto
 
 
 @strawberry.django.type(models.FruitPlant)
@@ -23,12 +28,14 @@ class FruitPlantType:
 @strawberry.django.type(models.Color)
 class ColorType:
     name: strawberry.auto
+    description: strawberry.auto
     fruits: strawberry.auto
 
 
 @strawberry.django.type(models.FruitEater)
 class FruitEaterType:
     name: strawberry.auto
+    description: strawberry.auto
     favourite_fruit: strawberry.auto
 
 
@@ -51,6 +58,14 @@ class FruitTypeDataLoaders:
     async def eaters(self: "models.Fruit", info: "Info") -> list[FruitEaterType]:
         return await dataloaders.FruitEatersReverseFKDataLoader(context=info.context).load(self.pk)
 
+    @strawberry.field
+    async def varieties(self: "models.Fruit", info: "Info") -> list[FruitVarietyType]:
+        return await dataloaders.FruitVarietiesM2MDataLoader(context=info.context).load(self.pk)
+
+    @strawberry.field
+    async def tasters(self: "models.Fruit", info: "Info") -> list[FruitEaterType]:
+        return await dataloaders.FruitTastersM2MDataLoader(context=info.context).load(self.pk)
+
 
 @strawberry.django.type(models.Fruit)
 class FruitTypeDataLoaderFactories:
@@ -75,12 +90,17 @@ class FruitTypeDataLoaderFactories:
             "tests.FruitEater",
             reverse_path="favourite_fruit_id",
         )
-        return await loader(context=info.context).load(self.color_id)
+        return await loader(context=info.context).load(self.pk)
+
+    @strawberry.field
+    async def varieties(self: "models.Fruit", info: "Info") -> list[FruitVarietyType]:
+        loader = factories.M2MDataLoaderFactory.get_loader_class("tests.FruitVariety", reverse_path="fruits")
+        return await loader(context=info.context).load(self.pk)
 
-    # @strawberry.field  # TODO is M2M - need to create dataloader & factory for such relation
-    # async def types(self: "models.Fruit", info: "Info") -> list["ColorType"]:
-    #     loader = factories.PKDataLoaderFactory.get_loader_class('tests.Color')
-    #     return await loader(context=info.context).load(self.color_id)
+    @strawberry.field
+    async def tasters(self: "models.Fruit", info: "Info") -> list[FruitEaterType]:
+        loader = factories.M2MDataLoaderFactory.get_loader_class("tests.FruitEater", reverse_path="tasted_fruits")
+        return await loader(context=info.context).load(self.pk)
 
 
 @strawberry.django.type(models.Fruit)
@@ -93,3 +113,178 @@ class FruitTypeAutoDataLoaderFields:
     plant: FruitPlantType | None = fields.auto_dataloader_field()
     varieties: list[FruitVarietyType] = fields.auto_dataloader_field()
     eaters: list[FruitEaterType] = fields.auto_dataloader_field()
+    tasters: list[FruitEaterType] = fields.auto_dataloader_field()
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeProjectedAutoDataLoaderFields:
+    """Uses auto dataloader fields loading only the selected columns."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    color: ColorType | None = fields.auto_dataloader_field(projection=True)
+    varieties: list[FruitVarietyType] = fields.auto_dataloader_field(projection=True)
+    eaters: list[FruitEaterType] = fields.auto_dataloader_field(projection=True)
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypePaginatedAutoDataLoaderFields:
+    """Uses auto dataloader fields with ordered and paginated lists."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    varieties: list[FruitVarietyType] = fields.auto_dataloader_field(order_by=["-name"], pagination=True)
+    eaters: list[FruitEaterType] = fields.auto_dataloader_field(order_by=["name"], pagination=True)
+    eaters_connection: relay.ListConnection[FruitEaterType] = fields.auto_dataloader_connection(
+        field_name="eaters",
+        order_by=["name"],
+        projection=True,
+    )
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeAggregateAutoDataLoaderFields:
+    """Uses auto dataloader fields resolving aggregates of the related instances."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    eaters_count: int = fields.auto_dataloader_field(field_name="eaters", aggregate="count")
+    tasters_count: int = fields.auto_dataloader_field(field_name="tasters", aggregate="count")
+    has_varieties: bool = fields.auto_dataloader_field(field_name="varieties", aggregate="exists")
+    max_rating: int | None = fields.auto_dataloader_field(
+        field_name="fruittasting",
+        aggregate="max",
+        aggregate_field="rating",
+    )
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeRowModeAutoDataLoaderFields:
+    """Uses auto dataloader fields loading lightweight rows instead of model instances."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    color: ColorType | None = fields.auto_dataloader_field(row_mode=True)
+    varieties: list[FruitVarietyType] = fields.auto_dataloader_field(row_mode=True, projection=True)
+    eaters: list[FruitEaterType] = fields.auto_dataloader_field(row_mode=True, projection=True)
+
+
+@strawberry.django.type(models.Fruit)
+class CommentedFruitType:
+    id: strawberry.auto
+    name: strawberry.auto
+
+
+@strawberry.django.type(models.Comment)
+class CommentType:
+    name: strawberry.auto
+    content_object: CommentedFruitType | ColorType | None = fields.auto_dataloader_field()
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeGenericAutoDataLoaderFields:
+    """Uses auto dataloader fields of generic relations."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    comments: list[CommentType] = fields.auto_dataloader_field(order_by=["name"], pagination=True)
+
+
+@strawberry.django.type(models.Fruit)
+class LookaheadFruitType:
+    name: strawberry.auto
+    color: ColorType | None = fields.auto_dataloader_field()
+    plant: FruitPlantType | None = fields.auto_dataloader_field()
+
+
+@strawberry.django.type(models.FruitEater)
+class LookaheadFruitEaterType:
+    name: strawberry.auto
+    favourite_fruit: LookaheadFruitType | None = fields.auto_dataloader_field()
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeLookaheadAutoDataLoaderFields:
+    """Uses auto dataloader fields joining the nested to-one relations of the selection."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    eaters: list[LookaheadFruitEaterType] = fields.auto_dataloader_field(lookahead=True)
+    tasters: list[LookaheadFruitEaterType] = fields.auto_dataloader_field(lookahead=True, projection=True)
+
+
+@strawberry.django.type(models.FruitPlant)
+class FruitPlantTypeAutoDataLoaderFields:
+    name: strawberry.auto
+    fruit: LookaheadFruitType | None = fields.auto_dataloader_field()
+
+
+@strawberry.django.type(models.FruitEater)
+class FruitEaterTypeAutoDataLoaderFields:
+    name: strawberry.auto
+    favourite_color: ColorType | None = fields.auto_dataloader_field()
+
+
+@strawberry_django.filters.filter(models.FruitEater, lookups=True)
+class FruitEaterFilter:
+    name: strawberry.auto
+
+
+@strawberry_django.ordering.order(models.FruitEater)
+class FruitEaterOrder:
+    name: strawberry.auto
+
+
+@strawberry.django.type(models.FruitEater)
+class VisibleFruitEaterType:
+    """Hides the eaters whose name is excluded by the `hidden_eater` of the context."""
+
+    name: strawberry.auto
+    favourite_fruit: LookaheadFruitType | None = fields.auto_dataloader_field()
+
+    @classmethod
+    def get_queryset(cls, queryset, info: "Info", **kwargs):
+        return queryset.exclude(name=info.context.hidden_eater)
+
+
+@strawberry.django.type(models.Fruit)
+class VisibleFruitType:
+    """Hides the fruits whose name is excluded by the `hidden_fruit` of the context."""
+
+    name: strawberry.auto
+
+    @classmethod
+    def get_queryset(cls, queryset, info: "Info", **kwargs):
+        return queryset.exclude(name=info.context.hidden_fruit)
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeFilteredAutoDataLoaderFields:
+    """Uses auto dataloader fields with filter and order arguments and types with `get_queryset`."""
+
+    id: strawberry.auto
+    name: strawberry.auto
+    eaters: list[FruitEaterType] = fields.auto_dataloader_field(filters=FruitEaterFilter, order=FruitEaterOrder)
+    tasters: list[FruitEaterType] = fields.auto_dataloader_field(
+        filters=FruitEaterFilter, order=FruitEaterOrder, pagination=True
+    )
+    visible_eaters: list[VisibleFruitEaterType] = fields.auto_dataloader_field(field_name="eaters")
+
+
+@strawberry.django.type(models.FruitEater)
+class FruitEaterTypeFilteredAutoDataLoaderFields:
+    name: strawberry.auto
+    favourite_fruit: VisibleFruitType | None = fields.auto_dataloader_field()
+
+
+@strawberry.django.type(models.Fruit)
+class FruitTypeDelayedDataLoaders:
+    """Its resolvers reach the dataloaders in different event loop iterations."""
+
+    name: strawberry.auto
+
+    @strawberry.field
+    async def color(self: "models.Fruit", info: "Info") -> ColorType | None:
+        for _ in range(self.pk % 3 * 5):
+            await asyncio.sleep(0)
+        return await dataloaders.ColorPKDataLoader(context=info.context).load(self.color_id)
@@ -1,8 +1,11 @@
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 
 class BaseTestModel(models.Model):
     name = models.CharField(max_length=32)
+    description = models.TextField(blank=True)
 
     class Meta:
         abstract = True
@@ -15,6 +18,7 @@ class Fruit(BaseTestModel):
     plant = models.OneToOneField("FruitPlant", on_delete=models.SET_NULL, null=True)
     color = models.ForeignKey("Color", null=True, blank=True, related_name="fruits", on_delete=models.CASCADE)
     varieties = models.ManyToManyField("FruitVariety", related_name="fruits")
+    comments = GenericRelation("Comment")
 
 
 class FruitPlant(BaseTestModel):
@@ -23,6 +27,21 @@ class FruitPlant(BaseTestModel):
 
 class FruitEater(BaseTestModel):
     favourite_fruit = models.ForeignKey("Fruit", null=True, on_delete=models.SET_NULL, related_name="eaters")
+    tasted_fruits = models.ManyToManyField("Fruit", through="FruitTasting", related_name="tasters")
+    favourite_color = models.ForeignKey(
+        "Color",
+        to_field="code",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="fans",
+    )
+
+
+class FruitTasting(models.Model):
+    eater = models.ForeignKey("FruitEater", on_delete=models.CASCADE)
+    fruit = models.ForeignKey("Fruit", on_delete=models.CASCADE)
+    rating = models.PositiveSmallIntegerField(default=0)
 
 
 class FruitVariety(BaseTestModel):
@@ -30,4 +49,11 @@ class FruitVariety(BaseTestModel):
 
 
 class Color(BaseTestModel):
-    pass
+    code = models.CharField(max_length=16, unique=True, null=True, blank=True)
+    comments = GenericRelation("Comment")
+
+
+class Comment(BaseTestModel):
+    content_type = models.ForeignKey(ContentType, null=True, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField(null=True)
+    content_object = GenericForeignKey("content_type", "object_id")
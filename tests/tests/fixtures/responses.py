@@ -31,3 +31,7 @@ class FruitsResponseFixture(BaseResponseFixture):
 
 class FruitsResponseEmptyDbFixture(BaseResponseFixture):
     file_path = path.join(BASE_PATH, "fruits_empty.json")
+
+
+class FruitsM2MResponseFixture(BaseResponseFixture):
+    file_path = path.join(BASE_PATH, "fruits_m2m.json")
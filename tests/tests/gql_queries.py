@@ -16,3 +16,15 @@ class GQLQueries(str, enum.Enum):
             }
         }
     }"""
+
+    FRUITS_M2M = """{
+        fruits {
+            name
+            varieties {
+                name
+            }
+            tasters {
+                name
+            }
+        }
+    }"""
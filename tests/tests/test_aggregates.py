@@ -0,0 +1,64 @@
+import pytest
+
+from strawberry_django_dataloaders import dataloaders, factories
+from tests import models
+from tests.graphql import schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+class FruitEatersCountDataLoader(dataloaders.ReverseFKCountDataLoader):
+    model = models.FruitEater
+    reverse_path = "favourite_fruit_id"
+
+
+class FruitVarietiesCountDataLoader(dataloaders.M2MCountDataLoader):
+    model = models.FruitVariety
+    reverse_path = "fruits"
+
+
+async def test_reverse_fk_count(db_data, context, executed_queries):
+    loader = FruitEatersCountDataLoader(context=context)
+    counts = [await count for count in [loader.load(fruit.pk) for fruit in db_data.fruits]]
+    assert counts == [2, 0, 0]
+    assert len(executed_queries) == 1
+    assert "GROUP BY" in executed_queries[0]
+
+
+async def test_m2m_count(db_data, context):
+    loader = FruitVarietiesCountDataLoader(context=context)
+    counts = [await count for count in [loader.load(fruit.pk) for fruit in db_data.fruits]]
+    assert counts == [2, 1, 0]
+
+
+async def test_factory_aggregates(db_data, context):
+    fruit_pks = [fruit.pk for fruit in db_data.fruits]
+    factory = factories.RelatedAggregateDataLoaderFactory
+    max_rating = factory.get_loader_class(
+        models.FruitTasting, reverse_path="fruit_id", aggregate="max", aggregate_field="rating"
+    )(context=context)
+    sum_rating = factory.get_loader_class(
+        models.FruitTasting, reverse_path="fruit_id", aggregate="sum", aggregate_field="rating"
+    )(context=context)
+    exists = factory.get_loader_class(models.FruitTasting, reverse_path="fruit_id", aggregate="exists")(context=context)
+    assert await max_rating.load_many(fruit_pks) == [5, 5, None]
+    assert await sum_rating.load_many(fruit_pks) == [5, 8, None]
+    assert await exists.load_many(fruit_pks) == [True, True, False]
+
+
+async def test_auto_dataloader_field_aggregates(db_data, context, executed_queries):
+    resp = await schemas.aggregate_auto_dataloader_fields_schema.execute(
+        "{ fruits { name eatersCount tastersCount hasVarieties maxRating } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"] == [
+        {"name": "strawberry", "eatersCount": 2, "tastersCount": 1, "hasVarieties": True, "maxRating": 5},
+        {"name": "raspberry", "eatersCount": 0, "tastersCount": 2, "hasVarieties": True, "maxRating": 5},
+        {"name": "banana", "eatersCount": 0, "tastersCount": 0, "hasVarieties": False, "maxRating": None},
+    ]
+    # fruits + one query per aggregated relation
+    assert len(executed_queries) == 5
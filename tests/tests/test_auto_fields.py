@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders import fields
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests.graphql import schemas, types
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def type_fields():
+    type_fields = types.FruitTypeAutoDataLoaderFields.__strawberry_definition__.fields
+    for type_field in type_fields:
+        if hasattr(type_field, "dataloader_relations"):
+            type_field.dataloader_relations.clear()
+    return type_fields
+
+
+async def test_relation_resolved_once_per_field(db_data, type_fields):
+    query = "{ fruits { color { name } plant { name } varieties { name } eaters { name } tasters { name } } }"
+    with patch.object(fields, "resolve_dataloader_relation", wraps=fields.resolve_dataloader_relation) as resolve:
+        for _ in range(2):  # two requests, each with its own context
+            resp = await schemas.auto_dataloader_fields_schema.execute(
+                query,
+                context_value=DataloaderContext(request=None, response=None),
+            )
+            assert not resp.errors
+
+    assert resolve.call_count == 5
+    color_field = next(type_field for type_field in type_fields if type_field.name == "color")
+    relation = color_field.dataloader_relations[type(db_data.fruits[0])]
+    assert relation.key_attname == "color_id"
+    assert relation.loader_class.model is type(db_data.colors[0])
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from strawberry_django_dataloaders import factories
+from tests import models
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def fuse_batches(settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"FUSE_BATCHES": True}
+
+
+def fruits_sql(executed_queries: list[str]) -> list[str]:
+    return [sql for sql in executed_queries if 'FROM "tests_fruit"' in sql]
+
+
+async def test_batches_of_same_model_are_fused(db_data, fuse_batches, context, executed_queries):
+    pk_loader = factories.PKDataLoaderFactory.get_loader_class(models.Fruit)(context=context)
+    color_fruits_loader = factories.ReverseFKDataLoaderFactory.get_loader_class(models.Fruit, reverse_path="color_id")(
+        context=context
+    )
+
+    fruit, color_fruits = await asyncio.gather(
+        pk_loader.load(db_data.fruits[0].pk, only=["name"]),
+        color_fruits_loader.load_many([color.pk for color in db_data.colors[1:]]),
+    )
+
+    assert fruit == db_data.fruits[0]
+    assert color_fruits == [[db_data.fruits[1]], [db_data.fruits[2]]]
+    assert len(fruits_sql(executed_queries)) == 1
+    # projection of the fused query is the union of the projections of the batches
+    assert fruit.get_deferred_fields() == set()
+
+
+async def test_ordered_lists_are_not_fused(db_data, fuse_batches, context, executed_queries):
+    pk_loader = factories.PKDataLoaderFactory.get_loader_class(models.Fruit)(context=context)
+    color_fruits_loader = factories.ReverseFKDataLoaderFactory.get_loader_class(
+        models.Fruit, reverse_path="color_id", order_by=["-name"]
+    )(context=context)
+
+    await asyncio.gather(pk_loader.load(db_data.fruits[0].pk), color_fruits_loader.load(db_data.colors[0].pk))
+
+    assert len(fruits_sql(executed_queries)) == 2
+
+
+async def test_batches_are_not_fused_by_default(db_data, context, executed_queries):
+    pk_loader = factories.PKDataLoaderFactory.get_loader_class(models.Fruit)(context=context)
+    color_fruits_loader = factories.ReverseFKDataLoaderFactory.get_loader_class(models.Fruit, reverse_path="color_id")(
+        context=context
+    )
+
+    await asyncio.gather(pk_loader.load(db_data.fruits[0].pk), color_fruits_loader.load(db_data.colors[0].pk))
+
+    assert len(fruits_sql(executed_queries)) == 2
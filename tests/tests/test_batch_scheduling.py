@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from strawberry_django_dataloaders import factories
+from strawberry_django_dataloaders.core.dispatch import IdleDispatcher
+from strawberry_django_dataloaders.instrumentation import SummaryObserver, get_batch_size_bucket
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests import models
+from tests.graphql import dataloaders, schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+QUERY = "{ fruits { name color { name } } }"
+
+
+async def execute_query(context: DataloaderContext) -> SummaryObserver:
+    observer = SummaryObserver()
+    context.dataloader_observers.append(observer)
+    resp = await schemas.delayed_dataloaders_schema.execute(QUERY, context_value=context)
+    assert not resp.errors
+    assert [fruit["color"]["name"] for fruit in resp.data["fruits"]] == ["red", "yellow", "orange"]
+    return observer
+
+
+async def test_batch_per_event_loop_iteration_by_default(db_data, context, executed_queries):
+    observer = await execute_query(context)
+    assert observer.summary["ColorPKDataLoader"].batch_size_histogram == {"1": 3}
+    assert len(executed_queries) == 4
+
+
+@pytest.mark.parametrize(
+    "scheduling",
+    [{"BATCH_TICKS": 15}, {"BATCH_WINDOW": 0.01}, {"DISPATCH_WHEN_IDLE": True}],
+    ids=["ticks", "window", "idle"],
+)
+async def test_batches_collected_for_longer(db_data, context, executed_queries, settings, scheduling):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = scheduling
+    # the resolvers spend up to 10 event loop iterations before loading, without any load of the request in flight
+    context.idle_dispatcher = IdleDispatcher(idle_ticks=15)
+    observer = await execute_query(context)
+    assert observer.summary["ColorPKDataLoader"].batch_size_histogram == {"2-3": 1}
+    assert len(executed_queries) == 2
+
+
+async def test_idle_dispatch_not_delayed_by_concurrent_work(db_data, context, executed_queries, settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"DISPATCH_WHEN_IDLE": True}
+    ticks, dispatched_at = 0, []
+
+    async def concurrent_request():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    class ColorPKDataLoader(dataloaders.ColorPKDataLoader):
+        async def dispatch_batch(self, batch):
+            dispatched_at.append(ticks)
+            await super().dispatch_batch(batch)
+
+    task = asyncio.ensure_future(concurrent_request())
+    try:
+        loader = ColorPKDataLoader(context=context)
+        assert await loader.load_many([color.pk for color in db_data.colors]) == db_data.colors
+    finally:
+        task.cancel()
+    assert len(executed_queries) == 1
+    # dispatched once the request is idle, not after `max_ticks` because of the busy event loop
+    assert dispatched_at[0] < context.idle_dispatcher.max_ticks
+
+
+async def test_max_batch_size(db_data, context, executed_queries, monkeypatch):
+    monkeypatch.setattr(dataloaders.ColorPKDataLoader, "max_batch_size", 2)
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    colors = await loader.load_many([color.pk for color in db_data.colors])
+    assert colors == db_data.colors
+    assert len(executed_queries) == 2
+
+
+async def test_factory_scheduling_options():
+    loader = factories.PKDataLoaderFactory.get_loader_class(models.Color, batch_ticks=3, max_batch_size=100)
+    assert (loader.batch_ticks, loader.max_batch_size) == (3, 100)
+    assert loader is not factories.PKDataLoaderFactory.get_loader_class(models.Color)
+
+
+async def test_batch_size_bucket():
+    assert [get_batch_size_bucket(size) for size in (0, 1, 2, 3, 4, 7, 8, 1000)] == [
+        "0",
+        "1",
+        "2-3",
+        "2-3",
+        "4-7",
+        "4-7",
+        "8-15",
+        "512-1023",
+    ]
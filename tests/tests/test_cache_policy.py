@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders import factories
+from strawberry_django_dataloaders.core.cache import BoundedCache
+from tests import models
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+def loader_class(**attrs) -> type[dataloaders.ColorPKDataLoader]:
+    return type("PolicyColorPKDataLoader", (dataloaders.ColorPKDataLoader,), attrs)
+
+
+async def test_lru_cache(db_data, context, executed_queries):
+    loader = loader_class(cache_max_entries=2)(context=context)
+    colors = db_data.colors
+
+    for color in colors:
+        await loader.load(color.pk)
+    assert len(executed_queries) == 3
+    await loader.load(colors[2].pk)
+    await loader.load(colors[1].pk)
+    assert len(executed_queries) == 3
+    await loader.load(colors[0].pk)  # evicted as the least recently used
+    assert len(executed_queries) == 4
+    assert isinstance(loader.cache_map, BoundedCache)
+    assert len(loader.cache_map.entries) == 2
+    assert set(loader._loaded_only) == {colors[0].pk, colors[1].pk}
+    # the instances aren't kept in the identity map for the lifetime of the context
+    assert context.identity_map.instances == {}
+
+
+async def test_ttl_cache(db_data, context, executed_queries):
+    loader = loader_class(cache_ttl=10)(context=context)
+    color = db_data.colors[0]
+
+    with patch("strawberry_django_dataloaders.core.cache.time.monotonic", return_value=100):
+        await loader.load(color.pk)
+    with patch("strawberry_django_dataloaders.core.cache.time.monotonic", return_value=109):
+        await loader.load(color.pk)
+    assert len(executed_queries) == 1
+    with patch("strawberry_django_dataloaders.core.cache.time.monotonic", return_value=110):
+        await loader.load(color.pk)
+    assert len(executed_queries) == 2
+
+
+async def test_cache_key_fn(db_data, context, executed_queries):
+    loader = loader_class(cache_max_entries=2)(context=context, cache_key_fn=str)
+    color = db_data.colors[0]
+
+    await loader.load(color.pk)
+    assert await loader.load(str(color.pk)) == color
+    assert len(executed_queries) == 1
+    assert list(loader.cache_map.entries) == [str(color.pk)]
+
+
+async def test_batch_only(db_data, context, executed_queries):
+    loader = loader_class(use_cache=False)(context=context)
+    color = db_data.colors[0]
+
+    assert await loader.load_many([color.pk, color.pk]) == [color, color]
+    await loader.load(color.pk)
+    assert len(executed_queries) == 2
+    assert loader._loaded_only == {}
+
+
+async def test_cache_setting(settings, context):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"CACHE_MAX_ENTRIES": 100}
+    loader = factories.PKDataLoaderFactory.get_loader_class(models.Color)(context=context)
+    assert loader.cache_map.max_entries == 100
+
+
+async def test_clear_dataloaders(db_data, context, executed_queries):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    await loader.load(db_data.colors[0].pk)
+
+    context.clear_dataloaders()
+
+    assert context.dataloaders == {}
+    assert context.identity_map.instances == {}
+    await dataloaders.ColorPKDataLoader(context=context).load(db_data.colors[0].pk)
+    assert len(executed_queries) == 2
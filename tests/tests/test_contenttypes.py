@@ -0,0 +1,143 @@
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from strawberry_django_dataloaders import exceptions, factories, fields
+from strawberry_django_dataloaders.contenttypes import GenericFKDataLoader, GenericRelationDataLoaderFactory
+from tests import models
+from tests.graphql import schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def content_types(db) -> tuple[ContentType, ContentType]:
+    return ContentType.objects.get_for_model(models.Fruit), ContentType.objects.get_for_model(models.Color)
+
+
+@pytest.fixture
+def comments_data(db_data, content_types):
+    """Two comments of the first fruit, one of the second fruit, one of the first color and an orphaned one."""
+    fruit_ct, color_ct = content_types
+    models.Comment.objects.bulk_create(
+        [
+            models.Comment(name="yummy", content_type=fruit_ct, object_id=db_data.fruits[0].pk),
+            models.Comment(name="sweet", content_type=fruit_ct, object_id=db_data.fruits[0].pk),
+            models.Comment(name="sour", content_type=fruit_ct, object_id=db_data.fruits[1].pk),
+            models.Comment(name="bright", content_type=color_ct, object_id=db_data.colors[0].pk),
+            models.Comment(name="orphan"),
+        ]
+    )
+    return db_data
+
+
+async def test_generic_fk_loads_one_query_per_model(comments_data, content_types, context, executed_queries):
+    fruit_ct, color_ct = content_types
+    loader = GenericFKDataLoader(context=context)
+    keys = [
+        (fruit_ct.pk, comments_data.fruits[1].pk),
+        (color_ct.pk, comments_data.colors[0].pk),
+        (fruit_ct.pk, comments_data.fruits[0].pk),
+        (fruit_ct.pk, 12345),
+        None,
+    ]
+    executed_queries.clear()
+
+    instances = await loader.load_many(keys)
+
+    assert instances == [comments_data.fruits[1], comments_data.colors[0], comments_data.fruits[0], None, None]
+    assert len(executed_queries) == 2  # content types are cached
+    # the instances are shared with the PK dataloaders of the models
+    color_loader = factories.PKDataLoaderFactory.get_loader_class(models.Color)(context=context)
+    assert await color_loader.load(comments_data.colors[0].pk) is instances[1]
+    assert len(executed_queries) == 2
+
+
+async def test_generic_fk_malformed_object_id(comments_data, content_types, context):
+    fruit_ct, _ = content_types
+    loader = GenericFKDataLoader(context=context)
+    keys = [(fruit_ct.pk, "not-a-pk"), (fruit_ct.pk, comments_data.fruits[0].pk)]
+    assert await loader.load_many(keys) == [None, comments_data.fruits[0]]
+
+
+async def test_generic_relation_loader(comments_data, context, executed_queries):
+    loader = GenericRelationDataLoaderFactory.get_loader_class(
+        models.Comment,
+        reverse_path="object_id",
+        parent_model=models.Fruit,
+        order_by=["name"],
+    )(context=context)
+
+    comments = await loader.load_many([fruit.pk for fruit in comments_data.fruits])
+
+    assert [[comment.name for comment in fruit_comments] for fruit_comments in comments] == [
+        ["sweet", "yummy"],
+        ["sour"],
+        [],
+    ]
+    assert len(executed_queries) == 1
+
+
+async def test_generic_relation_loader_key_includes_parent_model():
+    fruit_loader = GenericRelationDataLoaderFactory.get_loader_class(
+        models.Comment, reverse_path="object_id", parent_model=models.Fruit
+    )
+    color_loader = GenericRelationDataLoaderFactory.get_loader_class(
+        models.Comment, reverse_path="object_id", parent_model=models.Color
+    )
+    assert fruit_loader is not color_loader
+
+
+async def test_auto_dataloader_fields(comments_data, context, executed_queries):
+    resp = await schemas.generic_auto_dataloader_fields_schema.execute(
+        """
+        {
+            fruits { name comments(pagination: {limit: 1}) { name } }
+            comments {
+                name
+                contentObject { __typename ... on CommentedFruitType { name } ... on ColorType { name } }
+            }
+        }
+        """,
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"] == [
+        {"name": "strawberry", "comments": [{"name": "sweet"}]},
+        {"name": "raspberry", "comments": [{"name": "sour"}]},
+        {"name": "banana", "comments": []},
+    ]
+    assert resp.data["comments"] == [
+        {"name": "yummy", "contentObject": {"__typename": "CommentedFruitType", "name": "strawberry"}},
+        {"name": "sweet", "contentObject": {"__typename": "CommentedFruitType", "name": "strawberry"}},
+        {"name": "sour", "contentObject": {"__typename": "CommentedFruitType", "name": "raspberry"}},
+        {"name": "bright", "contentObject": {"__typename": "ColorType", "name": "red"}},
+        {"name": "orphan", "contentObject": None},
+    ]
+
+
+async def test_aggregate_of_generic_relation_is_not_supported():
+    field = fields.auto_dataloader_field(field_name="comments", aggregate="count")
+    field.django_name = "comments"
+    with pytest.raises(exceptions.UnsupportedRelationError):
+        fields.resolve_dataloader_relation(models.Fruit, field)
+
+
+async def test_aggregate_resolver_of_generic_relation_is_not_supported(db_data, content_types, context):
+    fruit_ct, color_ct = content_types
+    fruit = db_data.fruits[0]
+    # comments of different models sharing the object id, grouping by it would count both
+    await models.Comment.objects.abulk_create(
+        [
+            models.Comment(name="yummy", content_type=fruit_ct, object_id=fruit.pk),
+            models.Comment(name="bright", content_type=color_ct, object_id=fruit.pk),
+        ]
+    )
+    resolver = factories.RelatedAggregateDataLoaderFactory.as_resolver(aggregate="count")
+    info = SimpleNamespace(_field=SimpleNamespace(django_name="comments"), context=context)
+    with pytest.raises(exceptions.UnsupportedRelationError):
+        await resolver(fruit, info)
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+import pytest
+import strawberry
+from django.db.backends.utils import CursorWrapper
+
+from strawberry_django_dataloaders import factories
+from strawberry_django_dataloaders.extensions import PrimaryDatabaseAfterMutationExtension
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests import models
+from tests.graphql import dataloaders, types
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True, databases=["default", "replica"]),
+]
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return "replica"
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+
+@pytest.fixture
+def queried_aliases() -> list[str]:
+    aliases = []
+    original_execute = CursorWrapper._execute
+
+    def _execute(self, sql, *args, **kwargs):
+        aliases.append(self.db.alias)
+        return original_execute(self, sql, *args, **kwargs)
+
+    with patch.object(CursorWrapper, "_execute", _execute):
+        yield aliases
+
+
+@pytest.fixture
+def replica_router(settings):
+    settings.DATABASE_ROUTERS = [ReplicaRouter()]
+
+
+async def test_using(db_data, context, queried_aliases):
+    loader_cls = type("ReplicaColorPKDataLoader", (dataloaders.ColorPKDataLoader,), {"using": "replica"})
+    color = await loader_cls(context=context).load(db_data.colors[0].pk)
+    assert color == db_data.colors[0]
+    assert color._state.db == "replica"
+    assert queried_aliases == ["replica"]
+
+
+async def test_router_and_sticky_primary(db_data, replica_router, context, queried_aliases):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    await loader.load(db_data.colors[0].pk)
+    context.use_primary_db = True
+    await loader.load(db_data.colors[1].pk)
+    assert queried_aliases == ["replica", "default"]
+
+
+async def test_alias_in_factory_loader_key():
+    default = factories.PKDataLoaderFactory.get_loader_class(models.Color)
+    replica = factories.PKDataLoaderFactory.get_loader_class(models.Color, using="replica")
+    assert default is not replica
+    assert (default.using, replica.using) == (None, "replica")
+    assert factories.PKDataLoaderFactory.get_loader_class(models.Color, using="replica") is replica
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    async def rename_fruit(self, pk: int, name: str) -> types.FruitTypeAutoDataLoaderFields:
+        fruit = await models.Fruit.objects.aget(pk=pk)
+        fruit.name = name
+        await fruit.asave()
+        return fruit
+
+
+@strawberry.type
+class Query:
+    fruits: list[types.FruitTypeAutoDataLoaderFields] = strawberry.django.field()
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation, extensions=[PrimaryDatabaseAfterMutationExtension])
+
+
+async def test_primary_db_after_mutation(db_data, context, replica_router, queried_aliases):
+    resp = await schema.execute(
+        f'mutation {{ renameFruit(pk: {db_data.fruits[0].pk}, name: "apple") {{ name color {{ name }} }} }}',
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["renameFruit"] == {"name": "apple", "color": {"name": "red"}}
+    assert context.use_primary_db
+    assert queried_aliases[-1] == "default"  # the color dataloader
+
+    # a new request isn't affected by the mutation of the previous one
+    context = DataloaderContext(request=None, response=None)
+    resp = await schema.execute("{ fruits { color { name } } }", context_value=context)
+    assert not resp.errors
+    assert not context.use_primary_db
+    assert set(queried_aliases[-2:]) == {"replica"}
@@ -0,0 +1,73 @@
+import math
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders.dataloaders import BasicPKDataLoader
+from tests.choices import UrlChoices
+from tests.graphql import dataloaders
+from tests.tests.gql_queries import GQLQueries
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+async def test_loader_instance_reused_within_context(context):
+    """Getting the loader from the context again must return the same instance with its cache untouched."""
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    loader.prime(1, "cached")
+    cache_map = loader.cache_map
+
+    same_loader = dataloaders.ColorPKDataLoader(context=context)
+    assert same_loader is loader
+    assert same_loader.cache_map is cache_map
+    assert await same_loader.load(1) == "cached"
+
+
+async def test_loader_force_new(context):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    loader.prime(1, "cached")
+
+    new_loader = dataloaders.ColorPKDataLoader(context=context, force_new=True)
+    assert new_loader is not loader
+    assert context.dataloaders[dataloaders.ColorPKDataLoader] is new_loader
+    assert new_loader.cache_map.get(1) is None
+
+
+async def test_loader_reset(context):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    loader.prime(1, "cached")
+
+    loader.reset()
+    assert dataloaders.ColorPKDataLoader(context=context) is loader
+    assert loader.cache_map.get(1) is None
+    assert loader.batch is None
+
+
+@pytest.mark.parametrize("url", UrlChoices.values)
+async def test_keys_deduplicated(large_db_data, arequest, url):
+    """Each loader gets every key exactly once, even though it's obtained from the context in every resolver."""
+    loaded_keys = []
+    original_load_fn = BasicPKDataLoader.load_fn.__func__
+
+    def load_fn(cls, keys):
+        loaded_keys.extend(keys)
+        return original_load_fn(cls, keys)
+
+    with patch.object(BasicPKDataLoader, "load_fn", classmethod(load_fn)):
+        resp = await arequest(GQLQueries.FRUITS_DATALOADERS, url)
+    assert not resp.json().get("errors")
+    assert sorted(loaded_keys) == sorted(
+        [color.pk for color in large_db_data.colors] + [fruit.plant_id for fruit in large_db_data.fruits]
+    )
+
+
+@pytest.mark.parametrize("url", UrlChoices.values)
+async def test_query_count_on_large_list(large_db_data, arequest, executed_queries, url):
+    """Fruits, colors, plants and eaters - one query each, unless the keys exceed the DB query parameters limit."""
+    resp = await arequest(GQLQueries.FRUITS_DATALOADERS, url)
+    assert len(resp.json()["data"]["fruits"]) == len(large_db_data.fruits)
+    queries_per_fruit_relation = math.ceil(len(large_db_data.fruits) / BasicPKDataLoader.get_max_keys_per_query())
+    assert len(executed_queries) == 2 + 2 * queries_per_fruit_relation  # fruits, colors, plants & eaters
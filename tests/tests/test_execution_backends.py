@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.db import connections, transaction
+
+from strawberry_django_dataloaders.core import backends
+from strawberry_django_dataloaders.core.backends import ExecutionBackend
+from tests import models
+from tests.choices import UrlChoices
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.mark.parametrize("backend", ExecutionBackend)
+@pytest.mark.parametrize("url", UrlChoices.values)
+async def test_correct_data_returned(baseline_collection, arequest, settings, backend, url):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"EXECUTION_BACKEND": backend.value}
+    resp = await arequest(baseline_collection.query, url)
+    assert resp.json() == baseline_collection.exp_response().data
+
+
+@pytest.mark.parametrize("backend", ExecutionBackend)
+async def test_backend_used(db_data, context, settings, backend):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"EXECUTION_BACKEND": backend.value}
+    with patch(
+        "strawberry_django_dataloaders.core.dataloader.evaluate_queryset",
+        wraps=backends.evaluate_queryset,
+    ) as evaluate_mock:
+        loader = dataloaders.ColorPKDataLoader(context=context)
+        color = await loader.load(db_data.colors[0].pk)
+    assert color == db_data.colors[0]
+    assert evaluate_mock.call_args.args[1] is backend
+
+
+async def test_loader_class_backend_overrides_setting(settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"EXECUTION_BACKEND": ExecutionBackend.THREAD_POOL.value}
+    assert dataloaders.ColorPKDataLoader.get_execution_backend() is ExecutionBackend.THREAD_POOL
+    with patch.object(dataloaders.ColorPKDataLoader, "execution_backend", ExecutionBackend.ASYNC_ORM):
+        assert dataloaders.ColorPKDataLoader.get_execution_backend() is ExecutionBackend.ASYNC_ORM
+
+
+async def test_async_orm_fallback(db_data):
+    """Django versions without async ORM fall back to the thread pool."""
+    with patch.object(backends, "SUPPORTS_ASYNC_ORM", False):
+        with patch.object(backends, "_call_in_worker", wraps=backends._call_in_worker) as worker_mock:
+            colors = await backends.evaluate_queryset(
+                dataloaders.ColorPKDataLoader.get_batch_queryset([color.pk for color in db_data.colors]),
+                ExecutionBackend.ASYNC_ORM,
+            )
+    assert sorted(colors, key=lambda color: color.pk) == db_data.colors
+    worker_mock.assert_called_once()
+
+
+async def test_thread_pool_in_transaction(db_data):
+    """Queries of a request in a transaction run on its thread, the workers wouldn't see the uncommitted writes."""
+    loader_cls = dataloaders.ColorPKDataLoader
+
+    def rename_and_load() -> list[str]:
+        with transaction.atomic():
+            models.Color.objects.filter(pk=db_data.colors[0].pk).update(name="purple")
+            queryset = loader_cls.get_batch_queryset([db_data.colors[0].pk])
+            return [color.name for color in async_to_sync(backends.evaluate_queryset)(queryset, "thread_pool")]
+
+    with patch.object(backends, "_call_in_worker", wraps=backends._call_in_worker) as worker_mock:
+        assert await sync_to_async(rename_and_load)() == ["purple"]
+    worker_mock.assert_not_called()
+
+
+async def test_worker_connection_reused(db_data):
+    queryset = dataloaders.ColorPKDataLoader.get_batch_queryset([color.pk for color in db_data.colors])
+
+    def load_in_worker() -> bool:
+        connection = connections[queryset.db]
+        connection.ensure_connection()
+        with patch.object(connection, "close") as close_mock:
+            assert backends._call_in_worker(list, queryset) == db_data.colors
+        return close_mock.called
+
+    # not reconnected for each batch, although the test database has `CONN_MAX_AGE = 0`
+    assert not await sync_to_async(load_in_worker, thread_sensitive=False)()
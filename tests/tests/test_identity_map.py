@@ -0,0 +1,85 @@
+import pytest
+
+from strawberry_django_dataloaders import factories
+from tests import models
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def eater_pk_loader_cls():
+    return factories.PKDataLoaderFactory.get_loader_class(models.FruitEater)
+
+
+async def test_pk_loader_uses_instances_of_other_loaders(db_data, context, executed_queries, eater_pk_loader_cls):
+    eaters = await dataloaders.FruitEatersReverseFKDataLoader(context=context).load(db_data.fruits[0].pk)
+    executed_queries.clear()
+
+    eater = await eater_pk_loader_cls(context=context).load(eaters[0].pk)
+
+    assert eater is eaters[0]
+    assert executed_queries == []
+
+
+async def test_single_instance_per_row(db_data, context):
+    eaters = await dataloaders.FruitEatersReverseFKDataLoader(context=context).load(db_data.fruits[0].pk)
+    tasters = await dataloaders.FruitTastersM2MDataLoader(context=context).load(db_data.fruits[1].pk)
+
+    assert {id(taster) for taster in tasters} == {id(eater) for eater in eaters}
+
+
+async def test_missing_fields_loaded(db_data, context, executed_queries, eater_pk_loader_cls):
+    [eater, _] = await dataloaders.FruitEatersReverseFKDataLoader(context=context).load(
+        db_data.fruits[0].pk,
+        only=["name"],
+    )
+    assert "description" in eater.get_deferred_fields()
+    executed_queries.clear()
+
+    assert await eater_pk_loader_cls(context=context).load(eater.pk, only=["name"]) is eater
+    assert executed_queries == []
+
+    # all the fields are requested - loaded from the database, the existing instance gets the missing fields
+    assert await eater_pk_loader_cls(context=context).load(eater.pk) is eater
+    assert len(executed_queries) == 1
+    assert not eater.get_deferred_fields()
+
+
+async def test_select_related_of_instance_in_map(db_data, context, executed_queries):
+    loader_cls = factories.ReverseFKDataLoaderFactory.get_loader_class(
+        models.FruitEater, reverse_path="favourite_fruit_id"
+    )
+    fruit_loader_cls = factories.PKDataLoaderFactory.get_loader_class(models.Fruit)
+    fruit = db_data.fruits[0]
+    [eater, _] = await dataloaders.FruitEatersReverseFKDataLoader(context=context).load(fruit.pk)
+    executed_queries.clear()
+
+    # the same rows loaded again with the joined favourite fruit
+    eaters = await loader_cls(context=context).load(fruit.pk, select_related={"favourite_fruit": fruit_loader_cls})
+    assert eaters[0] is eater
+    assert len(executed_queries) == 1
+    assert await fruit_loader_cls(context=context).load(fruit.pk) == fruit
+    assert eater.favourite_fruit == fruit
+    assert len(executed_queries) == 1
+
+
+async def test_reset_drops_model_instances(db_data, context, executed_queries, eater_pk_loader_cls):
+    loader = dataloaders.FruitEatersReverseFKDataLoader(context=context)
+    eaters = await loader.load(db_data.fruits[0].pk)
+    loader.reset()
+    executed_queries.clear()
+
+    await eater_pk_loader_cls(context=context).load(eaters[0].pk)
+
+    assert len(executed_queries) == 1
+
+
+async def test_opt_out(db_data, context, eater_pk_loader_cls):
+    loader_cls = type("NoIdentityMapLoader", (dataloaders.FruitEatersReverseFKDataLoader,), {"use_identity_map": False})
+    eaters = await loader_cls(context=context).load(db_data.fruits[0].pk)
+
+    assert await eater_pk_loader_cls(context=context).load(eaters[0].pk) is not eaters[0]
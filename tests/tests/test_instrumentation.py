@@ -0,0 +1,104 @@
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders import instrumentation
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests.graphql import dataloaders, schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+class ListObserver:
+    def __init__(self):
+        self.stats: list[instrumentation.BatchStats] = []
+
+    def batch_loaded(self, context, stats):
+        self.stats.append(stats)
+
+
+@pytest.fixture
+def observer() -> ListObserver:
+    return ListObserver()
+
+
+@pytest.fixture
+def context(context, observer) -> DataloaderContext:
+    context.dataloader_observers.append(observer)
+    return context
+
+
+async def test_batch_stats(db_data, context, observer):
+    loader = dataloaders.FruitEatersReverseFKDataLoader(context=context, cache=False)  # duplicate keys not merged
+    fruit_pks = [fruit.pk for fruit in db_data.fruits]
+
+    await loader.load_many([*fruit_pks, fruit_pks[0]])
+
+    [stats] = observer.stats
+    assert stats.loader is dataloaders.FruitEatersReverseFKDataLoader
+    assert (stats.keys, stats.unique_keys, stats.queries, stats.rows) == (4, 3, 1, 2)
+    assert stats.query_time > 0
+    assert stats.queue_wait >= 0
+    assert stats.duration >= stats.query_time
+    assert stats.error is None
+
+
+async def test_batch_error_reported(db_data, context, observer):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    with patch.object(dataloaders.ColorPKDataLoader, "get_batch_results", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            await loader.load(db_data.colors[0].pk)
+
+    [stats] = observer.stats
+    assert isinstance(stats.error, RuntimeError)
+
+
+async def test_signal(db_data, context):
+    received = []
+
+    def receiver(sender, context, stats, **kwargs):
+        received.append((sender, stats.unique_keys))
+
+    instrumentation.batch_loaded.connect(receiver)
+    try:
+        await dataloaders.ColorPKDataLoader(context=context).load(db_data.colors[0].pk)
+    finally:
+        instrumentation.batch_loaded.disconnect(receiver)
+
+    assert received == [(dataloaders.ColorPKDataLoader, 1)]
+
+
+async def test_logging_observer(db_data, context, caplog):
+    observer = instrumentation.LoggingObserver()
+    instrumentation.register_observer(observer)
+    try:
+        with caplog.at_level(logging.DEBUG, logger="strawberry_django_dataloaders"):
+            await dataloaders.ColorPKDataLoader(context=context).load(db_data.colors[0].pk)
+    finally:
+        instrumentation.unregister_observer(observer)
+
+    assert "ColorPKDataLoader: 1 keys (1 unique), 1 queries, 1 rows" in caplog.text
+
+
+@pytest.mark.parametrize("debug", [True, False])
+async def test_extension_summary(db_data, context, settings, debug):
+    settings.DEBUG = debug
+    resp = await schemas.instrumented_auto_dataloader_fields_schema.execute(
+        "{ fruits { color { name } eaters { name } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    if not debug:
+        assert "dataloaders" not in resp.extensions
+        return
+    summary = resp.extensions["dataloaders"]
+    assert len(summary) == 2
+    eaters_summary = next(loader for name, loader in summary.items() if "FruitEater" in name)
+    assert eaters_summary["batches"] == 1
+    assert eaters_summary["unique_keys"] == 3
+    assert eaters_summary["rows"] == 2
+    assert eaters_summary["batch_sizes"] == [3]
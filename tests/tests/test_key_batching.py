@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders.core.dataloader import BaseDjangoModelDataLoader
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+async def test_keys_split_into_chunks(db_data, executed_queries, monkeypatch):
+    monkeypatch.setattr(dataloaders.ColorPKDataLoader, "max_keys_per_query", 2)
+    keys = [color.pk for color in reversed(db_data.colors)] + [0]
+    assert await dataloaders.ColorPKDataLoader.load_fn(keys) == list(reversed(db_data.colors)) + [None]
+    assert len(executed_queries) == 2
+
+
+async def test_reverse_fk_keys_split_into_chunks(db_data, executed_queries, settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"MAX_KEYS_PER_QUERY": 1}
+    keys = [fruit.pk for fruit in db_data.fruits]
+    result = await dataloaders.FruitEatersReverseFKDataLoader.load_fn(keys)
+    assert result == [db_data.eaters, [], []]
+    assert len(executed_queries) == 3
+
+
+async def test_duplicate_keys_queried_once(db_data, executed_queries, monkeypatch):
+    monkeypatch.setattr(dataloaders.ColorPKDataLoader, "max_keys_per_query", 1)
+    color = db_data.colors[0]
+    assert await dataloaders.ColorPKDataLoader.load_fn([color.pk, color.pk]) == [color, color]
+    assert len(executed_queries) == 1
+
+
+async def test_max_keys_derived_from_db_backend():
+    # SQLite allows at most 999 query parameters
+    assert BaseDjangoModelDataLoader.get_max_keys_per_query() == 999 - BaseDjangoModelDataLoader.reserved_query_params
+
+
+async def test_max_keys_of_db_backend_without_limit(settings):
+    features = BaseDjangoModelDataLoader.get_connection().features
+    with patch.object(features, "max_query_params", None):
+        # e.g. PostgreSQL, limited to 65535 parameters by its protocol
+        assert (
+            BaseDjangoModelDataLoader.get_max_keys_per_query()
+            == 65_535 - BaseDjangoModelDataLoader.reserved_query_params
+        )
+        settings.STRAWBERRY_DJANGO_DATALOADERS = {"MAX_QUERY_PARAMS": None}
+        assert BaseDjangoModelDataLoader.get_max_keys_per_query() is None
+
+
+async def test_array_parameter_ignored_on_sqlite(db_data, monkeypatch):
+    monkeypatch.setattr(dataloaders.ColorPKDataLoader, "array_parameter", True)
+    assert not dataloaders.ColorPKDataLoader.uses_array_parameter()
+    sql, params = dataloaders.ColorPKDataLoader.get_batch_queryset([1, 2]).query.sql_with_params()
+    assert " IN (%s, %s)" in sql
+
+
+async def test_array_parameter_sql(db_data):
+    with patch.object(dataloaders.ColorPKDataLoader, "uses_array_parameter", return_value=True):
+        queryset = dataloaders.ColorPKDataLoader.get_batch_queryset([1, 2, 3])
+        sql, params = queryset.query.sql_with_params()
+    assert sql.endswith('WHERE "tests_color"."id" = ANY(%s)')
+    assert params == ([1, 2, 3],)
@@ -0,0 +1,61 @@
+import pytest
+
+from strawberry_django_dataloaders import factories
+from tests import models
+from tests.graphql import schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+async def test_select_related_primes_pk_loaders(db_data, context, executed_queries):
+    eaters_loader = factories.ReverseFKDataLoaderFactory.get_loader_class(
+        models.FruitEater, reverse_path="favourite_fruit_id"
+    )(context=context)
+    fruit_loader_class = factories.PKDataLoaderFactory.get_loader_class(models.Fruit)
+    color_loader_class = factories.PKDataLoaderFactory.get_loader_class(models.Color)
+
+    eaters = await eaters_loader.load(
+        db_data.fruits[0].pk,
+        select_related={"favourite_fruit": fruit_loader_class, "favourite_fruit__color": color_loader_class},
+    )
+    fruit = await fruit_loader_class(context=context).load(eaters[0].favourite_fruit_id)
+    color = await color_loader_class(context=context).load(fruit.color_id)
+
+    assert [eater.name for eater in eaters] == ["pepa", "josef"]
+    assert fruit == db_data.fruits[0]
+    assert color == db_data.colors[0]
+    assert len(executed_queries) == 1
+    assert "JOIN" in executed_queries[0]
+
+
+async def test_lookahead_field(db_data, context, executed_queries):
+    resp = await schemas.lookahead_auto_dataloader_fields_schema.execute(
+        "{ fruits { name eaters { name favouriteFruit { name color { name } plant { name } } } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"][0]["eaters"][0] == {
+        "name": "pepa",
+        "favouriteFruit": {"name": "strawberry", "color": {"name": "red"}, "plant": {"name": "strawberry plant"}},
+    }
+    assert resp.data["fruits"][1]["eaters"] == []
+    assert len(executed_queries) == 2
+
+
+async def test_lookahead_field_with_projection(db_data, context, executed_queries):
+    resp = await schemas.lookahead_auto_dataloader_fields_schema.execute(
+        "{ fruits { name tasters { name favouriteFruit { color { name } } } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"][1]["tasters"] == [
+        {"name": "pepa", "favouriteFruit": {"color": {"name": "red"}}},
+        {"name": "josef", "favouriteFruit": {"color": {"name": "red"}}},
+    ]
+    assert len(executed_queries) == 2
+    tasters_sql = executed_queries[1]
+    assert '"tests_fruiteater"."description"' not in tasters_sql
+    assert '"tests_color"."name"' in tasters_sql
@@ -0,0 +1,62 @@
+import pytest
+from django.db import models as django_models
+
+from strawberry_django_dataloaders import exceptions, factories
+from strawberry_django_dataloaders.dataloaders import BasicM2MDataLoader
+from tests import models
+from tests.choices import UrlChoices
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.mark.parametrize("url", UrlChoices.values)
+async def test_correct_data_returned(m2m_collection, arequest, url):
+    resp = await arequest(m2m_collection.query, url)
+    assert resp.json() == m2m_collection.exp_response().data
+
+
+@pytest.mark.parametrize("url", UrlChoices.values)
+async def test_single_query_per_relation(m2m_collection, arequest, executed_queries, url):
+    """Fruits, varieties and tasters - one query each."""
+    await arequest(m2m_collection.query, url)
+    assert len(executed_queries) == 3
+
+
+@pytest.mark.parametrize(
+    ("model", "field_name", "exp_reverse_path"),
+    [
+        (models.Fruit, "varieties", "fruits"),
+        (models.FruitVariety, "fruits", "varieties"),
+        (models.FruitEater, "tasted_fruits", "tasters"),
+        (models.Fruit, "tasters", "tasted_fruits"),
+    ],
+)
+async def test_m2m_reverse_path(model, field_name, exp_reverse_path):
+    assert factories.get_m2m_reverse_path(model._meta.get_field(field_name)) == exp_reverse_path
+
+
+async def test_m2m_hidden_reverse_relation():
+    with pytest.raises(exceptions.UnsupportedRelationError):
+        factories.get_m2m_reverse_path(django_models.ManyToManyField(models.Color, related_name="+"))
+
+
+@pytest.mark.parametrize(
+    ("related_model", "reverse_path", "parents_attr", "related_attr"),
+    [
+        ("tests.FruitVariety", "fruits", "fruits", "varieties"),  # forward side
+        ("tests.Fruit", "varieties", "varieties", "fruits"),  # reverse side
+        ("tests.Fruit", "tasters", "eaters", "tasted_fruits"),  # forward side, custom through model
+        ("tests.FruitEater", "tasted_fruits", "fruits", "tasters"),  # reverse side, custom through model
+    ],
+)
+async def test_load_both_sides(db_data, context, related_model, reverse_path, parents_attr, related_attr):
+    parents = getattr(db_data, parents_attr)
+    exp_result = [[inst.pk async for inst in getattr(parent, related_attr).all().order_by("pk")] for parent in parents]
+
+    loader_cls = factories.M2MDataLoaderFactory.get_loader_class(related_model, reverse_path=reverse_path)
+    assert issubclass(loader_cls, BasicM2MDataLoader)
+    result = await loader_cls(context=context).load_many([parent.pk for parent in parents])
+    assert [sorted(inst.pk for inst in instances) for instances in result] == exp_result
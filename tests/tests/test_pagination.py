@@ -0,0 +1,115 @@
+import pytest
+from strawberry import relay
+
+from strawberry_django_dataloaders import factories
+from strawberry_django_dataloaders.dataloaders import RelatedPage
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests import models
+from tests.graphql import schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def eaters_data(db_data):
+    """Every fruit has a few eaters, the first fruit having the most of them."""
+    for i, fruit in enumerate(db_data.fruits):
+        models.FruitEater.objects.bulk_create(
+            [models.FruitEater(name=f"{fruit.name} eater {j}", favourite_fruit=fruit) for j in range(4 - i)]
+        )
+    return db_data
+
+
+async def test_reverse_fk_page_per_parent(eaters_data, context, executed_queries):
+    loader = factories.ReverseFKDataLoaderFactory.get_loader_class(
+        models.FruitEater,
+        reverse_path="favourite_fruit_id",
+        order_by=["-name"],
+    )(context=context)
+    fruits = eaters_data.fruits[:2]
+
+    pages = [await page for page in [loader.load(RelatedPage(fruit.pk, offset=1, limit=2)) for fruit in fruits]]
+
+    assert [eater.name for eater in pages[0]] == ["strawberry eater 2", "strawberry eater 1"]
+    assert [eater.name for eater in pages[1]] == ["raspberry eater 1", "raspberry eater 0"]
+    eaters_sql = [sql for sql in executed_queries if 'FROM "tests_fruiteater"' in sql and "ROW_NUMBER" in sql]
+    assert len(eaters_sql) == 1
+
+
+async def test_m2m_page_per_parent(db_data, context):
+    loader = factories.M2MDataLoaderFactory.get_loader_class(
+        models.FruitVariety,
+        reverse_path="fruits",
+        order_by=["-name"],
+    )(context=context)
+
+    first = await loader.load(RelatedPage(db_data.fruits[0].pk, limit=1))
+    second = await loader.load(RelatedPage(db_data.fruits[0].pk, offset=1))
+
+    assert [variety.name for variety in first] == ["wild"]
+    assert [variety.name for variety in second] == ["garden"]
+
+
+async def test_order_by_is_part_of_loader_key():
+    ascending = factories.ReverseFKDataLoaderFactory.get_loader_class(
+        models.FruitEater, reverse_path="favourite_fruit_id", order_by=["name"]
+    )
+    descending = factories.ReverseFKDataLoaderFactory.get_loader_class(
+        models.FruitEater, reverse_path="favourite_fruit_id", order_by=["-name"]
+    )
+    assert ascending is not descending
+    assert ascending.order_by == ("name",)
+
+
+async def test_pagination_argument(eaters_data, context, executed_queries):
+    resp = await schemas.paginated_auto_dataloader_fields_schema.execute(
+        "{ fruits { name eaters(pagination: {offset: 1, limit: 2}) { name } varieties { name } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"][0] == {
+        "name": "strawberry",
+        "eaters": [{"name": "pepa"}, {"name": "strawberry eater 0"}],
+        "varieties": [{"name": "wild"}, {"name": "garden"}],
+    }
+    assert resp.data["fruits"][1]["eaters"] == [{"name": "raspberry eater 1"}, {"name": "raspberry eater 2"}]
+    assert len(executed_queries) == 3
+
+
+async def test_connection(eaters_data, context, executed_queries):
+    query = """
+        query ($after: String) {
+            fruits {
+                eatersConnection(first: 2, after: $after) {
+                    pageInfo { hasNextPage hasPreviousPage endCursor }
+                    edges { node { name } }
+                }
+            }
+        }
+    """
+    resp = await schemas.paginated_auto_dataloader_fields_schema.execute(query, context_value=context)
+    assert not resp.errors
+    connection = resp.data["fruits"][0]["eatersConnection"]
+    assert [edge["node"]["name"] for edge in connection["edges"]] == ["josef", "pepa"]
+    assert connection["pageInfo"] == {
+        "hasNextPage": True,
+        "hasPreviousPage": False,
+        "endCursor": relay.to_base64("arrayconnection", 1),
+    }
+    eaters_sql = [sql for sql in executed_queries if 'FROM "tests_fruiteater"' in sql]
+    assert len(eaters_sql) == 1
+    assert '"description"' not in eaters_sql[0]
+
+    resp = await schemas.paginated_auto_dataloader_fields_schema.execute(
+        query,
+        variable_values={"after": connection["pageInfo"]["endCursor"]},
+        context_value=DataloaderContext(request=None, response=None),  # the next page is fetched by a new request
+    )
+    assert not resp.errors
+    connection = resp.data["fruits"][0]["eatersConnection"]
+    assert [edge["node"]["name"] for edge in connection["edges"]] == ["strawberry eater 0", "strawberry eater 1"]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is True
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders.core import backends
+from strawberry_django_dataloaders.core.backends import ExecutionBackend
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+async def test_batch_above_threshold_loaded_in_parallel(large_db_data, settings, executed_queries):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"PARALLEL_THRESHOLD": 100, "PARALLEL_SHARDS": 3}
+    plants = [fruit.plant for fruit in reversed(large_db_data.fruits)]
+    with patch(
+        "strawberry_django_dataloaders.core.dataloader.evaluate_queryset",
+        wraps=backends.evaluate_queryset,
+    ) as evaluate_mock:
+        result = await dataloaders.FruitPlantPKDataLoader.load_fn([plant.pk for plant in plants] + [0])
+    assert result == plants + [None]
+    assert len(executed_queries) == 3
+    assert {call.args[1] for call in evaluate_mock.call_args_list} == {ExecutionBackend.THREAD_POOL}
+
+
+async def test_related_lists_keep_order(large_db_data, settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"PARALLEL_THRESHOLD": 10}
+    fruits = large_db_data.fruits[:50]
+    result = await dataloaders.FruitEatersReverseFKDataLoader.load_fn([fruit.pk for fruit in fruits])
+    assert result == [[eater] for eater in large_db_data.eaters[:50]]
+
+
+async def test_batch_below_threshold_loaded_by_single_query(db_data, settings, executed_queries):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"PARALLEL_THRESHOLD": 4}
+    assert not dataloaders.ColorPKDataLoader.uses_parallel_loading(3)
+    colors = await dataloaders.ColorPKDataLoader.load_fn([color.pk for color in db_data.colors])
+    assert colors == db_data.colors
+    assert len(executed_queries) == 1
+
+
+async def test_no_parallel_loading_from_primary_db(db_data, context, settings, executed_queries):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"PARALLEL_THRESHOLD": 1}
+    context.use_primary_db = True
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    colors = await loader.load_many([color.pk for color in db_data.colors])
+    assert colors == db_data.colors
+    assert len(executed_queries) == 1
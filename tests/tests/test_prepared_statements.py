@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders import dataloaders as base_dataloaders
+from strawberry_django_dataloaders.arguments import QueryArguments
+from strawberry_django_dataloaders.core.statements import PreparedStatement, clear_prepared_statements
+from strawberry_django_dataloaders.dataloaders import RelatedPage
+from tests import models
+from tests.graphql import dataloaders, types
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+class FruitEatersCountDataLoader(base_dataloaders.ReverseFKCountDataLoader):
+    model = models.FruitEater
+    reverse_path = "favourite_fruit_id"
+
+
+@pytest.fixture(autouse=True)
+def prepared_statements(settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"PREPARED_STATEMENTS": True}
+    clear_prepared_statements()
+    yield
+    clear_prepared_statements()
+
+
+async def test_statement_prepared_once(db_data, executed_queries):
+    colors = db_data.colors
+    with patch.object(PreparedStatement, "prepare", wraps=PreparedStatement.prepare) as prepare_mock:
+        assert await dataloaders.ColorPKDataLoader.load_fn([colors[2].pk, colors[0].pk]) == [colors[2], colors[0]]
+        assert await dataloaders.ColorPKDataLoader.load_fn([colors[1].pk, 0]) == [colors[1], None]
+    assert prepare_mock.call_count == 1
+    assert executed_queries[0] == executed_queries[1]
+    assert executed_queries[0].endswith('WHERE "tests_color"."id" IN (%s, %s)')
+
+
+async def test_statement_keys_padded_to_bucket(db_data, executed_queries):
+    assert await dataloaders.ColorPKDataLoader.load_fn([color.pk for color in db_data.colors]) == db_data.colors
+    assert executed_queries[0].endswith("IN (%s, %s, %s, %s)")
+
+
+async def test_statement_keys_count():
+    # SQLite allows at most 999 query parameters
+    max_keys = dataloaders.ColorPKDataLoader.get_max_keys_per_query()
+    assert [dataloaders.ColorPKDataLoader.get_statement_keys_count(count) for count in (1, 2, 3, 5, 600)] == [
+        1,
+        2,
+        4,
+        8,
+        max_keys,
+    ]
+
+
+async def test_projection_and_related_lists(db_data):
+    color = db_data.colors[0]
+    (loaded,) = await dataloaders.ColorPKDataLoader.load_fn([color.pk], only={"id", "name"})
+    assert loaded.name == color.name
+    assert loaded.get_deferred_fields() == {"description", "code"}
+    fruit_keys = [fruit.pk for fruit in db_data.fruits]
+    assert await dataloaders.FruitEatersReverseFKDataLoader.load_fn(fruit_keys) == [db_data.eaters, [], []]
+    assert await dataloaders.FruitVarietiesM2MDataLoader.load_fn(fruit_keys) == [
+        db_data.varieties,
+        db_data.varieties[1:],
+        [],
+    ]
+
+
+async def test_paginated_related_lists(db_data):
+    key = RelatedPage(db_data.fruits[0].pk, offset=1, limit=1)
+    assert await dataloaders.FruitEatersReverseFKDataLoader.load_fn([key]) == [db_data.eaters[1:]]
+    statement = dataloaders.FruitEatersReverseFKDataLoader.get_prepared_statement(1, offset=1, limit=1)
+    assert "dataloader_row_number" in statement.sql
+
+
+async def test_not_prepared_queries(db_data):
+    arguments = QueryArguments(filters=types.FruitEaterFilter(name="josef"))
+    assert not dataloaders.FruitEatersReverseFKDataLoader.uses_prepared_statements(arguments=arguments)
+    # aggregates aren't model instances, the queryset is evaluated instead
+    assert FruitEatersCountDataLoader.get_prepared_statement(1) is None
+    assert await FruitEatersCountDataLoader.load_fn([fruit.pk for fruit in db_data.fruits]) == [2, 0, 0]
+
+
+async def test_array_parameter(db_data):
+    with patch.object(dataloaders.ColorPKDataLoader, "uses_array_parameter", return_value=True):
+        statement = dataloaders.ColorPKDataLoader.get_prepared_statement(3)
+    assert statement.sql.endswith('WHERE "tests_color"."id" = ANY(%s)')
+    assert statement.get_params([1, 2, 3]) == [[1, 2, 3]]
@@ -0,0 +1,78 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from strawberry_django_dataloaders.dataloaders import BasicPKDataLoader
+from tests.graphql import dataloaders, schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def load_fn_calls() -> list[tuple[list, frozenset | None]]:
+    calls = []
+    original_load_fn = BasicPKDataLoader.load_fn.__func__
+
+    def load_fn(cls, keys, only=None):
+        calls.append((keys, only))
+        return original_load_fn(cls, keys, only=only)
+
+    with patch.object(BasicPKDataLoader, "load_fn", classmethod(load_fn)):
+        yield calls
+
+
+async def test_only_selected_columns_loaded(db_data, context, executed_queries):
+    resp = await schemas.projected_auto_dataloader_fields_schema.execute(
+        "{ fruits { name color { name } eaters { name } varieties { name } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"][0] == {
+        "name": "strawberry",
+        "color": {"name": "red"},
+        "eaters": [{"name": "pepa"}, {"name": "josef"}],
+        "varieties": [{"name": "garden"}, {"name": "wild"}],
+    }
+    related_queries = [sql for sql in executed_queries if 'FROM "tests_fruit"' not in sql]
+    assert len(related_queries) == 3
+    assert all('"description"' not in sql for sql in related_queries)
+    # FK used to pair eaters with fruits is always loaded
+    assert any('"favourite_fruit_id"' in sql for sql in related_queries)
+
+
+async def test_selected_columns_loaded(db_data, context, executed_queries):
+    resp = await schemas.projected_auto_dataloader_fields_schema.execute(
+        "{ fruits { color { description } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    color_sql = next(sql for sql in executed_queries if 'FROM "tests_color"' in sql)
+    assert '"description"' in color_sql
+    assert '"name"' not in color_sql
+
+
+async def test_batch_merges_projections(db_data, context, load_fn_calls):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    first, second = db_data.colors[0].pk, db_data.colors[1].pk
+    colors = await asyncio.gather(loader.load(first, only=["name"]), loader.load(second, only=["description"]))
+    assert [color.name for color in colors] == ["red", "yellow"]
+    assert load_fn_calls == [([first, second], frozenset({"id", "name", "description"}))]
+
+
+async def test_insufficient_projection_reloaded(db_data, context, load_fn_calls):
+    loader = dataloaders.ColorPKDataLoader(context=context)
+    key = db_data.colors[0].pk
+    await loader.load(key, only=["name"])
+    await loader.load(key, only=["name"])  # cached
+    await loader.load(key, only=["description"])
+    color = await loader.load(key)
+    assert color.name == "red"
+    assert load_fn_calls == [
+        ([key], frozenset({"id", "name"})),
+        ([key], frozenset({"id", "name", "description"})),
+        ([key], None),
+    ]
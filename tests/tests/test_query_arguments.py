@@ -0,0 +1,97 @@
+import pytest
+
+from strawberry_django_dataloaders.arguments import QueryArguments
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests.graphql import schemas, types
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def context(context) -> DataloaderContext:
+    context.hidden_eater = "josef"
+    context.hidden_fruit = "strawberry"
+    return context
+
+
+async def test_query_arguments_normalized():
+    arguments = QueryArguments(filters=types.FruitEaterFilter(name="pepa"))
+    assert arguments == QueryArguments(filters=types.FruitEaterFilter(name="pepa"))
+    assert hash(arguments) == hash(QueryArguments(filters=types.FruitEaterFilter(name="pepa")))
+    assert arguments != QueryArguments(filters=types.FruitEaterFilter(name="josef"))
+    assert arguments != QueryArguments(filters=types.FruitEaterFilter(name="pepa"), order=types.FruitEaterOrder())
+
+
+async def test_filter_and_order_in_batch_query(db_data, context, executed_queries):
+    resp = await schemas.filtered_auto_dataloader_fields_schema.execute(
+        """
+        {
+            fruits {
+                name
+                eaters(order: { name: DESC }) { name }
+                tasters(filters: { name: { startsWith: "j" } }) { name }
+            }
+        }
+        """,
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data == {
+        "fruits": [
+            {"name": "strawberry", "eaters": [{"name": "pepa"}, {"name": "josef"}], "tasters": []},
+            {"name": "raspberry", "eaters": [], "tasters": [{"name": "josef"}]},
+            {"name": "banana", "eaters": [], "tasters": []},
+        ]
+    }
+    assert len(executed_queries) == 3
+    assert any('ORDER BY "tests_fruiteater"."name" DESC' in query for query in executed_queries[1:])
+    assert any('"tests_fruiteater"."name" LIKE' in query for query in executed_queries[1:])
+    # handed over to the resolvers, not kept in the context
+    assert context.dataloader_query_arguments == {}
+
+
+async def test_same_arguments_share_batch(db_data, context, executed_queries):
+    resp = await schemas.filtered_auto_dataloader_fields_schema.execute(
+        """
+        {
+            fruits {
+                pepa: tasters(filters: { name: { exact: "pepa" } }) { name }
+                pepaAgain: tasters(filters: { name: { exact: "pepa" } }) { name }
+                josef: tasters(filters: { name: { exact: "josef" } }, pagination: { limit: 1 }) { name }
+            }
+        }
+        """,
+        context_value=context,
+    )
+    assert not resp.errors
+    assert [fruit["pepa"] for fruit in resp.data["fruits"]] == [[{"name": "pepa"}], [{"name": "pepa"}], []]
+    assert [fruit["pepaAgain"] for fruit in resp.data["fruits"]] == [[{"name": "pepa"}], [{"name": "pepa"}], []]
+    assert [fruit["josef"] for fruit in resp.data["fruits"]] == [[], [{"name": "josef"}], []]
+    # fruits, the shared batch of the same filters, the batch of the other filters
+    assert len(executed_queries) == 3
+
+
+async def test_type_get_queryset_in_batch_query(db_data, context, executed_queries):
+    resp = await schemas.filtered_auto_dataloader_fields_schema.execute(
+        """
+        {
+            fruits { name visibleEaters { name } }
+            eaters { name favouriteFruit { name } }
+        }
+        """,
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data == {
+        "fruits": [
+            {"name": "strawberry", "visibleEaters": [{"name": "pepa"}]},
+            {"name": "raspberry", "visibleEaters": []},
+            {"name": "banana", "visibleEaters": []},
+        ],
+        "eaters": [{"name": "pepa", "favouriteFruit": None}, {"name": "josef", "favouriteFruit": None}],
+    }
+    assert len(executed_queries) == 4
+    assert all("NOT" in query for query in executed_queries[2:])
@@ -0,0 +1,67 @@
+import logging
+
+import pytest
+
+from strawberry_django_dataloaders import exceptions, query_guard
+from strawberry_django_dataloaders.pytest_plugin import QueryGuard
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests.graphql import schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def guard() -> QueryGuard:
+    """Collects the reports without failing the test (unlike the `query_guard` fixture)."""
+    guard = QueryGuard()
+    query_guard.register_report_handler(guard)
+    yield guard
+    query_guard.unregister_report_handler(guard)
+
+
+async def execute(query: str):
+    # a context per operation, some tests execute several of them
+    return await schemas.query_guard_schema.execute(query, context_value=DataloaderContext(request=None, response=None))
+
+
+async def test_batched_queries(db_data, query_guard):
+    resp = await execute("query Fruits { fruits { name eaters { name } color { name } } }")
+    assert not resp.errors
+    [report] = query_guard.reports
+    assert report.operation_name == "Fruits"
+    assert [query.path for query in report.unbatched_queries] == ["fruits"]
+    assert {query.path: query.loader.model for query in report.queries if query.loader is not None} == {
+        "fruits.eaters": db_data.eaters[0].__class__,
+        "fruits.color": db_data.colors[0].__class__,
+    }
+    assert not report.has_violations()
+
+
+async def test_repeated_unbatched_queries(db_data, guard, caplog, settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"QUERY_GUARD_REPEAT_THRESHOLD": 2}
+    with caplog.at_level(logging.WARNING, logger="strawberry_django_dataloaders"):
+        resp = await execute("{ eaters { name favouriteFruit { pk } } }")
+    assert not resp.errors
+    [report] = guard.reports
+    [repeated] = report.repeated_queries
+    assert repeated.count == 2
+    assert repeated.paths == ["eaters.favouriteFruit"]
+    assert "N+1: 2x by eaters.favouriteFruit" in caplog.text
+
+
+async def test_query_budget(db_data, guard, settings):
+    settings.STRAWBERRY_DJANGO_DATALOADERS = {"QUERY_BUDGET": 2, "QUERY_GUARD_STRICT": True}
+    assert not (await execute("{ fruits { name color { name } } }")).errors
+    with pytest.raises(exceptions.QueryGuardError, match="query budget of 2 queries exceeded"):
+        await execute("{ fruits { name eaters { name } color { name } } }")
+    assert [report.budget_exceeded for report in guard.reports] == [False, True]
+
+
+async def test_query_guard_fixture_overrides(db_data, guard):
+    await execute("{ fruits { name eaters { name } } }")
+    assert not guard.get_violations()
+    guard.max_queries = 1
+    assert guard.get_violations() == guard.reports
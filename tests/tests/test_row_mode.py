@@ -0,0 +1,62 @@
+import pickle
+
+import pytest
+
+from strawberry_django_dataloaders.rows import ModelRow
+from tests import models
+from tests.graphql import dataloaders, schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+class ColorRowsPKDataLoader(dataloaders.ColorPKDataLoader):
+    row_mode = True
+
+
+class FruitEatersRowsReverseFKDataLoader(dataloaders.FruitEatersReverseFKDataLoader):
+    row_mode = True
+
+
+class FruitVarietiesRowsM2MDataLoader(dataloaders.FruitVarietiesM2MDataLoader):
+    row_mode = True
+
+
+async def test_pk_rows(db_data, context):
+    color = db_data.colors[0]
+    row = await ColorRowsPKDataLoader(context=context).load(color.pk)
+
+    assert isinstance(row, ModelRow)
+    assert (row.pk, row.id, row.name, row.description) == (color.pk, color.pk, color.name, color.description)
+    assert row == color
+    assert isinstance(row, models.Color)
+    assert row._meta is models.Color._meta
+    assert pickle.loads(pickle.dumps(row)).__dict__ == row.__dict__
+
+
+async def test_related_rows_with_projection(db_data, context, executed_queries):
+    eaters = await FruitEatersRowsReverseFKDataLoader(context=context).load(db_data.fruits[0].pk, only=["name"])
+    varieties = await FruitVarietiesRowsM2MDataLoader(context=context).load(db_data.fruits[1].pk)
+
+    assert [eater.__dict__ for eater in eaters] == [
+        {"id": eater.pk, "name": eater.name, "favourite_fruit_id": db_data.fruits[0].pk} for eater in db_data.eaters
+    ]
+    assert [variety.name for variety in varieties] == ["wild"]
+    assert '"description"' not in executed_queries[0]
+
+
+async def test_row_mode_auto_fields(db_data, context, executed_queries):
+    resp = await schemas.row_mode_auto_dataloader_fields_schema.execute(
+        "{ fruits { name color { name } eaters { name } varieties { name description } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data["fruits"][0] == {
+        "name": "strawberry",
+        "color": {"name": "red"},
+        "eaters": [{"name": "pepa"}, {"name": "josef"}],
+        "varieties": [{"name": "garden", "description": ""}, {"name": "wild", "description": ""}],
+    }
+    assert len(executed_queries) == 4
@@ -0,0 +1,110 @@
+import pytest
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+
+from strawberry_django_dataloaders import shared_cache
+from strawberry_django_dataloaders.views import DataloaderContext
+from tests import models
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    shared_cache.SharedModelCache.stats.clear()
+    yield
+    cache.clear()
+
+
+async def load_colors(pks: list[int]) -> list[models.Color | None]:
+    """Load colors in a new request context."""
+    # a context per call - the shared cache is used across requests, unlike the dataloader cache of a context
+    loader = dataloaders.ColorSharedCachePKDataLoader(context=DataloaderContext(request=None, response=None))
+    return await loader.load_many(pks)
+
+
+async def test_cached_across_requests(db_data, executed_queries):
+    pks = [color.pk for color in db_data.colors]
+    assert await load_colors(pks) == db_data.colors
+    assert len(executed_queries) == 1
+
+    executed_queries.clear()
+    assert await load_colors(pks) == db_data.colors
+    assert executed_queries == []
+    stats = shared_cache.get_shared_cache_stats(models.Color)
+    assert (stats.hits, stats.misses) == (3, 3)
+
+
+async def test_only_missing_keys_fetched(db_data, executed_queries):
+    await load_colors([db_data.colors[0].pk])
+    executed_queries.clear()
+    assert await load_colors([color.pk for color in db_data.colors] + [0]) == db_data.colors + [None]
+    assert len(executed_queries) == 1
+    assert shared_cache.get_shared_cache_stats(models.Color).hits == 1
+
+
+async def test_invalidated_on_save_and_delete(db_data, executed_queries):
+    color = db_data.colors[0]
+    await load_colors([color.pk])
+
+    color.name = "purple"
+    await sync_to_async(color.save)()
+    assert (await load_colors([color.pk]))[0].name == "purple"
+
+    await sync_to_async(color.delete)()
+    assert await load_colors([color.pk]) == [None]
+
+
+async def test_invalidated_on_m2m_change(db_data, context):
+    fruit, variety = db_data.fruits[2], db_data.varieties[0]
+    loader_cls = dataloaders.FruitVarietySharedCachePKDataLoader
+    await loader_cls(context=context).load(variety.pk)
+    assert loader_cls.get_shared_cache().get_many([variety.pk]) == {variety.pk: variety}
+
+    await sync_to_async(fruit.varieties.add)(variety)
+    assert loader_cls.get_shared_cache().get_many([variety.pk]) == {}
+
+
+async def test_invalidate_model(db_data):
+    pks = [color.pk for color in db_data.colors]
+    await load_colors(pks)
+    await sync_to_async(models.Color.objects.update)(name="grey")
+    await sync_to_async(shared_cache.invalidate_model)(models.Color)
+    assert [color.name for color in await load_colors(pks)] == ["grey"] * 3
+
+
+async def test_max_entries(db_data, monkeypatch):
+    monkeypatch.setattr(dataloaders.ColorSharedCachePKDataLoader, "shared_cache_max_entries", 2)
+    pks = [color.pk for color in db_data.colors]
+    await load_colors(pks)
+    # only the oldest instance was evicted
+    shared = dataloaders.ColorSharedCachePKDataLoader.get_shared_cache()
+    assert shared.get_many(pks) == {pks[1]: db_data.colors[1], pks[2]: db_data.colors[2]}
+
+    await load_colors([pks[0]])
+    assert shared.get_many(pks) == {pks[0]: db_data.colors[0], pks[2]: db_data.colors[2]}
+
+
+async def test_registered_at_class_definition():
+    assert {models.Color, models.FruitVariety} <= shared_cache.SharedModelCache.registered_models
+
+
+async def test_invalidated_on_commit(db_data):
+    color = db_data.colors[0]
+    loader_cls = dataloaders.ColorSharedCachePKDataLoader
+
+    def save_in_transaction():
+        with transaction.atomic():
+            color.name = "purple"
+            color.save()
+            # a concurrent request caches the old row before the write is committed
+            loader_cls.get_shared_cache().set_many({color.pk: models.Color.objects.get(pk=color.pk)})
+        return loader_cls.get_shared_cache().get_many([color.pk])
+
+    assert await sync_to_async(save_in_transaction)() == {}
@@ -0,0 +1,68 @@
+import pytest
+
+from strawberry_django_dataloaders import factories
+from tests import models
+from tests.graphql import dataloaders
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+class StreamingFruitEatersDataLoader(dataloaders.FruitEatersReverseFKDataLoader):
+    streaming = True
+    order_by = ("-name",)
+
+
+async def test_stream_groups(db_data):
+    fruit_keys = [fruit.pk for fruit in db_data.fruits]
+    groups = [
+        (key, instances) async for key, instances in StreamingFruitEatersDataLoader.stream(fruit_keys, chunk_size=1)
+    ]
+    # 'parents' with related instances first, each group ordered by `order_by`
+    assert groups == [(fruit_keys[0], [db_data.eaters[0], db_data.eaters[1]]), (fruit_keys[1], []), (fruit_keys[2], [])]
+
+
+async def test_stream_of_large_result(large_db_data, executed_queries):
+    fruits = large_db_data.fruits[:1000]
+    streamed = {
+        key: instances async for key, instances in StreamingFruitEatersDataLoader.stream([f.pk for f in fruits])
+    }
+    assert streamed == {fruit.pk: [eater] for fruit, eater in zip(fruits, large_db_data.eaters)}
+    # the keys are split by the query parameters limit of SQLite
+    assert len(executed_queries) == 2
+
+
+async def test_stream_closed_early(large_db_data):
+    async for key, instances in StreamingFruitEatersDataLoader.stream([fruit.pk for fruit in large_db_data.fruits]):
+        assert instances == [large_db_data.eaters[0]]
+        break
+
+
+async def test_streaming_dataloader(db_data, context, executed_queries):
+    loader = StreamingFruitEatersDataLoader(context=context)
+    fruit_keys = [fruit.pk for fruit in db_data.fruits]
+    result = await loader.load_many([*fruit_keys, fruit_keys[0]])
+    assert result == [[db_data.eaters[0], db_data.eaters[1]], [], [], [db_data.eaters[0], db_data.eaters[1]]]
+    eaters = await loader.load(fruit_keys[0], only=["name"])
+    assert [eater.get_deferred_fields() for eater in eaters] == [{"description", "favourite_color_id"}] * 2
+    assert len(executed_queries) == 2
+    assert not loader.cache
+
+
+async def test_streaming_dataloader_select_related(db_data, context, executed_queries):
+    loader = StreamingFruitEatersDataLoader(context=context)
+    fruit_loader_class = factories.PKDataLoaderFactory.get_loader_class(models.Fruit)
+    fruit = db_data.fruits[0]
+
+    eaters = await loader.load(fruit.pk, select_related={"favourite_fruit": fruit_loader_class})
+    assert await fruit_loader_class(context=context).load(fruit.pk) == fruit
+    assert [eater.favourite_fruit for eater in eaters] == [fruit, fruit]
+    assert len(executed_queries) == 1
+    assert "JOIN" in executed_queries[0]
+
+    # the joined relations of the previous batch aren't used by the next one
+    await loader.load(db_data.fruits[1].pk)
+    assert len(executed_queries) == 2
+    assert "JOIN" not in executed_queries[1]
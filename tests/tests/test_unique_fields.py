@@ -0,0 +1,64 @@
+import pytest
+
+from strawberry_django_dataloaders import factories
+from tests import models
+from tests.graphql import schemas
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.django_db(transaction=True),
+]
+
+
+@pytest.fixture
+def color_fans_data(db_data):
+    for color in db_data.colors:
+        color.code = color.name.upper()
+        color.save()
+    eaters = db_data.eaters
+    eaters[0].favourite_color = db_data.colors[1]
+    eaters[0].save()
+    eaters[1].favourite_color = db_data.colors[2]
+    eaters[1].save()
+    return db_data
+
+
+async def test_to_field_loader(color_fans_data, context, executed_queries):
+    loader = factories.UniqueFieldDataLoaderFactory.get_loader_class(models.Color, field="code")(context=context)
+
+    colors = await loader.load_many(["ORANGE", "YELLOW", "BLUE"])
+
+    assert colors == [color_fans_data.colors[2], color_fans_data.colors[1], None]
+    assert len(executed_queries) == 1
+    assert '"tests_color"."code" IN' in executed_queries[0]
+
+
+async def test_get_to_one_loader_class():
+    loader, key_attname = factories.get_to_one_loader_class(models.FruitEater._meta.get_field("favourite_color"))
+    assert (loader.model, loader.field, key_attname) == (models.Color, "code", "favourite_color_id")
+
+    loader, key_attname = factories.get_to_one_loader_class(models.FruitPlant._meta.get_field("fruit"))
+    assert (loader.model, loader.field, key_attname) == (models.Fruit, "plant_id", "id")
+
+    loader, key_attname = factories.get_to_one_loader_class(models.Fruit._meta.get_field("plant"))
+    assert loader is factories.PKDataLoaderFactory.get_loader_class(models.FruitPlant)
+    assert key_attname == "plant_id"
+
+
+async def test_auto_dataloader_fields(color_fans_data, context, executed_queries):
+    resp = await schemas.unique_field_auto_dataloader_fields_schema.execute(
+        "{ plants { name fruit { name } } eaters { name favouriteColor { name } } }",
+        context_value=context,
+    )
+    assert not resp.errors
+    assert resp.data == {
+        "plants": [
+            {"name": "strawberry plant", "fruit": {"name": "strawberry"}},
+            {"name": "raspberry plant", "fruit": {"name": "raspberry"}},
+        ],
+        "eaters": [
+            {"name": "pepa", "favouriteColor": {"name": "yellow"}},
+            {"name": "josef", "favouriteColor": {"name": "orange"}},
+        ],
+    }
+    assert len(executed_queries) == 4